@@ -520,11 +520,14 @@ async def summary_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         await update.message.reply_text(msg("not_linked", lang))
         return
 
-    # Get employee data
-    employee = await _odoo_service.get_employee_by_id(employee_id)
-    attendance = await _odoo_service.get_attendance_summary(employee_id)
-    tasks = await _odoo_service.get_employee_tasks(employee_id)
-    leave_balance = await _odoo_service.get_leave_balance(employee_id)
+    # Get employee data (only the parts the summary uses, fetched concurrently)
+    dashboard = await _odoo_service.get_dashboard(
+        employee_id, parts=["employee", "attendance", "tasks", "leave_balance"]
+    )
+    employee = dashboard["employee"]
+    attendance = dashboard["attendance"]
+    tasks = dashboard["tasks"]
+    leave_balance = dashboard["leave_balance"]
 
     # Prepare data for summary
     employee_data = {
@@ -1,5 +1,5 @@
 import asyncio
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
 from loguru import logger
 from telegram.ext import Application
@@ -8,6 +8,7 @@ from app.config import get_settings
 from app.handlers import setup_handlers
 from app.services import OdooService, GeminiService
 from app.mcp import create_odoo_mcp_server
+from app.utils import otp_manager
 
 settings = get_settings()
 
@@ -62,13 +63,20 @@ async def lifespan(app: FastAPI):
     asyncio.create_task(telegram_app.updater.start_polling(drop_pending_updates=True))
     logger.info("Telegram bot started")
 
+    # Sweep expired OTP sessions in the background
+    app.state.otp_cleanup = asyncio.create_task(otp_manager.start_background_cleanup())
+
     yield
 
     # Shutdown
     logger.info("Shutting down...")
+    app.state.otp_cleanup.cancel()
+    with suppress(asyncio.CancelledError):
+        await app.state.otp_cleanup
     await telegram_app.updater.stop()
     await telegram_app.stop()
     await telegram_app.shutdown()
+    await odoo_service.close()
 
 
 app = FastAPI(
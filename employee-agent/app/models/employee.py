@@ -45,6 +45,15 @@ class LeaveRequest(BaseModel):
     reason: Optional[str] = None
 
 
+class LeaveRequestCreate(BaseModel):
+    """New leave request to submit to Odoo"""
+    employee_id: int
+    leave_type_id: int
+    date_from: str
+    date_to: str
+    reason: str = ""
+
+
 class PayslipSummary(BaseModel):
     """Payslip summary"""
     id: int
@@ -72,7 +72,7 @@ async def send_otp_email(
         """
 
         # Create mail using Odoo's mail.mail model
-        mail_id = odoo_service._execute(
+        mail_id = await odoo_service._execute(
             "mail.mail",
             "create",
             [{
@@ -90,15 +90,7 @@ async def send_otp_email(
                 mail_id = mail_id[0]
 
             # Send the email immediately using proper Odoo 18 syntax
-            odoo_service.models.execute_kw(
-                odoo_service.db,
-                odoo_service.uid,
-                odoo_service.password,
-                "mail.mail",
-                "send",
-                [[mail_id]],
-                {}
-            )
+            await odoo_service._execute("mail.mail", "send", [mail_id])
             logger.info(f"OTP email sent successfully to {employee_email}")
             return True
 
@@ -11,8 +11,10 @@ It replaces the direct Gemini API integration with full LangChain support includ
 
 import re
 import json
-from typing import Dict, List, Optional, Any, TYPE_CHECKING
+import string
+from typing import Dict, List, Optional, Any, Tuple, TYPE_CHECKING
 from datetime import datetime
+import orjson
 from loguru import logger
 
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -21,7 +23,11 @@ from langchain.memory import ConversationBufferWindowMemory
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.tools import tool, StructuredTool
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
-from pydantic import BaseModel, Field
+from langchain_core.runnables import RunnableConfig
+from langchain_core.callbacks import AsyncCallbackHandler
+from pydantic import BaseModel, Field, TypeAdapter
+
+from app.services.odoo_service import EMPLOYEE_BUNDLE_PARTS, odoo_request_scope
 
 if TYPE_CHECKING:
     from app.services.odoo_service import OdooService
@@ -62,7 +68,7 @@ class PayslipItem(BaseModel):
     """Single payslip item"""
     id: int = Field(description="Payslip ID")
     name: str = Field(description="Payslip name")
-    period: str = Field(description="Pay period")
+    period: Tuple[str, str] = Field(description="Pay period (start date, end date)")
     state: str = Field(description="Payslip state")
     net_wage: float = Field(description="Net wage amount")
     gross_wage: float = Field(description="Gross wage amount")
@@ -78,21 +84,105 @@ class TaskItem(BaseModel):
     stage: Optional[str] = Field(description="Current stage")
 
 
-# ==================== Global Service Reference ====================
-# This will be set by the LangChainEmployeeAgent when initializing tools
-_odoo_service: Optional["OdooService"] = None
-
-
-def _set_odoo_service(service: "OdooService") -> None:
-    """Set the global Odoo service reference for tools"""
-    global _odoo_service
-    _odoo_service = service
+# ==================== Tool Result Builders ====================
+
+def _dumps(payload: Any) -> str:
+    """Serialize a tool result with orjson so the agent passes it to the LLM as-is"""
+    return orjson.dumps(payload).decode()
+
+# Shared by the single-purpose tools and batch_get_employee_context.
+# Items come from our own Odoo reads, so model_construct skips validation and
+# the precompiled adapters turn them into plain dicts in one pass.
+
+_EMPLOYEE_ADAPTER = TypeAdapter(EmployeeInfo)
+_LEAVE_BALANCE_ADAPTER = TypeAdapter(List[LeaveBalanceItem])
+_LEAVE_REQUEST_ADAPTER = TypeAdapter(List[LeaveRequestItem])
+_PAYSLIP_ADAPTER = TypeAdapter(List[PayslipItem])
+_TASK_ADAPTER = TypeAdapter(List[TaskItem])
+
+
+def _employee_payload(employee: Any) -> Dict[str, Any]:
+    """Build the tool payload for an Employee"""
+    return _EMPLOYEE_ADAPTER.dump_python(
+        EmployeeInfo.model_construct(
+            id=employee.id,
+            name=employee.name,
+            email=employee.email,
+            job_title=employee.job_title,
+            department=employee.department,
+            manager=employee.manager_name,
+        ),
+        mode="python",
+    )
+
+
+def _balances_payload(balances: List[Any]) -> List[Dict[str, Any]]:
+    """Build the tool payload for a list of LeaveBalance"""
+    items = [
+        LeaveBalanceItem.model_construct(
+            leave_type=b.leave_type,
+            allocated=b.allocated,
+            taken=b.taken,
+            remaining=b.remaining,
+        )
+        for b in balances
+    ]
+    return _LEAVE_BALANCE_ADAPTER.dump_python(items, mode="python")
+
+
+def _leave_requests_payload(requests: List[Any]) -> List[Dict[str, Any]]:
+    """Build the tool payload for a list of LeaveRequest"""
+    items = [
+        LeaveRequestItem.model_construct(
+            id=r.id,
+            leave_type=r.leave_type,
+            date_from=r.date_from,
+            date_to=r.date_to,
+            days=r.number_of_days,
+            state=r.state,
+            reason=r.reason,
+        )
+        for r in requests
+    ]
+    return _LEAVE_REQUEST_ADAPTER.dump_python(items, mode="python")
+
+
+def _payslips_payload(payslips: List[Any]) -> List[Dict[str, Any]]:
+    """Build the tool payload for a list of PayslipSummary"""
+    items = [
+        PayslipItem.model_construct(
+            id=p.id,
+            name=p.name,
+            period=(p.date_from, p.date_to),
+            state=p.state,
+            net_wage=p.net_wage,
+            gross_wage=p.gross_wage,
+        )
+        for p in payslips
+    ]
+    return _PAYSLIP_ADAPTER.dump_python(items, mode="python")
+
+
+def _tasks_payload(tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Build the tool payload for raw project.task records (Odoo uses False for empty fields)"""
+    items = [
+        TaskItem.model_construct(
+            id=t.get("id"),
+            name=t.get("name"),
+            description=t.get("description") or None,
+            deadline=t.get("date_deadline") or None,
+            priority=t.get("priority") or None,
+            stage=t["stage_id"][1] if t.get("stage_id") else None,
+        )
+        for t in tasks
+    ]
+    return _TASK_ADAPTER.dump_python(items, mode="python")
 
 
 # ==================== LangChain Tools ====================
 
 @tool
-async def get_employee_info(employee_id: int) -> Dict[str, Any]:
+async def get_employee_info(employee_id: int, config: RunnableConfig) -> str:
     """
     Get detailed information about an employee including name, email, department, job title, and manager.
 
@@ -100,33 +190,21 @@ async def get_employee_info(employee_id: int) -> Dict[str, Any]:
         employee_id: The Odoo employee ID
 
     Returns:
-        Dictionary with employee details or error message
+        JSON object with employee details or error message
     """
-    if not _odoo_service:
-        return {"error": "Odoo service not configured"}
-
     try:
-        employee = await _odoo_service.get_employee_by_id(employee_id)
+        odoo = config["configurable"]["odoo"]
+        employee = await odoo.get_employee_by_id(employee_id)
         if employee:
-            return {
-                "success": True,
-                "employee": {
-                    "id": employee.id,
-                    "name": employee.name,
-                    "email": employee.email,
-                    "job_title": employee.job_title,
-                    "department": employee.department,
-                    "manager": employee.manager_name,
-                }
-            }
-        return {"success": False, "error": "Employee not found"}
+            return _dumps({"success": True, "employee": _employee_payload(employee)})
+        return _dumps({"success": False, "error": "Employee not found"})
     except Exception as e:
         logger.error(f"Error in get_employee_info: {e}")
-        return {"error": str(e)}
+        return _dumps({"error": str(e)})
 
 
 @tool
-async def get_leave_balance(employee_id: int) -> Dict[str, Any]:
+async def get_leave_balance(employee_id: int, config: RunnableConfig) -> str:
     """
     Get the leave balance for an employee showing all leave types with allocated, taken, and remaining days.
 
@@ -134,32 +212,24 @@ async def get_leave_balance(employee_id: int) -> Dict[str, Any]:
         employee_id: The Odoo employee ID
 
     Returns:
-        Dictionary with leave balances for all leave types
+        JSON object with leave balances for all leave types
     """
-    if not _odoo_service:
-        return {"error": "Odoo service not configured"}
-
     try:
-        balances = await _odoo_service.get_leave_balance(employee_id)
-        return {
+        odoo = config["configurable"]["odoo"]
+        balances = await odoo.get_leave_balance(employee_id)
+        return _dumps({
             "success": True,
-            "balances": [
-                {
-                    "leave_type": b.leave_type,
-                    "allocated": b.allocated,
-                    "taken": b.taken,
-                    "remaining": b.remaining,
-                }
-                for b in balances
-            ]
-        }
+            "balances": _balances_payload(balances),
+        })
     except Exception as e:
         logger.error(f"Error in get_leave_balance: {e}")
-        return {"error": str(e)}
+        return _dumps({"error": str(e)})
 
 
 @tool
-async def get_leave_requests(employee_id: int, state: Optional[str] = None) -> Dict[str, Any]:
+async def get_leave_requests(
+    employee_id: int, config: RunnableConfig, state: Optional[str] = None
+) -> str:
     """
     Get leave requests for an employee, optionally filtered by state.
 
@@ -168,35 +238,22 @@ async def get_leave_requests(employee_id: int, state: Optional[str] = None) -> D
         state: Optional filter by state (draft, confirm, validate, refuse)
 
     Returns:
-        Dictionary with list of leave requests
+        JSON object with list of leave requests
     """
-    if not _odoo_service:
-        return {"error": "Odoo service not configured"}
-
     try:
-        requests = await _odoo_service.get_leave_requests(employee_id, state)
-        return {
+        odoo = config["configurable"]["odoo"]
+        requests = await odoo.get_leave_requests(employee_id, state)
+        return _dumps({
             "success": True,
-            "requests": [
-                {
-                    "id": r.id,
-                    "leave_type": r.leave_type,
-                    "date_from": r.date_from,
-                    "date_to": r.date_to,
-                    "days": r.number_of_days,
-                    "state": r.state,
-                    "reason": r.reason,
-                }
-                for r in requests
-            ]
-        }
+            "requests": _leave_requests_payload(requests),
+        })
     except Exception as e:
         logger.error(f"Error in get_leave_requests: {e}")
-        return {"error": str(e)}
+        return _dumps({"error": str(e)})
 
 
 @tool
-async def get_payslips(employee_id: int, limit: int = 6) -> Dict[str, Any]:
+async def get_payslips(employee_id: int, config: RunnableConfig, limit: int = 6) -> str:
     """
     Get recent payslips for an employee with net and gross wages.
 
@@ -205,38 +262,27 @@ async def get_payslips(employee_id: int, limit: int = 6) -> Dict[str, Any]:
         limit: Maximum number of payslips to return (default 6)
 
     Returns:
-        Dictionary with list of payslips
+        JSON object with list of payslips
     """
-    if not _odoo_service:
-        return {"error": "Odoo service not configured"}
-
     try:
-        payslips = await _odoo_service.get_payslips(employee_id, limit)
-        return {
+        odoo = config["configurable"]["odoo"]
+        payslips = await odoo.get_payslips(employee_id, limit)
+        return _dumps({
             "success": True,
-            "payslips": [
-                {
-                    "id": p.id,
-                    "name": p.name,
-                    "period": f"{p.date_from} to {p.date_to}",
-                    "state": p.state,
-                    "net_wage": p.net_wage,
-                    "gross_wage": p.gross_wage,
-                }
-                for p in payslips
-            ]
-        }
+            "payslips": _payslips_payload(payslips),
+        })
     except Exception as e:
         logger.error(f"Error in get_payslips: {e}")
-        return {"error": str(e)}
+        return _dumps({"error": str(e)})
 
 
 @tool
 async def get_attendance_summary(
     employee_id: int,
+    config: RunnableConfig,
     month: Optional[int] = None,
     year: Optional[int] = None
-) -> Dict[str, Any]:
+) -> str:
     """
     Get attendance summary for an employee for a specific month including total days and hours worked.
 
@@ -246,14 +292,12 @@ async def get_attendance_summary(
         year: Year, defaults to current year
 
     Returns:
-        Dictionary with attendance summary
+        JSON object with attendance summary
     """
-    if not _odoo_service:
-        return {"error": "Odoo service not configured"}
-
     try:
-        summary = await _odoo_service.get_attendance_summary(employee_id, month, year)
-        return {
+        odoo = config["configurable"]["odoo"]
+        summary = await odoo.get_attendance_summary(employee_id, month, year)
+        return _dumps({
             "success": True,
             "summary": {
                 "month": summary.get("month"),
@@ -261,54 +305,45 @@ async def get_attendance_summary(
                 "total_days": summary.get("total_days", 0),
                 "total_hours": summary.get("total_hours", 0),
             }
-        }
+        })
     except Exception as e:
         logger.error(f"Error in get_attendance_summary: {e}")
-        return {"error": str(e)}
+        return _dumps({"error": str(e)})
 
 
 @tool
-async def get_employee_tasks(employee_id: int) -> Dict[str, Any]:
+async def get_employee_tasks(employee_id: int, config: RunnableConfig) -> str:
     """
     Get tasks assigned to an employee with deadlines and status.
+    Also reports tasks recently queued by create_task and whether they were created.
 
     Args:
         employee_id: The Odoo employee ID
 
     Returns:
-        Dictionary with list of tasks
+        JSON object with list of tasks
     """
-    if not _odoo_service:
-        return {"error": "Odoo service not configured"}
-
     try:
-        tasks = await _odoo_service.get_employee_tasks(employee_id)
-        return {
-            "success": True,
-            "tasks": [
-                {
-                    "id": t.get("id"),
-                    "name": t.get("name"),
-                    "description": t.get("description"),
-                    "deadline": t.get("date_deadline"),
-                    "priority": t.get("priority"),
-                    "stage": t.get("stage_id", [None, ""])[1] if t.get("stage_id") else None,
-                }
-                for t in tasks
-            ]
-        }
+        odoo = config["configurable"]["odoo"]
+        tasks = await odoo.get_employee_tasks(employee_id)
+        result = {"success": True, "tasks": _tasks_payload(tasks)}
+        queued = odoo.pop_pending_tasks(employee_id)
+        if queued:
+            result["queued_tasks"] = queued
+        return _dumps(result)
     except Exception as e:
         logger.error(f"Error in get_employee_tasks: {e}")
-        return {"error": str(e)}
+        return _dumps({"error": str(e)})
 
 
 @tool
 async def create_task(
     employee_id: int,
     name: str,
+    config: RunnableConfig,
     description: str = "",
     due_date: Optional[str] = None
-) -> Dict[str, Any]:
+) -> str:
     """
     Create a new task for an employee.
 
@@ -319,40 +354,35 @@ async def create_task(
         due_date: Due date in YYYY-MM-DD format (optional)
 
     Returns:
-        Dictionary with task creation result
+        JSON object with task creation result
     """
-    if not _odoo_service:
-        return {"error": "Odoo service not configured"}
-
     try:
-        task_id = await _odoo_service.create_task(
+        odoo = config["configurable"]["odoo"]
+        # Written to Odoo in the background; the real ID is reported by get_employee_tasks
+        pending_id = await odoo.enqueue_task(
             employee_id=employee_id,
             name=name,
             description=description,
             due_date=due_date,
         )
-        if task_id:
-            return {"success": True, "task_id": task_id, "message": f"Task '{name}' created successfully"}
-        return {"success": False, "error": "Failed to create task"}
+        return _dumps({"success": True, "task_id": pending_id, "message": f"Task '{name}' queued for creation"})
     except Exception as e:
         logger.error(f"Error in create_task: {e}")
-        return {"error": str(e)}
+        return _dumps({"error": str(e)})
 
 
 @tool
-async def get_company_policies() -> Dict[str, Any]:
+async def get_company_policies(config: RunnableConfig) -> str:
     """
     Get list of company policies and documents.
 
     Returns:
-        Dictionary with list of company policies
+        JSON object with list of company policies
     """
-    if not _odoo_service:
-        return {"error": "Odoo service not configured"}
-
     try:
-        policies = await _odoo_service.get_company_policies()
-        return {
+        odoo = config["configurable"]["odoo"]
+        policies = await odoo.get_company_policies()
+        return _dumps({
             "success": True,
             "policies": [
                 {
@@ -362,10 +392,43 @@ async def get_company_policies() -> Dict[str, Any]:
                 }
                 for p in policies
             ]
-        }
+        })
     except Exception as e:
         logger.error(f"Error in get_company_policies: {e}")
-        return {"error": str(e)}
+        return _dumps({"error": str(e)})
+
+
+@tool
+async def batch_get_employee_context(
+    employee_id: int,
+    config: RunnableConfig,
+    include: Optional[List[str]] = None,
+) -> str:
+    """
+    Get several aspects of an employee's profile in one call: employee info, leave balance and recent payslips.
+    Prefer this over calling get_employee_info, get_leave_balance and get_payslips separately.
+
+    Args:
+        employee_id: The Odoo employee ID
+        include: Parts to fetch, any of "info", "leave_balance", "payslips" (default all)
+
+    Returns:
+        JSON object with one key per requested part
+    """
+    try:
+        odoo = config["configurable"]["odoo"]
+        bundle = await odoo.get_employee_bundle(employee_id, include or list(EMPLOYEE_BUNDLE_PARTS))
+        result: Dict[str, Any] = {"success": True}
+        if "info" in bundle:
+            result["employee"] = _employee_payload(bundle["info"]) if bundle["info"] else None
+        if "leave_balance" in bundle:
+            result["balances"] = _balances_payload(bundle["leave_balance"] or [])
+        if "payslips" in bundle:
+            result["payslips"] = _payslips_payload(bundle["payslips"] or [])
+        return _dumps(result)
+    except Exception as e:
+        logger.error(f"Error in batch_get_employee_context: {e}")
+        return _dumps({"error": str(e)})
 
 
 # ==================== System Prompts ====================
@@ -388,7 +451,8 @@ Important rules:
 - If unsure, ask for clarification
 - Don't make up information that doesn't exist
 - Use the available tools to fetch real data from the system
-- When calling tools, always use the employee_id provided in the context"""
+- When calling tools, always use the employee_id provided in the context
+- If the user asks about multiple aspects of their profile in one question, prefer batch_get_employee_context"""
 
 SYSTEM_PROMPT_AR = """أنت "أيليجنت"، مساعد الموظفين الذكي للشركة. أنت تساعد الموظفين في:
 - الإجابة على أسئلة سياسات الشركة
@@ -408,7 +472,66 @@ SYSTEM_PROMPT_AR = """أنت "أيليجنت"، مساعد الموظفين ال
 - إذا لم تكن متأكداً، اطلب التوضيح
 - لا تخترع معلومات غير موجودة
 - استخدم الأدوات المتاحة للحصول على بيانات حقيقية من النظام
-- عند استدعاء الأدوات، استخدم دائماً رقم الموظف المقدم في السياق"""
+- عند استدعاء الأدوات، استخدم دائماً رقم الموظف المقدم في السياق
+- إذا سأل المستخدم عن عدة جوانب من ملفه في سؤال واحد، فاستخدم batch_get_employee_context"""
+
+
+
+def _split_prompt(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Parse a str.format template once into (literal, field_name) segments"""
+    return tuple(
+        (literal, field_name)
+        for literal, field_name, _spec, _conv in string.Formatter().parse(template)
+    )
+
+
+def _render_prompt(segments: Tuple[Tuple[str, Optional[str]], ...], values: Dict[str, Any]) -> str:
+    """Fill pre-split prompt segments without re-parsing the template"""
+    return "".join(
+        literal + (str(values[field_name]) if field_name is not None else "")
+        for literal, field_name in segments
+    )
+
+
+_SYSTEM_PROMPT_EN_SEGMENTS = _split_prompt(SYSTEM_PROMPT_EN)
+_SYSTEM_PROMPT_AR_SEGMENTS = _split_prompt(SYSTEM_PROMPT_AR)
+
+# ==================== Agent Budget ====================
+# Most questions need one tool call and one answer; anything that loops past
+# this budget is stopped and logged so the prompt can be fixed.
+AGENT_MAX_ITERATIONS = 3
+AGENT_MAX_EXECUTION_TIME = 15.0  # seconds
+
+# Fixed English output AgentExecutor returns when early_stopping_method="force" trips
+_AGENT_STOPPED_OUTPUT = "Agent stopped due to iteration limit or time limit."
+
+
+class _IterationBudgetCallback(AsyncCallbackHandler):
+    """Log agent turns that use up the whole iteration budget"""
+
+    def __init__(self, user_id: int):
+        self.user_id = user_id
+        self.actions = 0
+
+    async def on_agent_action(self, action: Any, **kwargs: Any) -> None:
+        self.actions += 1
+        if self.actions >= AGENT_MAX_ITERATIONS:
+            logger.warning(
+                f"Agent reached {self.actions} tool calls for user {self.user_id} "
+                f"(last tool: {getattr(action, 'tool', '?')})"
+            )
+
+
+# ==================== Output Token Budgets ====================
+OUTPUT_BUDGET_SHORT = 256  # greetings, thanks (Arabic needs more tokens per word)
+OUTPUT_BUDGET_SUMMARY = 512  # daily summary
+OUTPUT_BUDGET_DEFAULT = 1024  # tool-calling agent turns, task extraction
+
+_SMALL_TALK_PATTERN = re.compile(
+    r"^\s*(hi|hello|hey|thanks|thank you|good (morning|afternoon|evening)|bye"
+    r"|مرحبا|مرحباً|اهلا|أهلا|السلام عليكم|شكرا|شكراً|صباح الخير|مساء الخير)[\s!.?،]*$",
+    re.IGNORECASE,
+)
 
 
 # ==================== LangChain Employee Agent ====================
@@ -419,7 +542,7 @@ class LangChainEmployeeAgent:
 
     Features:
     - Google Gemini LLM via langchain-google-genai
-    - 8 Odoo integration tools with @tool decorator
+    - 9 Odoo integration tools with @tool decorator
     - Per-user conversation memory with window buffer
     - Bilingual support (English/Arabic)
     - Tool-calling agent with automatic function execution
@@ -433,27 +556,30 @@ class LangChainEmployeeAgent:
             api_key: Google AI API key
             odoo_service: OdooService instance for tool calls
         """
+        self._api_key = api_key
+
+        # Agent LLMs keyed by max_output_tokens, created on first use
+        self._llm_by_budget: Dict[int, ChatGoogleGenerativeAI] = {}
+
         # Initialize LLM
-        self.llm = ChatGoogleGenerativeAI(
+        self.llm = self._get_llm(OUTPUT_BUDGET_DEFAULT)
+
+        # Simple LLM for non-tool responses
+        self.llm_simple = ChatGoogleGenerativeAI(
             model="gemini-2.0-flash",
             google_api_key=api_key,
             temperature=0.7,
-            max_output_tokens=1024,
-            convert_system_message_to_human=True,
+            max_output_tokens=OUTPUT_BUDGET_DEFAULT,
         )
-
-        # Simple LLM for non-tool responses
-        self.llm_simple = ChatGoogleGenerativeAI(
+        self.llm_summary = ChatGoogleGenerativeAI(
             model="gemini-2.0-flash",
             google_api_key=api_key,
             temperature=0.7,
-            max_output_tokens=1024,
+            max_output_tokens=OUTPUT_BUDGET_SUMMARY,
         )
 
-        # Set Odoo service for tools
+        # Odoo service handed to tools via RunnableConfig on each invocation
         self._odoo_service = odoo_service
-        if odoo_service:
-            _set_odoo_service(odoo_service)
 
         # Define tools list
         self._tools = [
@@ -465,6 +591,7 @@ class LangChainEmployeeAgent:
             get_employee_tasks,
             create_task,
             get_company_policies,
+            batch_get_employee_context,
         ]
 
         # Per-user memory storage
@@ -475,9 +602,26 @@ class LangChainEmployeeAgent:
     def set_odoo_service(self, odoo_service: "OdooService") -> None:
         """Set the Odoo service for tool calls"""
         self._odoo_service = odoo_service
-        _set_odoo_service(odoo_service)
         logger.info("LangChainEmployeeAgent updated with Odoo service")
 
+    def _get_llm(self, max_output_tokens: int) -> ChatGoogleGenerativeAI:
+        """Get or create the agent LLM for an output token budget"""
+        if max_output_tokens not in self._llm_by_budget:
+            self._llm_by_budget[max_output_tokens] = ChatGoogleGenerativeAI(
+                model="gemini-2.0-flash",
+                google_api_key=self._api_key,
+                temperature=0.7,
+                max_output_tokens=max_output_tokens,
+                convert_system_message_to_human=True,
+            )
+        return self._llm_by_budget[max_output_tokens]
+
+    def _output_budget(self, message: str) -> int:
+        """Pick max_output_tokens for a message: greetings and thanks get a short budget"""
+        if _SMALL_TALK_PATTERN.match(message):
+            return OUTPUT_BUDGET_SHORT
+        return OUTPUT_BUDGET_DEFAULT
+
     def _get_memory(self, user_id: int) -> ConversationBufferWindowMemory:
         """Get or create conversation memory for a user"""
         if user_id not in self._user_memories:
@@ -508,15 +652,16 @@ class LangChainEmployeeAgent:
         employee_id: int,
     ) -> ChatPromptTemplate:
         """Create the prompt template with system message and placeholders"""
-        system_template = SYSTEM_PROMPT_AR if language == "ar" else SYSTEM_PROMPT_EN
-        system_message = system_template.format(
-            employee_name=employee_name,
-            department=department,
-            employee_id=employee_id,
-        )
-
+        segments = _SYSTEM_PROMPT_AR_SEGMENTS if language == "ar" else _SYSTEM_PROMPT_EN_SEGMENTS
+        system_message = _render_prompt(segments, {
+            "employee_name": employee_name,
+            "department": department,
+            "employee_id": employee_id,
+        })
+
+        # A ready SystemMessage is not re-parsed as a template on every turn
         return ChatPromptTemplate.from_messages([
-            ("system", system_message),
+            SystemMessage(content=system_message),
             MessagesPlaceholder(variable_name="chat_history"),
             ("human", "{input}"),
             MessagesPlaceholder(variable_name="agent_scratchpad"),
@@ -556,7 +701,8 @@ class LangChainEmployeeAgent:
             prompt = self._get_prompt(language, employee_name, department, employee_id or 0)
 
             # Create the tool-calling agent
-            agent = create_tool_calling_agent(self.llm, self._tools, prompt)
+            llm = self._get_llm(self._output_budget(message))
+            agent = create_tool_calling_agent(llm, self._tools, prompt)
 
             # Create executor with memory
             executor = AgentExecutor(
@@ -564,7 +710,10 @@ class LangChainEmployeeAgent:
                 tools=self._tools,
                 memory=memory,
                 verbose=True,
-                max_iterations=5,
+                max_iterations=AGENT_MAX_ITERATIONS,
+                max_execution_time=AGENT_MAX_EXECUTION_TIME,
+                early_stopping_method="force",
+                return_intermediate_steps=False,
                 handle_parsing_errors=True,
             )
 
@@ -575,16 +724,31 @@ class LangChainEmployeeAgent:
                 input_message = message
 
             # Execute agent
-            result = await executor.ainvoke({"input": input_message})
-
-            return result.get("output", "I processed your request.")
+            # Tools in one turn share a read cache, so repeated lookups cost one RPC
+            with odoo_request_scope():
+                result = await executor.ainvoke(
+                    {"input": input_message},
+                    config={
+                        "configurable": {"odoo": self._odoo_service},
+                        "callbacks": [_IterationBudgetCallback(user_id)],
+                    },
+                )
+
+            output = result.get("output", "I processed your request.")
+            if output == _AGENT_STOPPED_OUTPUT:
+                logger.warning(f"Agent stopped on its iteration/time budget for user {user_id}")
+                return self._fallback_reply(language)
+            return output
 
         except Exception as e:
             logger.error(f"Error processing message for user {user_id}: {e}")
-            language = self._detect_language(message)
-            if language == "ar":
-                return "عذراً، حدث خطأ في معالجة طلبك. يرجى المحاولة مرة أخرى."
-            return "Sorry, an error occurred while processing your request. Please try again."
+            return self._fallback_reply(self._detect_language(message))
+
+    def _fallback_reply(self, language: str) -> str:
+        """Apology sent when a turn fails or is stopped before answering"""
+        if language == "ar":
+            return "عذراً، حدث خطأ في معالجة طلبك. يرجى المحاولة مرة أخرى."
+        return "Sorry, an error occurred while processing your request. Please try again."
 
     async def generate_daily_summary(
         self,
@@ -643,7 +807,7 @@ Leave balance: {employee_data.get('leave_balance', 'N/A')}
 
 Write the summary in a concise, professional manner. Use Telegram formatting."""
 
-            response = await self.llm_simple.ainvoke([HumanMessage(content=prompt)])
+            response = await self.llm_summary.ainvoke([HumanMessage(content=prompt)])
             return response.content
 
         except Exception as e:
@@ -1,20 +1,178 @@
-import xmlrpc.client
-from typing import Optional, List, Dict, Any
+import asyncio
+import itertools
+import json
+import time
+import uuid
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from typing import Optional, List, Dict, Any, Awaitable, Iterator, Tuple
 from datetime import datetime, date
+import httpx
+import orjson
 from loguru import logger
+from pydantic import TypeAdapter
 
+from app.utils.ttl_cache import AsyncTTLCache
 from app.models.employee import (
     Employee,
     EmployeeLink,
     LeaveBalance,
     LeaveRequest,
+    LeaveRequestCreate,
     PayslipSummary,
     Task,
 )
 
+# Seconds before an Odoo RPC is abandoned
+ODOO_TIMEOUT = 30.0
+
+# Seconds an idle pooled connection is kept open. httpx defaults to 5s, which
+# is shorter than the gap between chat turns and would force a new TCP/TLS
+# handshake for most calls.
+ODOO_KEEPALIVE_EXPIRY = 60.0
+
+# Cache lifetimes (seconds) for rarely-changing reads; entries closer than
+# CACHE_REFRESH_THRESHOLD to expiry are refreshed in the background
+EMPLOYEE_CACHE_TTL = 600
+POLICY_CACHE_TTL = 3600
+CACHE_REFRESH_THRESHOLD = 60
+
+# ir.config_parameter key holding the Telegram-Odoo link map
+TELEGRAM_LINKS_PARAM = "ailigent.telegram_links"
+
+# Parts accepted by OdooService.get_employee_bundle
+EMPLOYEE_BUNDLE_PARTS = ("info", "leave_balance", "payslips")
+
+# Most recent attendance records returned with a monthly summary
+ATTENDANCE_RECENT_LIMIT = 10
+
+# Write-behind queue for tasks created from chat
+TASK_QUEUE_MAXSIZE = 100
+TASK_WRITE_RETRIES = 3
+TASK_WRITE_BACKOFF = 0.5  # seconds, doubled after each failed attempt
+TASK_RESULT_TTL = 3600  # seconds a created/failed entry is kept for reporting
+TASK_QUEUE_DRAIN_TIMEOUT = 10.0  # seconds close() waits for queued writes
+
+# Errors raised before a request reached Odoo, so a create can be resent safely
+_UNSENT_REQUEST_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+# Field lists for Odoo reads, built once. orjson encodes tuples as arrays.
+_EMPLOYEE_FIELDS = ("id", "name", "work_email", "job_title", "department_id", "parent_id", "work_phone", "mobile_phone")
+_LEAVE_ALLOCATION_FIELDS = ("holiday_status_id", "number_of_days", "leaves_taken")
+_LEAVE_REQUEST_FIELDS = ("id", "holiday_status_id", "date_from", "date_to", "number_of_days", "state", "name")
+_PAYSLIP_FIELDS = ("id", "name", "date_from", "date_to", "state", "net_wage", "basic_wage")
+_ATTENDANCE_FIELDS = ("check_in", "check_out", "worked_hours")
+_ATTENDANCE_TOTAL_FIELDS = ("worked_hours:sum",)
+_TASK_FIELDS = ("id", "name", "description", "date_deadline", "priority", "stage_id")
+_POLICY_FIELDS = ("id", "name", "description", "create_date")
+_CONFIG_PARAM_FIELDS = ("id", "key", "value")
+
+# Side-effect-free ORM methods that may be memoized within a request scope
+_READ_METHODS = frozenset({"search", "read", "search_read", "search_count", "read_group"})
+
+# Per-request memo of read RPCs, active only inside odoo_request_scope()
+_request_cache: ContextVar[Optional[Dict[Tuple, "asyncio.Future"]]] = ContextVar(
+    "odoo_request_cache", default=None
+)
+
+
+@contextmanager
+def odoo_request_scope() -> Iterator[None]:
+    """
+    Deduplicate identical Odoo reads made within one request or agent turn.
+
+    Tasks started inside the scope (e.g. by asyncio.gather) inherit it.
+    """
+    token = _request_cache.set({})
+    try:
+        yield
+    finally:
+        _request_cache.reset(token)
+
+
+class OdooRPCError(Exception):
+    """Error returned by Odoo in a JSON-RPC response"""
+
+    def __init__(self, error: Dict[str, Any]):
+        data = error.get("data") or {}
+        super().__init__(data.get("message") or error.get("message") or "Odoo RPC error")
+        self.code = error.get("code")
+        self.name = data.get("name")
+        self.debug = data.get("debug")
+
+
+def _as_id_list(ids: Any) -> List[int]:
+    """Normalise a create() result: Odoo returns a list for list input, an int on older versions"""
+    return ids if isinstance(ids, list) else [ids]
+
+
+def _parse_telegram_links(value: Optional[str]) -> Dict[int, Dict[str, Any]]:
+    """Decode the stored JSON link map, keyed by Telegram ID"""
+    return {int(telegram_id): link for telegram_id, link in json.loads(value or "{}").items()}
+
+
+def _employee_values(emp: Dict[str, Any]) -> Dict[str, Any]:
+    """Map an hr.employee record onto Employee fields"""
+    return {
+        "id": emp["id"],
+        "name": emp["name"],
+        "email": emp.get("work_email") or None,
+        "job_title": emp.get("job_title") or None,
+        "department": emp["department_id"][1] if emp.get("department_id") else None,
+        "manager_name": emp["parent_id"][1] if emp.get("parent_id") else None,
+        "work_phone": emp.get("work_phone") or None,
+        "mobile_phone": emp.get("mobile_phone") or None,
+    }
+
+
+def _leave_balance_values(alloc: Dict[str, Any]) -> Dict[str, Any]:
+    """Map an hr.leave.allocation record onto LeaveBalance fields"""
+    allocated = alloc.get("number_of_days", 0)
+    taken = alloc.get("leaves_taken", 0)
+    return {
+        "leave_type": alloc["holiday_status_id"][1] if alloc.get("holiday_status_id") else "Unknown",
+        "allocated": allocated,
+        "taken": taken,
+        "remaining": allocated - taken,
+    }
+
+
+def _leave_request_values(leave: Dict[str, Any]) -> Dict[str, Any]:
+    """Map an hr.leave record onto LeaveRequest fields"""
+    return {
+        "id": leave["id"],
+        "leave_type": leave["holiday_status_id"][1] if leave.get("holiday_status_id") else "Unknown",
+        "date_from": str(leave.get("date_from", "")),
+        "date_to": str(leave.get("date_to", "")),
+        "number_of_days": leave.get("number_of_days", 0),
+        "state": leave.get("state", ""),
+        "reason": leave.get("name") or None,
+    }
+
+
+def _payslip_values(ps: Dict[str, Any]) -> Dict[str, Any]:
+    """Map an hr.payslip record onto PayslipSummary fields"""
+    return {
+        "id": ps["id"],
+        "name": ps.get("name", ""),
+        "date_from": str(ps.get("date_from", "")),
+        "date_to": str(ps.get("date_to", "")),
+        "state": ps.get("state", ""),
+        "net_wage": ps.get("net_wage", 0),
+        "gross_wage": ps.get("basic_wage", 0),
+    }
+
+
+# List validators: pydantic-core builds a whole result set in one call
+# instead of one model __init__ per row
+_LEAVE_BALANCE_LIST = TypeAdapter(List[LeaveBalance])
+_LEAVE_REQUEST_LIST = TypeAdapter(List[LeaveRequest])
+_PAYSLIP_LIST = TypeAdapter(List[PayslipSummary])
+
 
 class OdooService:
-    """Service for interacting with Odoo ERP via XML-RPC"""
+    """Service for interacting with Odoo ERP via JSON-RPC"""
 
     def __init__(self, url: str, db: str, username: str, password: str):
         self.url = url.rstrip("/")
@@ -24,19 +182,69 @@ class OdooService:
         self.uid: Optional[int] = None
         self.is_connected: bool = False
 
-        # XML-RPC endpoints
-        self.common = xmlrpc.client.ServerProxy(f"{self.url}/xmlrpc/2/common")
-        self.models = xmlrpc.client.ServerProxy(f"{self.url}/xmlrpc/2/object")
+        # Shared non-blocking HTTP client for the JSON-RPC endpoint
+        self._client = httpx.AsyncClient(
+            base_url=self.url,
+            timeout=ODOO_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+                keepalive_expiry=ODOO_KEEPALIVE_EXPIRY,
+            ),
+            headers={"Connection": "keep-alive"},
+        )
+
+        # Write-behind task creation (started lazily on the running loop)
+        self._task_queue: Optional[asyncio.Queue] = None
+        self._task_worker: Optional[asyncio.Task] = None
+        self._pending_tasks: Dict[str, Dict[str, Any]] = {}
+
+        # Cache for rarely-changing reads (employees, policies)
+        self._cache = AsyncTTLCache(maxsize=10_000)
+
+        # Telegram-Odoo link map, loaded from Odoo on connect
+        self._telegram_links: Optional[Dict[int, Dict[str, Any]]] = None
+        self._telegram_links_param_id: Optional[int] = None
+        self._telegram_links_lock = asyncio.Lock()
+
+        # JSON-RPC request ids
+        self._rpc_ids = itertools.count(1)
+
+    async def _rpc(self, service: str, method: str, args: tuple) -> Any:
+        """POST a JSON-RPC call to Odoo's /jsonrpc endpoint without blocking the event loop"""
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "call",
+            "params": {"service": service, "method": method, "args": args},
+            "id": next(self._rpc_ids),
+        }
+        response = await self._client.post(
+            "/jsonrpc",
+            content=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+        reply = orjson.loads(response.content)
+        if reply.get("error"):
+            raise OdooRPCError(reply["error"])
+        return reply.get("result")
 
     async def connect(self) -> bool:
         """Authenticate with Odoo"""
         try:
-            self.uid = self.common.authenticate(
-                self.db, self.username, self.password, {}
+            self.uid = await self._rpc(
+                "common",
+                "authenticate",
+                (self.db, self.username, self.password, {}),
             )
             if self.uid:
                 self.is_connected = True
                 logger.info(f"Connected to Odoo as UID: {self.uid}")
+                try:
+                    await self._ensure_telegram_links()
+                except Exception as e:
+                    # Retried lazily on the first link lookup
+                    logger.warning(f"Could not load Telegram links: {e}")
                 return True
             else:
                 logger.error("Odoo authentication failed")
@@ -45,112 +253,165 @@ class OdooService:
             logger.error(f"Odoo connection error: {e}")
             return False
 
-    def _execute(self, model: str, method: str, *args, **kwargs) -> Any:
-        """Execute an Odoo XML-RPC call"""
-        return self.models.execute_kw(
-            self.db, self.uid, self.password, model, method, args, kwargs
+    async def close(self) -> None:
+        """Flush queued task writes, then close the underlying HTTP connection pool"""
+        if self._task_worker is not None:
+            try:
+                await asyncio.wait_for(self._task_queue.join(), TASK_QUEUE_DRAIN_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.error(
+                    f"Dropping {self._task_queue.qsize()} queued task(s) still unwritten at shutdown"
+                )
+            self._task_worker.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task_worker
+            self._task_worker = None
+        await self._client.aclose()
+
+    async def _execute(self, model: str, method: str, *args, **kwargs) -> Any:
+        """Execute an Odoo ORM call, memoizing reads inside an odoo_request_scope"""
+        cache = _request_cache.get()
+        if cache is None:
+            return await self._call_kw(model, method, args, kwargs)
+
+        if method not in _READ_METHODS:
+            # A write may change anything read so far in this scope
+            cache.clear()
+            return await self._call_kw(model, method, args, kwargs)
+
+        key = (model, method, repr(args), repr(sorted(kwargs.items())))
+        call = cache.get(key)
+        if call is None:
+            # Store the in-flight call so concurrent duplicates share one RPC
+            call = cache[key] = asyncio.ensure_future(self._call_kw(model, method, args, kwargs))
+        try:
+            return await asyncio.shield(call)
+        except Exception:
+            cache.pop(key, None)
+            raise
+
+    async def _call_kw(self, model: str, method: str, args: tuple, kwargs: Dict[str, Any]) -> Any:
+        """Send execute_kw to the object endpoint"""
+        return await self._rpc(
+            "object",
+            "execute_kw",
+            (self.db, self.uid, self.password, model, method, list(args), kwargs),
         )
 
     # ==================== Employee Linking ====================
 
     async def find_employee_by_email(self, email: str) -> Optional[Employee]:
+        """Find an employee by their email address (cached)"""
+        return await self._cache.get_or_fetch(
+            ("email", email.strip().lower()),
+            lambda: self._fetch_employee_by_email(email),
+            ttl=EMPLOYEE_CACHE_TTL,
+            refresh_threshold=CACHE_REFRESH_THRESHOLD,
+        )
+
+    async def _fetch_employee_by_email(self, email: str) -> Optional[Employee]:
         """Find an employee by their email address"""
         try:
             logger.info(f"Searching for employee with email: '{email}'")
             # Use ilike for case-insensitive search, trim whitespace
             email = email.strip().lower()
-            employee_ids = self._execute(
+            employee_data = await self._execute(
                 "hr.employee",
-                "search",
+                "search_read",
                 [["work_email", "ilike", email]],
+                fields=_EMPLOYEE_FIELDS,
+                limit=1,
             )
-            logger.info(f"Search result for '{email}': employee_ids={employee_ids}")
-            if not employee_ids:
-                return None
-
-            employee_data = self._execute(
-                "hr.employee",
-                "read",
-                employee_ids[:1],
-                fields=["id", "name", "work_email", "job_title", "department_id", "parent_id", "work_phone", "mobile_phone"],
-            )
+            logger.info(f"Search result for '{email}': {len(employee_data)} match(es)")
             if employee_data:
-                emp = employee_data[0]
-                return Employee(
-                    id=emp["id"],
-                    name=emp["name"],
-                    email=emp.get("work_email"),
-                    job_title=emp.get("job_title") or None,
-                    department=emp["department_id"][1] if emp.get("department_id") else None,
-                    manager_name=emp["parent_id"][1] if emp.get("parent_id") else None,
-                    work_phone=emp.get("work_phone") or None,
-                    mobile_phone=emp.get("mobile_phone") or None,
-                )
+                return Employee.model_validate(_employee_values(employee_data[0]))
             return None
         except Exception as e:
             logger.error(f"Error finding employee by email: {e}")
             return None
 
     async def get_employee_by_id(self, employee_id: int) -> Optional[Employee]:
+        """Get employee details by ID (cached)"""
+        return await self._cache.get_or_fetch(
+            ("emp", employee_id),
+            lambda: self._fetch_employee_by_id(employee_id),
+            ttl=EMPLOYEE_CACHE_TTL,
+            refresh_threshold=CACHE_REFRESH_THRESHOLD,
+        )
+
+    async def _fetch_employee_by_id(self, employee_id: int) -> Optional[Employee]:
         """Get employee details by ID"""
         try:
-            employee_data = self._execute(
+            employee_data = await self._execute(
                 "hr.employee",
                 "read",
                 [employee_id],
-                fields=["id", "name", "work_email", "job_title", "department_id", "parent_id", "work_phone", "mobile_phone"],
+                fields=_EMPLOYEE_FIELDS,
             )
             if employee_data:
-                emp = employee_data[0]
-                return Employee(
-                    id=emp["id"],
-                    name=emp["name"],
-                    email=emp.get("work_email"),
-                    job_title=emp.get("job_title") or None,
-                    department=emp["department_id"][1] if emp.get("department_id") else None,
-                    manager_name=emp["parent_id"][1] if emp.get("parent_id") else None,
-                    work_phone=emp.get("work_phone") or None,
-                    mobile_phone=emp.get("mobile_phone") or None,
-                )
+                return Employee.model_validate(_employee_values(employee_data[0]))
             return None
         except Exception as e:
             logger.error(f"Error getting employee by ID: {e}")
             return None
 
+    async def _gather_parts(self, parts: Dict[str, Awaitable[Any]]) -> Dict[str, Any]:
+        """Run independent Odoo reads concurrently; a failed part becomes None"""
+        results = await asyncio.gather(*parts.values(), return_exceptions=True)
+        gathered: Dict[str, Any] = {}
+        for name, result in zip(parts, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error fetching {name}: {result}")
+                result = None
+            gathered[name] = result
+        return gathered
+
+    async def get_employee_bundle(
+        self, employee_id: int, include: List[str]
+    ) -> Dict[str, Any]:
+        """Fetch several parts of an employee's profile in a single service call"""
+        fetchers = {
+            "info": self.get_employee_by_id,
+            "leave_balance": self.get_leave_balance,
+            "payslips": self.get_payslips,
+        }
+        return await self._gather_parts({
+            part: fetchers[part](employee_id) for part in include if part in fetchers
+        })
+
+    async def get_dashboard(
+        self, employee_id: int, parts: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Fetch an employee's dashboard concurrently, optionally only the given parts"""
+        fetchers = {
+            "employee": self.get_employee_by_id,
+            "leave_balance": self.get_leave_balance,
+            "leave_requests": self.get_leave_requests,
+            "payslips": self.get_payslips,
+            "attendance": self.get_attendance_summary,
+            "tasks": self.get_employee_tasks,
+        }
+        if parts is None:
+            parts = list(fetchers)
+        return await self._gather_parts({
+            part: fetchers[part](employee_id) for part in parts if part in fetchers
+        })
+
     # ==================== Leave Management ====================
 
     async def get_leave_balance(self, employee_id: int) -> List[LeaveBalance]:
         """Get leave balances for an employee"""
         try:
-            allocation_ids = self._execute(
+            allocations = await self._execute(
                 "hr.leave.allocation",
-                "search",
+                "search_read",
                 [["employee_id", "=", employee_id], ["state", "=", "validate"]],
+                fields=_LEAVE_ALLOCATION_FIELDS,
             )
-            if not allocation_ids:
-                return []
 
-            allocations = self._execute(
-                "hr.leave.allocation",
-                "read",
-                allocation_ids,
-                fields=["holiday_status_id", "number_of_days", "leaves_taken"],
+            return _LEAVE_BALANCE_LIST.validate_python(
+                [_leave_balance_values(alloc) for alloc in allocations]
             )
-
-            balances = []
-            for alloc in allocations:
-                leave_type = alloc["holiday_status_id"][1] if alloc.get("holiday_status_id") else "Unknown"
-                allocated = alloc.get("number_of_days", 0)
-                taken = alloc.get("leaves_taken", 0)
-                balances.append(
-                    LeaveBalance(
-                        leave_type=leave_type,
-                        allocated=allocated,
-                        taken=taken,
-                        remaining=allocated - taken,
-                    )
-                )
-            return balances
         except Exception as e:
             logger.error(f"Error getting leave balance: {e}")
             return []
@@ -164,33 +425,44 @@ class OdooService:
             if state:
                 domain.append(["state", "=", state])
 
-            leave_ids = self._execute("hr.leave", "search", domain)
-            if not leave_ids:
-                return []
-
-            leaves = self._execute(
+            leaves = await self._execute(
                 "hr.leave",
-                "read",
-                leave_ids,
-                fields=["id", "holiday_status_id", "date_from", "date_to", "number_of_days", "state", "name"],
+                "search_read",
+                domain,
+                fields=_LEAVE_REQUEST_FIELDS,
             )
 
-            return [
-                LeaveRequest(
-                    id=leave["id"],
-                    leave_type=leave["holiday_status_id"][1] if leave.get("holiday_status_id") else "Unknown",
-                    date_from=str(leave.get("date_from", "")),
-                    date_to=str(leave.get("date_to", "")),
-                    number_of_days=leave.get("number_of_days", 0),
-                    state=leave.get("state", ""),
-                    reason=leave.get("name"),
-                )
-                for leave in leaves
-            ]
+            return _LEAVE_REQUEST_LIST.validate_python(
+                [_leave_request_values(leave) for leave in leaves]
+            )
         except Exception as e:
             logger.error(f"Error getting leave requests: {e}")
             return []
 
+    async def create_leave_requests(self, requests: List[LeaveRequestCreate]) -> List[int]:
+        """Create several leave requests with a single RPC, returning their IDs in order"""
+        if not requests:
+            return []
+        try:
+            leave_ids = await self._execute(
+                "hr.leave",
+                "create",
+                [
+                    {
+                        "employee_id": r.employee_id,
+                        "holiday_status_id": r.leave_type_id,
+                        "date_from": r.date_from,
+                        "date_to": r.date_to,
+                        "name": r.reason,
+                    }
+                    for r in requests
+                ],
+            )
+            return _as_id_list(leave_ids)
+        except Exception as e:
+            logger.error(f"Error creating leave requests: {e}")
+            return []
+
     async def create_leave_request(
         self,
         employee_id: int,
@@ -200,22 +472,16 @@ class OdooService:
         reason: str = "",
     ) -> Optional[int]:
         """Create a new leave request"""
-        try:
-            leave_id = self._execute(
-                "hr.leave",
-                "create",
-                [{
-                    "employee_id": employee_id,
-                    "holiday_status_id": leave_type_id,
-                    "date_from": date_from,
-                    "date_to": date_to,
-                    "name": reason,
-                }],
+        leave_ids = await self.create_leave_requests([
+            LeaveRequestCreate(
+                employee_id=employee_id,
+                leave_type_id=leave_type_id,
+                date_from=date_from,
+                date_to=date_to,
+                reason=reason,
             )
-            return leave_id
-        except Exception as e:
-            logger.error(f"Error creating leave request: {e}")
-            return None
+        ])
+        return leave_ids[0] if leave_ids else None
 
     # ==================== Payroll ====================
 
@@ -224,35 +490,16 @@ class OdooService:
     ) -> List[PayslipSummary]:
         """Get recent payslips for an employee"""
         try:
-            payslip_ids = self._execute(
+            payslips = await self._execute(
                 "hr.payslip",
-                "search",
+                "search_read",
                 [["employee_id", "=", employee_id]],
+                fields=_PAYSLIP_FIELDS,
                 limit=limit,
                 order="date_to desc",
             )
-            if not payslip_ids:
-                return []
-
-            payslips = self._execute(
-                "hr.payslip",
-                "read",
-                payslip_ids,
-                fields=["id", "name", "date_from", "date_to", "state", "net_wage", "basic_wage"],
-            )
 
-            return [
-                PayslipSummary(
-                    id=ps["id"],
-                    name=ps.get("name", ""),
-                    date_from=str(ps.get("date_from", "")),
-                    date_to=str(ps.get("date_to", "")),
-                    state=ps.get("state", ""),
-                    net_wage=ps.get("net_wage", 0),
-                    gross_wage=ps.get("basic_wage", 0),
-                )
-                for ps in payslips
-            ]
+            return _PAYSLIP_LIST.validate_python([_payslip_values(ps) for ps in payslips])
         except Exception as e:
             logger.error(f"Error getting payslips: {e}")
             return []
@@ -282,40 +529,38 @@ class OdooService:
             else:
                 last_day = date(year, month + 1, 1)
 
-            attendance_ids = self._execute(
-                "hr.attendance",
-                "search",
-                [
-                    ["employee_id", "=", employee_id],
-                    ["check_in", ">=", str(first_day)],
-                    ["check_in", "<", str(last_day)],
-                ],
-            )
+            domain = [
+                ["employee_id", "=", employee_id],
+                ["check_in", ">=", str(first_day)],
+                ["check_in", "<", str(last_day)],
+            ]
 
-            if not attendance_ids:
-                return {
-                    "month": month,
-                    "year": year,
-                    "total_days": 0,
-                    "total_hours": 0,
-                    "records": [],
-                }
-
-            attendances = self._execute(
-                "hr.attendance",
-                "read",
-                attendance_ids,
-                fields=["check_in", "check_out", "worked_hours"],
+            # Totals are summed by Odoo; only the rows shown are transferred
+            totals, records = await asyncio.gather(
+                self._execute(
+                    "hr.attendance",
+                    "read_group",
+                    domain,
+                    fields=_ATTENDANCE_TOTAL_FIELDS,
+                    groupby=[],
+                ),
+                self._execute(
+                    "hr.attendance",
+                    "search_read",
+                    domain,
+                    fields=_ATTENDANCE_FIELDS,
+                    order="check_in desc",
+                    limit=ATTENDANCE_RECENT_LIMIT,
+                ),
             )
-
-            total_hours = sum(att.get("worked_hours", 0) for att in attendances)
+            total = totals[0] if totals else {}
 
             return {
                 "month": month,
                 "year": year,
-                "total_days": len(attendances),
-                "total_hours": round(total_hours, 2),
-                "records": attendances[:10],  # Last 10 records
+                "total_days": total.get("__count", 0),
+                "total_hours": round(total.get("worked_hours") or 0, 2),
+                "records": records,
             }
         except Exception as e:
             logger.error(f"Error getting attendance: {e}")
@@ -327,26 +572,43 @@ class OdooService:
         """Get tasks assigned to an employee"""
         try:
             # Try project.task first (if project module is installed)
-            task_ids = self._execute(
+            return await self._execute(
                 "project.task",
-                "search",
+                "search_read",
                 [["user_ids", "in", [employee_id]]],
+                fields=_TASK_FIELDS,
                 limit=20,
             )
+        except Exception as e:
+            logger.warning(f"Could not fetch tasks (project module may not be installed): {e}")
+            return []
 
-            if task_ids:
-                tasks = self._execute(
-                    "project.task",
-                    "read",
-                    task_ids,
-                    fields=["id", "name", "description", "date_deadline", "priority", "stage_id"],
-                )
-                return tasks
+    async def create_tasks(self, tasks: List[Task]) -> List[int]:
+        """Create several tasks with a single RPC, returning their IDs in order"""
+        if not tasks:
             return []
+        try:
+            return await self._create_tasks_rpc(tasks)
         except Exception as e:
-            logger.warning(f"Could not fetch tasks (project module may not be installed): {e}")
+            logger.error(f"Error creating tasks: {e}")
             return []
 
+    async def _create_tasks_rpc(self, tasks: List[Task]) -> List[int]:
+        """Send the project.task create for create_tasks, letting errors propagate"""
+        values = []
+        for task in tasks:
+            task_data = {
+                "name": task.name,
+                "description": task.description or "",
+                "user_ids": [(4, task.employee_id)],
+            }
+            if task.due_date:
+                task_data["date_deadline"] = task.due_date
+            values.append(task_data)
+
+        task_ids = await self._execute("project.task", "create", values)
+        return _as_id_list(task_ids)
+
     async def create_task(
         self,
         employee_id: int,
@@ -355,103 +617,276 @@ class OdooService:
         due_date: Optional[str] = None,
     ) -> Optional[int]:
         """Create a task for an employee"""
-        try:
-            task_data = {
-                "name": name,
-                "description": description,
-                "user_ids": [(4, employee_id)],
-            }
-            if due_date:
-                task_data["date_deadline"] = due_date
+        task_ids = await self.create_tasks([
+            Task(employee_id=employee_id, name=name, description=description, due_date=due_date)
+        ])
+        return task_ids[0] if task_ids else None
 
-            task_id = self._execute("project.task", "create", [task_data])
-            return task_id
-        except Exception as e:
-            logger.error(f"Error creating task: {e}")
-            return None
+    async def enqueue_task(
+        self,
+        employee_id: int,
+        name: str,
+        description: str = "",
+        due_date: Optional[str] = None,
+    ) -> str:
+        """Queue a task for background creation and return a provisional ID"""
+        if self._task_queue is None:
+            self._task_queue = asyncio.Queue(maxsize=TASK_QUEUE_MAXSIZE)
+            self._task_worker = asyncio.create_task(self._task_write_worker())
+        self._expire_pending_tasks()
+
+        pending_id = f"pending-{uuid.uuid4().hex}"
+        self._pending_tasks[pending_id] = {
+            "employee_id": employee_id,
+            "name": name,
+            "due_date": due_date,
+            "task_id": None,
+            "state": "pending",
+            "finished_at": None,
+        }
+        try:
+            self._task_queue.put_nowait((pending_id, employee_id, name, description, due_date))
+        except asyncio.QueueFull:
+            # Queue is saturated: write inline rather than dropping the task
+            logger.warning("Task write queue full, creating task synchronously")
+            await self._write_pending_task(pending_id, employee_id, name, description, due_date)
+        return pending_id
+
+    async def _task_write_worker(self) -> None:
+        """Drain the task queue, writing everything queued so far in one create"""
+        # Started from inside a tool call; don't keep that turn's read cache alive
+        _request_cache.set(None)
+        while True:
+            batch = [await self._task_queue.get()]
+            while not self._task_queue.empty():
+                batch.append(self._task_queue.get_nowait())
+            try:
+                await self._write_pending_tasks(batch)
+            finally:
+                for _ in batch:
+                    self._task_queue.task_done()
+
+    async def _write_pending_task(
+        self,
+        pending_id: str,
+        employee_id: int,
+        name: str,
+        description: str,
+        due_date: Optional[str],
+    ) -> None:
+        """Create a single queued task (used when the queue is full)"""
+        await self._write_pending_tasks([(pending_id, employee_id, name, description, due_date)])
+
+    async def _write_pending_tasks(self, batch: List[Tuple]) -> None:
+        """
+        Create queued tasks and record their real IDs.
+
+        create is not idempotent, so only failures to reach Odoo at all are
+        retried (with exponential backoff); any other error may have come after
+        the tasks were written and fails the batch instead of duplicating it.
+        """
+        tasks = [
+            Task(employee_id=employee_id, name=name, description=description, due_date=due_date)
+            for _, employee_id, name, description, due_date in batch
+        ]
+        delay = TASK_WRITE_BACKOFF
+        task_ids: List[int] = []
+        for attempt in range(1, TASK_WRITE_RETRIES + 1):
+            try:
+                task_ids = await self._create_tasks_rpc(tasks)
+                break
+            except _UNSENT_REQUEST_ERRORS as e:
+                logger.warning(f"Could not reach Odoo to create tasks (attempt {attempt}): {e}")
+                if attempt < TASK_WRITE_RETRIES:
+                    await asyncio.sleep(delay)
+                    delay *= 2
+            except Exception as e:
+                logger.error(f"Error creating queued tasks: {e}")
+                break
+
+        finished_at = time.monotonic()
+        if len(task_ids) == len(batch):
+            for (pending_id, *_), task_id in zip(batch, task_ids):
+                self._pending_tasks[pending_id].update(
+                    task_id=task_id, state="created", finished_at=finished_at
+                )
+            return
+        logger.error(f"Giving up on {len(batch)} queued task(s)")
+        for pending_id, *_ in batch:
+            self._pending_tasks[pending_id].update(state="failed", finished_at=finished_at)
+
+    def _expire_pending_tasks(self) -> None:
+        """Forget created/failed entries that were never reported within TASK_RESULT_TTL"""
+        cutoff = time.monotonic() - TASK_RESULT_TTL
+        for pending_id, entry in list(self._pending_tasks.items()):
+            if entry["finished_at"] is not None and entry["finished_at"] < cutoff:
+                del self._pending_tasks[pending_id]
+
+    def pop_pending_tasks(self, employee_id: int) -> List[Dict[str, Any]]:
+        """
+        Return queued tasks for an employee.
+
+        Entries that are already created or have failed are removed from the
+        pending map, so each outcome is reported once.
+        """
+        self._expire_pending_tasks()
+        results = []
+        for pending_id, entry in list(self._pending_tasks.items()):
+            if entry["employee_id"] != employee_id:
+                continue
+            results.append({
+                "pending_id": pending_id,
+                **{k: v for k, v in entry.items() if k != "finished_at"},
+            })
+            if entry["state"] != "pending":
+                del self._pending_tasks[pending_id]
+        return results
 
     # ==================== Company Policies ====================
 
     async def get_company_policies(self) -> List[Dict[str, Any]]:
+        """Get company policies/documents (cached)"""
+        return await self._cache.get_or_fetch(
+            ("policies",),
+            self._fetch_company_policies,
+            ttl=POLICY_CACHE_TTL,
+            refresh_threshold=CACHE_REFRESH_THRESHOLD,
+        )
+
+    async def _fetch_company_policies(self) -> List[Dict[str, Any]]:
         """Get company policies/documents"""
         try:
             # Try to get from hr.policy or documents module
-            policy_ids = self._execute(
+            return await self._execute(
                 "ir.attachment",
-                "search",
+                "search_read",
                 [["res_model", "=", "hr.employee"], ["name", "ilike", "policy"]],
+                fields=_POLICY_FIELDS,
                 limit=20,
             )
-
-            if policy_ids:
-                policies = self._execute(
-                    "ir.attachment",
-                    "read",
-                    policy_ids,
-                    fields=["id", "name", "description", "create_date"],
-                )
-                return policies
-            return []
         except Exception as e:
             logger.warning(f"Could not fetch policies: {e}")
             return []
 
     # ==================== Employee Link Storage ====================
-    # Store Telegram-Odoo links in a custom Odoo model or use ir.config_parameter
-
-    async def save_telegram_link(self, telegram_id: int, employee_id: int, telegram_username: str = None) -> bool:
-        """Save Telegram-Odoo employee link"""
-        try:
-            # Store in ir.config_parameter as JSON
-            key = f"telegram_link_{telegram_id}"
-            value = f"{employee_id}|{telegram_username or ''}"
-
-            existing = self._execute(
+    # All Telegram-Odoo links live in one ir.config_parameter holding a JSON map
+    # {telegram_id: {"employee_id": ..., "username": ...}}. It is loaded once and
+    # kept in memory, so lookups need no RPC. Every change re-reads the stored map
+    # under the lock and applies only its own edits, so links written by other
+    # workers are not overwritten.
+
+    async def _load_telegram_links(self) -> None:
+        """Load the link map, migrating legacy per-user telegram_link_<id> parameters"""
+        rows = await self._execute(
+            "ir.config_parameter",
+            "search_read",
+            ["|", ["key", "=", TELEGRAM_LINKS_PARAM], ["key", "=like", "telegram_link_%"]],
+            fields=_CONFIG_PARAM_FIELDS,
+        )
+        links: Dict[int, Dict[str, Any]] = {}
+        legacy_ids: List[int] = []
+        for row in rows:
+            if row["key"] == TELEGRAM_LINKS_PARAM:
+                self._telegram_links_param_id = row["id"]
+                links.update(_parse_telegram_links(row["value"]))
+            else:
+                try:
+                    employee_id, _, username = (row["value"] or "").partition("|")
+                    telegram_id = int(row["key"][len("telegram_link_"):])
+                    link = {"employee_id": int(employee_id), "username": username}
+                except ValueError:
+                    logger.warning(f"Skipping malformed legacy Telegram link {row['key']}={row['value']!r}")
+                    continue
+                legacy_ids.append(row["id"])
+                links.setdefault(telegram_id, link)
+
+        if legacy_ids:
+            await self._persist_telegram_links(links)
+            await self._execute("ir.config_parameter", "unlink", legacy_ids)
+            logger.info(f"Migrated {len(legacy_ids)} legacy Telegram links")
+        self._telegram_links = links
+
+    async def _ensure_telegram_links(self) -> Dict[int, Dict[str, Any]]:
+        """Return the in-memory link map, loading it on first use"""
+        if self._telegram_links is None:
+            async with self._telegram_links_lock:
+                if self._telegram_links is None:
+                    await self._load_telegram_links()
+        return self._telegram_links
+
+    async def _read_telegram_links(self) -> Dict[int, Dict[str, Any]]:
+        """Fetch the stored link map from Odoo, bypassing any request-scope memo"""
+        rows = await self._call_kw(
+            "ir.config_parameter",
+            "search_read",
+            ([["key", "=", TELEGRAM_LINKS_PARAM]],),
+            {"fields": _CONFIG_PARAM_FIELDS},
+        )
+        if not rows:
+            return {}
+        self._telegram_links_param_id = rows[0]["id"]
+        return _parse_telegram_links(rows[0]["value"])
+
+    async def _persist_telegram_links(self, links: Dict[int, Dict[str, Any]]) -> None:
+        """Write the whole link map back to Odoo in a single RPC"""
+        value = json.dumps({str(telegram_id): link for telegram_id, link in links.items()})
+        if self._telegram_links_param_id:
+            await self._execute(
+                "ir.config_parameter",
+                "write",
+                [self._telegram_links_param_id],
+                {"value": value},
+            )
+        else:
+            self._telegram_links_param_id = await self._execute(
                 "ir.config_parameter",
-                "search",
-                [["key", "=", key]],
+                "create",
+                {"key": TELEGRAM_LINKS_PARAM, "value": value},
             )
 
-            if existing:
-                self._execute(
-                    "ir.config_parameter",
-                    "write",
-                    existing,
-                    {"value": value},
-                )
-            else:
-                self._execute(
-                    "ir.config_parameter",
-                    "create",
-                    [{"key": key, "value": value}],
-                )
+    async def _update_telegram_links(self, changes: Dict[int, Optional[Dict[str, Any]]]) -> None:
+        """
+        Apply link changes (None removes a link) to the stored map and write it back.
+
+        The in-memory map is only replaced once the write succeeds, so a failed
+        write leaves it as it was.
+        """
+        await self._ensure_telegram_links()
+        async with self._telegram_links_lock:
+            links = await self._read_telegram_links()
+            updated = dict(links)
+            for telegram_id, link in changes.items():
+                if link is None:
+                    updated.pop(telegram_id, None)
+                else:
+                    updated[telegram_id] = link
+            if updated != links:
+                await self._persist_telegram_links(updated)
+            self._telegram_links = updated
+
+    async def save_telegram_links(
+        self, new_links: List[Tuple[int, int, Optional[str]]]
+    ) -> bool:
+        """Save several (telegram_id, employee_id, telegram_username) links with one write"""
+        try:
+            await self._update_telegram_links({
+                telegram_id: {"employee_id": employee_id, "username": telegram_username or ""}
+                for telegram_id, employee_id, telegram_username in new_links
+            })
             return True
         except Exception as e:
-            logger.error(f"Error saving telegram link: {e}")
+            logger.error(f"Error saving telegram links: {e}")
             return False
 
+    async def save_telegram_link(self, telegram_id: int, employee_id: int, telegram_username: str = None) -> bool:
+        """Save Telegram-Odoo employee link"""
+        return await self.save_telegram_links([(telegram_id, employee_id, telegram_username)])
+
     async def get_employee_by_telegram(self, telegram_id: int) -> Optional[int]:
         """Get Odoo employee ID from Telegram ID"""
         try:
-            key = f"telegram_link_{telegram_id}"
-            param_ids = self._execute(
-                "ir.config_parameter",
-                "search",
-                [["key", "=", key]],
-            )
-
-            if param_ids:
-                param = self._execute(
-                    "ir.config_parameter",
-                    "read",
-                    param_ids[:1],
-                    fields=["value"],
-                )
-                if param:
-                    value = param[0].get("value", "")
-                    employee_id = int(value.split("|")[0])
-                    return employee_id
-            return None
+            link = (await self._ensure_telegram_links()).get(telegram_id)
+            return link["employee_id"] if link else None
         except Exception as e:
             logger.error(f"Error getting telegram link: {e}")
             return None
@@ -459,15 +894,7 @@ class OdooService:
     async def remove_telegram_link(self, telegram_id: int) -> bool:
         """Remove Telegram-Odoo link"""
         try:
-            key = f"telegram_link_{telegram_id}"
-            param_ids = self._execute(
-                "ir.config_parameter",
-                "search",
-                [["key", "=", key]],
-            )
-
-            if param_ids:
-                self._execute("ir.config_parameter", "unlink", param_ids)
+            await self._update_telegram_links({telegram_id: None})
             return True
         except Exception as e:
             logger.error(f"Error removing telegram link: {e}")
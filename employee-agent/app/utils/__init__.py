@@ -1,4 +1,5 @@
 # Utility functions
 from .otp import OTPManager, otp_manager
+from .ttl_cache import AsyncTTLCache
 
-__all__ = ["OTPManager", "otp_manager"]
+__all__ = ["OTPManager", "otp_manager", "AsyncTTLCache"]
@@ -1,9 +1,15 @@
+import asyncio
 import secrets
-import string
+import time
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Deque, Tuple
 from loguru import logger
 
+OTP_LENGTH = 6
+OTP_CLEANUP_INTERVAL = 60  # seconds between background sweeps
+_OTP_UPPER = 10 ** OTP_LENGTH
+
 
 class OTPManager:
     """Manages OTP generation and validation with in-memory storage"""
@@ -11,10 +17,14 @@ class OTPManager:
     def __init__(self, expiry_minutes: int = 10):
         self.expiry_minutes = expiry_minutes
         self._sessions: Dict[int, Dict[str, Any]] = {}
+        # (monotonic expiry, telegram_id) in creation order. Every session has the
+        # same TTL, so this is also expiry order and cleanup only pops the left end.
+        self._expiry_queue: Deque[Tuple[float, int]] = deque()
 
-    def generate_otp(self, length: int = 6) -> str:
-        """Generate a secure numeric OTP"""
-        return "".join(secrets.choice(string.digits) for _ in range(length))
+    def generate_otp(self, length: int = OTP_LENGTH) -> str:
+        """Generate a secure numeric OTP from a single CSPRNG draw"""
+        upper = _OTP_UPPER if length == OTP_LENGTH else 10 ** length
+        return f"{secrets.randbelow(upper):0{length}d}"
 
     def create_session(
         self,
@@ -25,6 +35,7 @@ class OTPManager:
         """Create a verification session and return the OTP"""
         otp = self.generate_otp()
         now = datetime.now()
+        expires_at_mono = time.monotonic() + self.expiry_minutes * 60
 
         self._sessions[telegram_id] = {
             "employee_id": employee_id,
@@ -32,8 +43,10 @@ class OTPManager:
             "otp_code": otp,
             "created_at": now,
             "expires_at": now + timedelta(minutes=self.expiry_minutes),
+            "expires_at_mono": expires_at_mono,
             "attempts": 0,
         }
+        self._expiry_queue.append((expires_at_mono, telegram_id))
 
         logger.info(f"Created OTP session for telegram_id={telegram_id}")
         return otp
@@ -50,7 +63,7 @@ class OTPManager:
             return False, None
 
         # Check expiry
-        if datetime.now() > session["expires_at"]:
+        if time.monotonic() > session["expires_at_mono"]:
             logger.warning(f"OTP expired for telegram_id={telegram_id}")
             self.clear_session(telegram_id)
             return False, None
@@ -97,17 +110,28 @@ class OTPManager:
 
     def cleanup_expired(self) -> int:
         """Remove all expired sessions. Returns count of removed sessions."""
-        now = datetime.now()
-        expired = [
-            tid for tid, session in self._sessions.items()
-            if now > session["expires_at"]
-        ]
-        for tid in expired:
-            del self._sessions[tid]
-
-        if expired:
-            logger.info(f"Cleaned up {len(expired)} expired OTP sessions")
-        return len(expired)
+        now = time.monotonic()
+        removed = 0
+        while self._expiry_queue and self._expiry_queue[0][0] < now:
+            _, tid = self._expiry_queue.popleft()
+            session = self._sessions.get(tid)
+            # Skip sessions that were replaced by a newer create_session
+            if session and session["expires_at_mono"] <= now:
+                del self._sessions[tid]
+                removed += 1
+
+        if removed:
+            logger.info(f"Cleaned up {removed} expired OTP sessions")
+        return removed
+
+    async def start_background_cleanup(self, interval_seconds: float = OTP_CLEANUP_INTERVAL) -> None:
+        """Sweep expired sessions periodically until cancelled"""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                self.cleanup_expired()
+            except Exception as e:
+                logger.error(f"OTP cleanup failed: {e}")
 
 
 # Global OTP manager instance
@@ -0,0 +1,81 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Set, Tuple
+from loguru import logger
+
+
+class AsyncTTLCache:
+    """
+    In-process TTL cache for async lookups with stale-while-revalidate.
+
+    Entries younger than their TTL are served from memory. Once an entry's
+    remaining lifetime drops below the refresh threshold it is still served,
+    but a background task re-fetches it so hot keys never block on a miss.
+    """
+
+    def __init__(self, maxsize: int = 10_000):
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[Any, float]] = {}
+        self._refreshing: Set[Hashable] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        # Bumped on every invalidation so fetches started earlier don't store stale data
+        self._epoch = 0
+
+    async def get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: float,
+        refresh_threshold: float = 0.0,
+    ) -> Any:
+        """Return the cached value for key, fetching it on a miss. None results are not cached."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, expires_at = entry
+            remaining = expires_at - time.monotonic()
+            if remaining > 0:
+                if remaining < refresh_threshold and key not in self._refreshing:
+                    self._schedule_refresh(key, fetch, ttl)
+                return value
+            del self._entries[key]
+
+        epoch = self._epoch
+        value = await fetch()
+        self._store(key, value, ttl, epoch)
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single key"""
+        self._epoch += 1
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        self._epoch += 1
+        self._entries.clear()
+
+    def _store(self, key: Hashable, value: Any, ttl: float, epoch: int) -> None:
+        if value is None or epoch != self._epoch:
+            return
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            # Evict the oldest insertion
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (value, time.monotonic() + ttl)
+
+    def _schedule_refresh(
+        self, key: Hashable, fetch: Callable[[], Awaitable[Any]], ttl: float
+    ) -> None:
+        self._refreshing.add(key)
+
+        async def refresh() -> None:
+            epoch = self._epoch
+            try:
+                self._store(key, await fetch(), ttl, epoch)
+            except Exception as e:
+                logger.warning(f"Background refresh failed for {key!r}: {e}")
+            finally:
+                self._refreshing.discard(key)
+
+        task = asyncio.create_task(refresh())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
@@ -0,0 +1,44 @@
+"""Mapping of domain exceptions to HTTP errors for API routes."""
+
+from typing import Dict, Type
+
+from fastapi import FastAPI, Request, status
+from fastapi.responses import ORJSONResponse
+
+from app.core.exceptions import (
+    ApplicantNotFoundError,
+    AppraisalNotFoundError,
+    EmployeeNotFoundError,
+    HRAgentException,
+    JobNotFoundError,
+    LeaveRequestNotFoundError,
+    OdooModuleNotFoundError,
+    ValidationError,
+)
+
+# Status code returned for each domain exception raised out of a route;
+# subclasses without an entry use their nearest listed base class
+ERROR_STATUS: Dict[Type[HRAgentException], int] = {
+    HRAgentException: status.HTTP_500_INTERNAL_SERVER_ERROR,
+    OdooModuleNotFoundError: status.HTTP_503_SERVICE_UNAVAILABLE,
+    ValidationError: status.HTTP_400_BAD_REQUEST,
+    ApplicantNotFoundError: status.HTTP_404_NOT_FOUND,
+    AppraisalNotFoundError: status.HTTP_404_NOT_FOUND,
+    EmployeeNotFoundError: status.HTTP_404_NOT_FOUND,
+    JobNotFoundError: status.HTTP_404_NOT_FOUND,
+    LeaveRequestNotFoundError: status.HTTP_404_NOT_FOUND,
+}
+
+
+async def domain_error_handler(request: Request, exc: HRAgentException) -> ORJSONResponse:
+    """Render a domain exception as the standard {"detail": ...} error body."""
+    status_code = next(
+        ERROR_STATUS[cls] for cls in type(exc).__mro__ if cls in ERROR_STATUS
+    )
+    return ORJSONResponse(status_code=status_code, content={"detail": str(exc.message)})
+
+
+def register_error_handlers(app: FastAPI) -> None:
+    """Install the domain exception handlers on the application."""
+    for exc_class in ERROR_STATUS:
+        app.add_exception_handler(exc_class, domain_error_handler)
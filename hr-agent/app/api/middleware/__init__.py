@@ -1,6 +1,7 @@
 """API Middleware."""
 
 from app.api.middleware.auth import APIKeyMiddleware
+from app.api.middleware.client_host import ClientHostMiddleware
 from app.api.middleware.logging import LoggingMiddleware
 
-__all__ = ["APIKeyMiddleware", "LoggingMiddleware"]
+__all__ = ["APIKeyMiddleware", "ClientHostMiddleware", "LoggingMiddleware"]
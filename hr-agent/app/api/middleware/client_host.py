@@ -0,0 +1,34 @@
+"""Client Host Resolution Middleware."""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class ClientHostMiddleware:
+    """
+    Resolve the client address once per request and store it on request.state.
+
+    Uses the first X-Forwarded-For entry when present (the service normally
+    runs behind a proxy), otherwise the socket peer. The value is meant for
+    logging only. Clients can set X-Forwarded-For themselves, so never use
+    it for access control.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            scope.setdefault("state", {})["client_host"] = _resolve_client_host(scope)
+        await self.app(scope, receive, send)
+
+
+def _resolve_client_host(scope: Scope) -> str:
+    """Return the first X-Forwarded-For address, falling back to the peer host."""
+    for name, value in scope["headers"]:
+        if name == b"x-forwarded-for":
+            forwarded = value.split(b",", 1)[0].strip()
+            if forwarded:
+                return forwarded.decode("latin-1")
+            break
+    client = scope.get("client")
+    return client[0] if client else "unknown"
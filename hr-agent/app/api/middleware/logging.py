@@ -2,44 +2,52 @@
 
 import logging
 import time
-from typing import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log request and response details."""
+class LoggingMiddleware:
+    """Pure ASGI middleware to log request and response details."""
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable,
-    ) -> Response:
-        """Process request and log details."""
-        start_time = time.time()
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        # Log request
-        logger.info(
-            f"Request: {request.method} {request.url.path} "
-            f"from {request.client.host if request.client else 'unknown'}"
-        )
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Process request
-        response = await call_next(request)
+        start_time = time.perf_counter()
+        method = scope["method"]
+        path = scope["path"]
 
-        # Calculate duration
-        duration = time.time() - start_time
-
-        # Log response
+        # Log request (formatting deferred until the record is emitted)
         logger.info(
-            f"Response: {request.method} {request.url.path} "
-            f"status={response.status_code} duration={duration:.3f}s"
+            "Request: %s %s from %s",
+            method,
+            path,
+            scope.get("state", {}).get("client_host", "unknown"),
         )
 
-        # Add timing header
-        response.headers["X-Response-Time"] = f"{duration:.3f}s"
-
-        return response
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Calculate duration up to the response headers
+                duration = time.perf_counter() - start_time
+
+                # Log response
+                logger.info(
+                    "Response: %s %s status=%s duration=%.3fs",
+                    method,
+                    path,
+                    message["status"],
+                    duration,
+                )
+
+                # Add timing header
+                MutableHeaders(scope=message).append("X-Response-Time", "%.3fs" % duration)
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
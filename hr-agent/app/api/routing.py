@@ -0,0 +1,19 @@
+"""Route class shared by the v1 API routers."""
+
+from typing import Any
+
+from fastapi.routing import APIRoute
+
+
+class ExcludeNoneRoute(APIRoute):
+    """
+    API route that leaves None fields out of response models.
+
+    Odoo leaves most optional fields empty, so list responses shrink
+    considerably when the nulls are dropped. Clients should treat a
+    missing field the same as null.
+    """
+
+    def __init__(self, path: str, endpoint: Any, **kwargs: Any) -> None:
+        kwargs["response_model_exclude_none"] = True
+        super().__init__(path, endpoint, **kwargs)
@@ -1,9 +1,11 @@
 """Appraisals API Endpoints."""
 
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 
 from app.models.appraisal import (
     Appraisal,
@@ -17,59 +19,53 @@ from app.models.appraisal import (
 from app.models.common import PaginatedResponse
 from app.services.odoo.appraisal_service import get_appraisal_service
 from app.services.ai.gemini_client import get_gemini_client
-from app.core.exceptions import AppraisalNotFoundError, OdooModuleNotFoundError
+from app.services.ai.response_cache import get_response_cache
+from app.services.cache import cached, invalidate
+from app.core.rate_limit import limit_gemini
+from app.core.exceptions import AppraisalNotFoundError
+from app.api.routing import ExcludeNoneRoute
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(route_class=ExcludeNoneRoute)
+
+# Reminder runs allowed against Odoo at once; further callers wait
+_reminder_slots = asyncio.Semaphore(4)
+
+# Compiled once; list endpoints serialise straight to JSON bytes with these
+_APPRAISAL_LIST = TypeAdapter(List[Appraisal])
 
 
 @router.get("/cycles", response_model=List[AppraisalCycle])
+@cached("appraisal_cycles", ttl=300)
 async def list_appraisal_cycles(
     state: Optional[str] = Query(None, description="Filter by state"),
 ):
     """List appraisal cycles."""
     service = get_appraisal_service()
-    try:
-        cycles = service.get_cycles(state=state)
-        return cycles
-    except OdooModuleNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e.message),
-        )
+    cycles = await asyncio.to_thread(service.get_cycles, state=state)
+    return cycles
 
 
 @router.get("/cycles/{cycle_id}", response_model=AppraisalCycle)
 async def get_appraisal_cycle(cycle_id: int):
     """Get appraisal cycle details."""
     service = get_appraisal_service()
-    try:
-        cycle = service.get_cycle_by_id(cycle_id)
-        if not cycle:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Appraisal cycle {cycle_id} not found",
-            )
-        return cycle
-    except OdooModuleNotFoundError as e:
+    cycle = await asyncio.to_thread(service.get_cycle_by_id, cycle_id)
+    if not cycle:
         raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e.message),
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Appraisal cycle {cycle_id} not found",
         )
+    return cycle
 
 
 @router.get("/cycles/{cycle_id}/status")
+@cached("appraisal_cycle_status", ttl=60)
 async def get_cycle_status(cycle_id: int):
     """Get completion status for an appraisal cycle."""
     service = get_appraisal_service()
-    try:
-        status_data = service.get_cycle_status(cycle_id)
-        return status_data
-    except OdooModuleNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e.message),
-        )
+    status_data = await asyncio.to_thread(service.get_cycle_status, cycle_id)
+    return status_data
 
 
 @router.get("", response_model=PaginatedResponse)
@@ -80,6 +76,9 @@ async def list_appraisals(
     state: Optional[str] = Query(None, description="Filter by state: new, pending, done"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page; takes precedence over page"
+    ),
 ):
     """List appraisals with filters."""
     service = get_appraisal_service()
@@ -90,13 +89,12 @@ async def list_appraisals(
             department_id=department_id,
             state=state,
         )
-        result = service.get_appraisals(filters, page=page, page_size=page_size)
-        return result
-    except OdooModuleNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e.message),
+        result = await asyncio.to_thread(
+            service.get_appraisals, filters, page=page, page_size=page_size, cursor=cursor
         )
+        return result
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/pending", response_model=List[Appraisal])
@@ -109,53 +107,48 @@ async def list_pending_appraisals(
 ):
     """Get pending appraisals requiring action."""
     service = get_appraisal_service()
-    try:
-        appraisals = service.get_pending_appraisals(
-            manager_id=manager_id,
-            department_id=department_id,
-            days_until_deadline=days_until_deadline,
-        )
-        return appraisals
-    except OdooModuleNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e.message),
-        )
+    appraisals = await asyncio.to_thread(
+        service.get_pending_appraisals,
+        manager_id=manager_id,
+        department_id=department_id,
+        days_until_deadline=days_until_deadline,
+    )
+    return Response(
+        content=_APPRAISAL_LIST.dump_json(
+            _APPRAISAL_LIST.validate_python(appraisals), exclude_none=True
+        ),
+        media_type="application/json",
+    )
 
 
 @router.get("/{appraisal_id}", response_model=AppraisalDetail)
 async def get_appraisal(appraisal_id: int):
     """Get appraisal details with goals and notes."""
     service = get_appraisal_service()
-    try:
-        appraisal = service.get_appraisal_by_id(appraisal_id)
-        if not appraisal:
-            raise AppraisalNotFoundError(f"Appraisal {appraisal_id} not found")
-        return appraisal
-    except AppraisalNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e.message))
-    except OdooModuleNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e.message),
-        )
+    appraisal = await asyncio.to_thread(service.get_appraisal_by_id, appraisal_id)
+    if not appraisal:
+        raise AppraisalNotFoundError(f"Appraisal {appraisal_id} not found")
+    return appraisal
 
 
 @router.get("/employee/{employee_id}", response_model=List[Appraisal])
 async def get_employee_appraisals(employee_id: int):
     """Get all appraisals for an employee."""
     service = get_appraisal_service()
-    try:
-        appraisals = service.get_appraisals_by_employee(employee_id)
-        return appraisals
-    except OdooModuleNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e.message),
-        )
-
-
-@router.post("/{appraisal_id}/summarize", response_model=AppraisalSummary)
+    appraisals = await asyncio.to_thread(service.get_appraisals_by_employee, employee_id)
+    return Response(
+        content=_APPRAISAL_LIST.dump_json(
+            _APPRAISAL_LIST.validate_python(appraisals), exclude_none=True
+        ),
+        media_type="application/json",
+    )
+
+
+@router.post(
+    "/{appraisal_id}/summarize",
+    response_model=AppraisalSummary,
+    dependencies=[Depends(limit_gemini)],
+)
 async def summarize_appraisal(appraisal_id: int):
     """AI-summarize appraisal feedback."""
     service = get_appraisal_service()
@@ -167,80 +160,80 @@ async def summarize_appraisal(appraisal_id: int):
             detail="AI service is not available",
         )
 
-    try:
-        # Get appraisal with notes and goals
-        appraisal = service.get_appraisal_by_id(appraisal_id)
-        if not appraisal:
-            raise AppraisalNotFoundError(f"Appraisal {appraisal_id} not found")
-
-        # Format feedback notes
-        notes_text = "\n".join(
-            [f"- {note.get('author_name', 'Unknown')}: {note.get('note', '')}"
-             for note in appraisal.get("notes", [])]
-        )
+    # Get appraisal with notes and goals, reading only what the prompt uses
+    appraisal = await asyncio.to_thread(
+        service.get_appraisal_by_id,
+        appraisal_id,
+        fields=("employee_id", "manager_id", "create_date", "note"),
+    )
+    if not appraisal:
+        raise AppraisalNotFoundError(f"Appraisal {appraisal_id} not found")
 
-        # Format goals
-        goals_text = "\n".join(
-            [f"- {goal.get('name', '')}: {goal.get('progression', 0)}% complete"
-             for goal in appraisal.get("goals", [])]
-        )
+    # Format feedback notes
+    notes_text = "\n".join(
+        f"- {note.get('author_name', 'Unknown')}: {note.get('note', '')}"
+        for note in appraisal.get("notes", ())
+    )
 
-        # Summarize with AI
-        summary = await gemini.summarize_appraisal(
-            feedback_notes=notes_text or "No feedback notes available",
-            goals=goals_text or "No goals defined",
-        )
+    # Format goals
+    goals_text = "\n".join(
+        f"- {goal.get('name', '')}: {goal.get('progression', 0)}% complete"
+        for goal in appraisal.get("goals", ())
+    )
+
+    feedback_notes = notes_text or "No feedback notes available"
+    goals = goals_text or "No goals defined"
 
-        # Store summary (if supported)
-        service.update_appraisal_summary(appraisal_id, summary)
+    # Summarize with AI; feedback differing only in names or figures belongs
+    # to another employee, so reuse exact repeats only
+    cache = get_response_cache("appraisal_summary")
+    summary = await cache.get_or_compute(
+        f"{feedback_notes}\n\n{goals}",
+        lambda: gemini.summarize_appraisal(feedback_notes=feedback_notes, goals=goals),
+    )
 
-        return summary
+    # Store summary (if supported)
+    await asyncio.to_thread(service.update_appraisal_summary, appraisal_id, summary)
 
-    except AppraisalNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e.message))
+    return summary
 
 
 @router.get("/{appraisal_id}/insights")
 async def get_appraisal_insights(appraisal_id: int):
     """Get AI insights for an appraisal (cached if available)."""
     service = get_appraisal_service()
-    try:
-        appraisal = service.get_appraisal_by_id(appraisal_id)
-        if not appraisal:
-            raise AppraisalNotFoundError(f"Appraisal {appraisal_id} not found")
-
-        # Return cached summary if available
-        if appraisal.get("ai_summary"):
-            return appraisal["ai_summary"]
+    appraisal = await asyncio.to_thread(
+        service.get_appraisal_by_id, appraisal_id, fields=("id",), include_goals=False
+    )
+    if not appraisal:
+        raise AppraisalNotFoundError(f"Appraisal {appraisal_id} not found")
 
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No AI insights available. Run /summarize first.",
-        )
+    # Return cached summary if available
+    if appraisal.get("ai_summary"):
+        return appraisal["ai_summary"]
 
-    except AppraisalNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e.message))
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="No AI insights available. Run /summarize first.",
+    )
 
 
 @router.post("/reminders/send")
 async def send_reminders(request: SendRemindersRequest):
     """Manually trigger appraisal reminders."""
     service = get_appraisal_service()
-    try:
-        result = service.send_reminders(
+    async with _reminder_slots:
+        result = await asyncio.to_thread(
+            service.send_reminders,
             appraisal_ids=request.appraisal_ids,
             days_until_deadline=request.days_until_deadline,
         )
-        return {
-            "success": True,
-            "reminders_sent": result.get("count", 0),
-            "message": f"Sent {result.get('count', 0)} reminders",
-        }
-    except OdooModuleNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e.message),
-        )
+    await invalidate("appraisal_cycle_status")
+    return {
+        "success": True,
+        "reminders_sent": result.get("count", 0),
+        "message": f"Sent {result.get('count', 0)} reminders",
+    }
 
 
 @router.get("/reminders/status", response_model=ReminderStatus)
@@ -1,10 +1,15 @@
 """Attendance Admin API Endpoints."""
 
+import asyncio
+import json
 import logging
 from datetime import date
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, HTTPException, Query, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
 from app.models.attendance import (
     AttendanceAnomalyReport,
@@ -19,10 +24,20 @@ from app.models.attendance import (
 from app.models.common import PaginatedResponse
 from app.services.odoo.attendance_service import get_attendance_service
 from app.services.ai.gemini_client import get_gemini_client
+from app.services.ai.response_cache import get_response_cache
+from app.services.cache import cache_get, cache_set, cached, invalidate, make_key
+from app.core.rate_limit import limit_gemini
 from app.core.exceptions import LeaveRequestNotFoundError, OdooModuleNotFoundError
+from app.api.routing import ExcludeNoneRoute
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(route_class=ExcludeNoneRoute)
+
+# Seconds an attendance aggregate for anomaly detection is reused
+ANALYSIS_CACHE_TTL = 900
+
+# Compiled once; list endpoints serialise straight to JSON bytes with these
+_LEAVE_REQUEST_LIST = TypeAdapter(List[LeaveRequest])
 
 
 # ==================
@@ -37,17 +52,17 @@ async def list_pending_leave_requests(
 ):
     """Get pending leave requests awaiting approval."""
     service = get_attendance_service()
-    try:
-        requests = service.get_pending_leave_requests(
-            department_id=department_id,
-            limit=limit,
-        )
-        return requests
-    except OdooModuleNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e.message),
-        )
+    requests = await asyncio.to_thread(
+        service.get_pending_leave_requests,
+        department_id=department_id,
+        limit=limit,
+    )
+    return Response(
+        content=_LEAVE_REQUEST_LIST.dump_json(
+            _LEAVE_REQUEST_LIST.validate_python(requests), exclude_none=True
+        ),
+        media_type="application/json",
+    )
 
 
 @router.post("/leave/request", response_model=LeaveRequest)
@@ -66,7 +81,8 @@ async def create_leave_request(request: LeaveRequestCreate):
     """
     service = get_attendance_service()
     try:
-        result = service.create_leave_request(
+        result = await asyncio.to_thread(
+            service.create_leave_request,
             employee_id=request.employee_id,
             leave_type_id=request.leave_type_id,
             date_from=request.date_from,
@@ -76,11 +92,8 @@ async def create_leave_request(request: LeaveRequestCreate):
         return result
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except OdooModuleNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e.message),
-        )
+    except OdooModuleNotFoundError:
+        raise
     except Exception as e:
         logger.error(f"Failed to create leave request: {e}")
         raise HTTPException(
@@ -94,19 +107,15 @@ async def approve_leave_request(leave_id: int, request: LeaveApprovalRequest):
     """Approve a leave request."""
     service = get_attendance_service()
     try:
-        result = service.approve_leave(leave_id, notes=request.notes)
+        result = await asyncio.to_thread(service.approve_leave, leave_id, notes=request.notes)
+        await invalidate("leave_balance_report")
         return {
             "success": True,
             "message": "Leave request approved",
             "leave_id": leave_id,
         }
-    except LeaveRequestNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e.message))
-    except OdooModuleNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e.message),
-        )
+    except (LeaveRequestNotFoundError, OdooModuleNotFoundError):
+        raise
     except Exception as e:
         logger.error(f"Failed to approve leave: {e}")
         raise HTTPException(
@@ -119,36 +128,26 @@ async def approve_leave_request(leave_id: int, request: LeaveApprovalRequest):
 async def reject_leave_request(leave_id: int, request: LeaveApprovalRequest):
     """Reject a leave request."""
     service = get_attendance_service()
-    try:
-        result = service.reject_leave(leave_id, notes=request.notes)
-        return {
-            "success": True,
-            "message": "Leave request rejected",
-            "leave_id": leave_id,
-        }
-    except LeaveRequestNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e.message))
-    except OdooModuleNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e.message),
-        )
+    result = await asyncio.to_thread(service.reject_leave, leave_id, notes=request.notes)
+    await invalidate("leave_balance_report")
+    return {
+        "success": True,
+        "message": "Leave request rejected",
+        "leave_id": leave_id,
+    }
 
 
 @router.get("/leave/balance/report", response_model=List[LeaveBalanceReport])
+@cached("leave_balance_report", ttl=600)
 async def get_leave_balance_report(
     department_id: Optional[int] = Query(None, description="Filter by department"),
 ):
     """Get department leave balances report."""
     service = get_attendance_service()
-    try:
-        report = service.get_leave_balance_report(department_id=department_id)
-        return report
-    except OdooModuleNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e.message),
-        )
+    report = await asyncio.to_thread(
+        service.get_leave_balance_report, department_id=department_id
+    )
+    return report
 
 
 # ==================
@@ -162,14 +161,8 @@ async def get_attendance_summary(
 ):
     """Get organization-wide attendance summary."""
     service = get_attendance_service()
-    try:
-        summary = service.get_summary(for_date=for_date)
-        return summary
-    except OdooModuleNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e.message),
-        )
+    summary = await asyncio.to_thread(service.get_summary, for_date=for_date)
+    return summary
 
 
 @router.get("/department/{department_id}", response_model=DepartmentAttendance)
@@ -179,27 +172,24 @@ async def get_department_attendance(
 ):
     """Get department attendance summary."""
     service = get_attendance_service()
-    try:
-        attendance = service.get_department_attendance(
-            department_id=department_id,
-            for_date=for_date,
-        )
-        if not attendance:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Department {department_id} not found",
-            )
-        return attendance
-    except HTTPException:
-        raise
-    except OdooModuleNotFoundError as e:
+    attendance = await asyncio.to_thread(
+        service.get_department_attendance,
+        department_id=department_id,
+        for_date=for_date,
+    )
+    if not attendance:
         raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e.message),
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Department {department_id} not found",
         )
+    return attendance
 
 
-@router.get("/anomalies", response_model=AttendanceAnomalyReport)
+@router.get(
+    "/anomalies",
+    response_model=AttendanceAnomalyReport,
+    dependencies=[Depends(limit_gemini)],
+)
 async def get_attendance_anomalies(
     days: int = Query(7, ge=1, le=30, description="Number of days to analyze"),
     department_id: Optional[int] = Query(None, description="Filter by department"),
@@ -208,39 +198,48 @@ async def get_attendance_anomalies(
     service = get_attendance_service()
     gemini = get_gemini_client()
 
-    try:
-        # Get attendance data
-        attendance_data = service.get_attendance_for_analysis(
+    # Get attendance data; the aggregate is shared by repeated dashboard polls
+    cache_key = make_key(
+        "attendance_analysis", days=days, department_id=department_id, day=date.today()
+    )
+    attendance_data = await cache_get(cache_key)
+    if attendance_data is None:
+        attendance_data = await asyncio.to_thread(
+            service.get_attendance_for_analysis,
             days=days,
             department_id=department_id,
         )
-
-        # If AI is available, use it for analysis
-        if gemini.is_available():
-            analysis = await gemini.detect_attendance_anomalies(attendance_data)
-            return AttendanceAnomalyReport(
-                analysis_date=date.today(),
-                period_start=attendance_data.get("period_start", date.today()),
-                period_end=attendance_data.get("period_end", date.today()),
-                anomalies=analysis.get("anomalies", []),
-                summary=analysis.get("summary", {}),
-                department_patterns=analysis.get("department_patterns", []),
-                recommendations=analysis.get("recommendations", []),
-                overall_assessment=analysis.get("overall_assessment", "Analysis unavailable"),
-            )
-        else:
-            # Basic rule-based analysis
-            anomalies = service.detect_anomalies_basic(attendance_data)
-            return anomalies
-
-    except OdooModuleNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e.message),
+        await cache_set(cache_key, attendance_data, ttl=ANALYSIS_CACHE_TTL)
+
+    # If AI is available, use it for analysis
+    if gemini.is_available():
+        # Attendance records differ only in names and times, so near
+        # matches would be wrong answers; reuse exact repeats only
+        cache = get_response_cache("attendance_anomalies")
+        analysis = await cache.get_or_compute(
+            json.dumps(attendance_data, sort_keys=True, default=str),
+            lambda: gemini.detect_attendance_anomalies(attendance_data),
+        )
+        return AttendanceAnomalyReport(
+            analysis_date=date.today(),
+            period_start=attendance_data.get("period_start", date.today()),
+            period_end=attendance_data.get("period_end", date.today()),
+            anomalies=analysis.get("anomalies", []),
+            summary=analysis.get("summary", {}),
+            department_patterns=analysis.get("department_patterns", []),
+            recommendations=analysis.get("recommendations", []),
+            overall_assessment=analysis.get("overall_assessment", "Analysis unavailable"),
         )
+    else:
+        # Basic rule-based analysis
+        anomalies = service.detect_anomalies_basic(attendance_data)
+        return anomalies
 
 
-@router.get("/anomalies/analyze")
+@router.get(
+    "/anomalies/analyze",
+    dependencies=[Depends(limit_gemini)],
+)
 async def analyze_attendance_patterns(
     days: int = Query(30, ge=7, le=90, description="Number of days to analyze"),
 ):
@@ -254,15 +253,9 @@ async def analyze_attendance_patterns(
             detail="AI service is not available",
         )
 
-    try:
-        attendance_data = service.get_attendance_for_analysis(days=days)
-        analysis = await gemini.detect_attendance_anomalies(attendance_data)
-        return analysis
-    except OdooModuleNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e.message),
-        )
+    attendance_data = await asyncio.to_thread(service.get_attendance_for_analysis, days=days)
+    analysis = await gemini.detect_attendance_anomalies(attendance_data)
+    return analysis
 
 
 # ==================
@@ -271,6 +264,7 @@ async def analyze_attendance_patterns(
 
 
 @router.get("/reports/monthly", response_model=MonthlyAttendanceReport)
+@cached("attendance_monthly", ttl=3600)
 async def get_monthly_attendance_report(
     year: int = Query(..., ge=2020, le=2100, description="Year"),
     month: int = Query(..., ge=1, le=12, description="Month"),
@@ -278,35 +272,40 @@ async def get_monthly_attendance_report(
 ):
     """Get monthly attendance report."""
     service = get_attendance_service()
-    try:
-        report = service.get_monthly_report(
-            year=year,
-            month=month,
-            department_id=department_id,
-        )
-        return report
-    except OdooModuleNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e.message),
-        )
+    report = await asyncio.to_thread(
+        service.get_monthly_report,
+        year=year,
+        month=month,
+        department_id=department_id,
+    )
+    return report
 
 
 @router.get("/reports/department")
 async def get_department_attendance_report(
+    request: Request,
     date_from: Optional[date] = Query(None, description="Start date"),
     date_to: Optional[date] = Query(None, description="End date"),
 ):
-    """Get department-wise attendance report."""
+    """
+    Get department-wise attendance report.
+
+    Send `Accept: application/x-ndjson` to stream one department per line
+    as each summary is computed instead of waiting for the whole report.
+    """
     service = get_attendance_service()
-    try:
-        report = service.get_department_report(
-            date_from=date_from,
-            date_to=date_to,
+    if "application/x-ndjson" in request.headers.get("accept", ""):
+        rows = await asyncio.to_thread(
+            service.iter_department_report, date_from=date_from, date_to=date_to
         )
-        return report
-    except OdooModuleNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e.message),
+        return StreamingResponse(
+            (orjson.dumps(row) + b"\n" for row in rows),
+            media_type="application/x-ndjson",
         )
+
+    report = await asyncio.to_thread(
+        service.get_department_report,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    return report
@@ -1,23 +1,30 @@
 """Health Check Endpoints."""
 
+import asyncio
 from typing import Any, Dict
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 
 from app.services.odoo.client import get_odoo_client
 from app.services.ai.gemini_client import get_gemini_client
+from app.api.routing import ExcludeNoneRoute
 
-router = APIRouter()
+router = APIRouter(route_class=ExcludeNoneRoute)
+
+
+# Static liveness payload, serialised once at import; load balancers poll this
+HEALTHY = orjson.dumps({
+    "status": "healthy",
+    "service": "hr-agent",
+    "version": "1.0.0",
+})
 
 
 @router.get("")
-async def health_check() -> Dict[str, Any]:
+async def health_check() -> Response:
     """Basic health check endpoint."""
-    return {
-        "status": "healthy",
-        "service": "hr-agent",
-        "version": "1.0.0",
-    }
+    return Response(content=HEALTHY, media_type="application/json")
 
 
 @router.get("/odoo")
@@ -66,8 +73,16 @@ async def health_all() -> Dict[str, Any]:
     odoo_client = get_odoo_client()
     gemini_client = get_gemini_client()
 
-    odoo_status = odoo_client.check_connection()
-    gemini_status = await gemini_client.health_check()
+    # Probe both services concurrently; latency is the slower of the two
+    odoo_status, gemini_status = await asyncio.gather(
+        asyncio.to_thread(odoo_client.check_connection),
+        gemini_client.health_check(),
+        return_exceptions=True,
+    )
+    if isinstance(odoo_status, BaseException):
+        odoo_status = {"connected": False, "error": str(odoo_status)}
+    if isinstance(gemini_status, BaseException):
+        gemini_status = {"available": False, "error": str(gemini_status)}
 
     # Determine overall health
     all_healthy = odoo_status.get("connected", False) and gemini_status.get("available", False)
@@ -1,9 +1,23 @@
 """Recruitment API Endpoints."""
 
+import asyncio
 import logging
+import os
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, File, Form, HTTPException, Query, UploadFile, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Path,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
+from pydantic import TypeAdapter
 
 from app.models.applicant import (
     Applicant,
@@ -17,47 +31,54 @@ from app.models.applicant import (
     ScheduleInterviewRequest,
 )
 from app.models.common import PaginatedResponse
-from app.services.odoo.recruitment_service import get_recruitment_service
-from app.services.ai.gemini_client import get_gemini_client
-from app.services.document.cv_parser import parse_cv_file
+from app.config import settings
+from app.services.odoo.recruitment_service import RecruitmentService, get_recruitment_service
+from app.services.ai.gemini_client import GeminiClient, get_gemini_client
+from app.services.document.cv_parser import SUPPORTED_CV_TYPES, parse_cv_file
+from app.services.cache import cached
 from app.core.exceptions import (
     ApplicantNotFoundError,
     JobNotFoundError,
     OdooModuleNotFoundError,
 )
+from app.api.routing import ExcludeNoneRoute
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(route_class=ExcludeNoneRoute)
+
+# CV file extensions accepted by /applicants/upload: those configured that
+# the parser can actually read
+ALLOWED_CV_EXTENSIONS = frozenset(settings.allowed_cv_extension_list) & SUPPORTED_CV_TYPES
+_CV_EXTENSION_ERROR = (
+    f"Only {' and '.join(sorted(ext.upper() for ext in ALLOWED_CV_EXTENSIONS))} files are allowed"
+)
+
+# Compiled once; list endpoints serialise straight to JSON bytes with these
+_INTERVIEW_LIST = TypeAdapter(List[Interview])
 
 
 @router.get("/jobs", response_model=List[JobPosition])
+@cached("recruitment_jobs", ttl=300)
 async def list_jobs(
     state: Optional[str] = Query(None, description="Filter by state: open, recruit, done"),
     department_id: Optional[int] = Query(None, description="Filter by department"),
+    service: RecruitmentService = Depends(get_recruitment_service),
 ):
     """List open job positions."""
-    service = get_recruitment_service()
-    try:
-        jobs = service.get_jobs(state=state, department_id=department_id)
-        return jobs
-    except OdooModuleNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e.message),
-        )
+    jobs = await asyncio.to_thread(service.get_jobs, state=state, department_id=department_id)
+    return jobs
 
 
 @router.get("/jobs/{job_id}", response_model=JobPosition)
-async def get_job(job_id: int):
+async def get_job(
+    job_id: int = Path(..., ge=1),
+    service: RecruitmentService = Depends(get_recruitment_service),
+):
     """Get job position details with requirements."""
-    service = get_recruitment_service()
-    try:
-        job = service.get_job_by_id(job_id)
-        if not job:
-            raise JobNotFoundError(f"Job {job_id} not found")
-        return job
-    except JobNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e.message))
+    job = await asyncio.to_thread(service.get_job_by_id, job_id)
+    if not job:
+        raise JobNotFoundError(f"Job {job_id} not found")
+    return job
 
 
 @router.get("/applicants", response_model=PaginatedResponse)
@@ -69,37 +90,32 @@ async def list_applicants(
     search: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    service: RecruitmentService = Depends(get_recruitment_service),
 ):
     """List applicants with filters."""
-    service = get_recruitment_service()
-    try:
-        filters = ApplicantFilter(
-            job_id=job_id,
-            stage_id=stage_id,
-            has_cv=has_cv,
-            min_score=min_score,
-            search=search,
-        )
-        result = service.get_applicants(filters, page=page, page_size=page_size)
-        return result
-    except OdooModuleNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e.message),
-        )
+    filters = ApplicantFilter(
+        job_id=job_id,
+        stage_id=stage_id,
+        has_cv=has_cv,
+        min_score=min_score,
+        search=search,
+    )
+    result = await asyncio.to_thread(
+        service.get_applicants, filters, page=page, page_size=page_size
+    )
+    return result
 
 
 @router.get("/applicants/{applicant_id}", response_model=ApplicantDetail)
-async def get_applicant(applicant_id: int):
+async def get_applicant(
+    applicant_id: int = Path(..., ge=1),
+    service: RecruitmentService = Depends(get_recruitment_service),
+):
     """Get applicant details including CV analysis if available."""
-    service = get_recruitment_service()
-    try:
-        applicant = service.get_applicant_by_id(applicant_id)
-        if not applicant:
-            raise ApplicantNotFoundError(f"Applicant {applicant_id} not found")
-        return applicant
-    except ApplicantNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e.message))
+    applicant = await asyncio.to_thread(service.get_applicant_by_id, applicant_id)
+    if not applicant:
+        raise ApplicantNotFoundError(f"Applicant {applicant_id} not found")
+    return applicant
 
 
 @router.post("/applicants/upload")
@@ -109,6 +125,7 @@ async def upload_cv(
     email: str = Form(...),
     phone: Optional[str] = Form(None),
     cv_file: UploadFile = File(...),
+    service: RecruitmentService = Depends(get_recruitment_service),
 ):
     """Upload CV and create applicant."""
     # Validate file type
@@ -118,28 +135,34 @@ async def upload_cv(
             detail="No file uploaded",
         )
 
-    ext = cv_file.filename.split(".")[-1].lower()
-    if ext not in ["pdf", "docx"]:
+    ext = os.path.splitext(cv_file.filename)[1].lstrip(".").lower()
+    if ext not in ALLOWED_CV_EXTENSIONS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Only PDF and DOCX files are allowed",
+            detail=_CV_EXTENSION_ERROR,
         )
 
-    service = get_recruitment_service()
-    try:
-        # Read file content
-        content = await cv_file.read()
+    # Reject oversized files before parsing or base64-encoding them
+    max_bytes = settings.MAX_CV_SIZE_MB * 1024 * 1024
+    if cv_file.size is not None and cv_file.size > max_bytes:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"CV exceeds the {settings.MAX_CV_SIZE_MB} MB limit",
+        )
 
-        # Parse CV
-        cv_text = await parse_cv_file(content, ext)
+    try:
+        # Parse CV straight from the spooled upload instead of copying it into memory
+        cv_text = await parse_cv_file(cv_file.file, ext)
+        cv_file.file.seek(0)
 
         # Create applicant with CV
-        applicant = service.create_applicant(
+        applicant = await asyncio.to_thread(
+            service.create_applicant,
             job_id=job_id,
             name=applicant_name,
             email=email,
             phone=phone,
-            cv_content=content,
+            cv_content=cv_file.file,
             cv_filename=cv_file.filename,
             cv_text=cv_text,
         )
@@ -150,11 +173,8 @@ async def upload_cv(
             "message": f"Applicant created successfully",
         }
 
-    except OdooModuleNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e.message),
-        )
+    except OdooModuleNotFoundError:
+        raise
     except Exception as e:
         logger.error(f"CV upload failed: {e}")
         raise HTTPException(
@@ -164,10 +184,12 @@ async def upload_cv(
 
 
 @router.post("/applicants/{applicant_id}/analyze", response_model=CVAnalysisResult)
-async def analyze_applicant_cv(applicant_id: int):
+async def analyze_applicant_cv(
+    applicant_id: int = Path(..., ge=1),
+    service: RecruitmentService = Depends(get_recruitment_service),
+    gemini: GeminiClient = Depends(get_gemini_client),
+):
     """AI-analyze applicant's CV against job requirements."""
-    service = get_recruitment_service()
-    gemini = get_gemini_client()
 
     if not gemini.is_available():
         raise HTTPException(
@@ -175,43 +197,41 @@ async def analyze_applicant_cv(applicant_id: int):
             detail="AI service is not available",
         )
 
-    try:
-        # Get applicant and job info
-        applicant = service.get_applicant_by_id(applicant_id)
-        if not applicant:
-            raise ApplicantNotFoundError(f"Applicant {applicant_id} not found")
-
-        # Get CV text from cv_text or applicant_notes (Odoo 18 stores in applicant_notes)
-        cv_text = applicant.get("cv_text") or applicant.get("applicant_notes")
-        if not cv_text:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Applicant has no CV to analyze",
-            )
-
-        job = service.get_job_by_id(applicant["job_id"])
-        job_requirements = f"{job.get('description', '')}\n\nRequirements:\n{job.get('requirements', '')}"
-
-        # Analyze with AI
-        analysis = await gemini.analyze_cv(
-            cv_text=cv_text,
-            job_requirements=job_requirements,
+    # Get applicant and job info
+    applicant = await asyncio.to_thread(service.get_applicant_by_id, applicant_id)
+    if not applicant:
+        raise ApplicantNotFoundError(f"Applicant {applicant_id} not found")
+
+    # Get CV text from cv_text or applicant_notes (Odoo 18 stores in applicant_notes)
+    cv_text = applicant.get("cv_text") or applicant.get("applicant_notes")
+    if not cv_text:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Applicant has no CV to analyze",
         )
 
-        # Store analysis in Odoo (if supported)
-        service.update_applicant_analysis(applicant_id, analysis)
+    job = await asyncio.to_thread(service.get_job_by_id, applicant["job_id"])
+    job_requirements = f"{job.get('description', '')}\n\nRequirements:\n{job.get('requirements', '')}"
 
-        return analysis
+    # Analyze with AI; analyze_cv reuses cached analyses of the same CV and job
+    analysis = await gemini.analyze_cv(
+        cv_text=cv_text,
+        job_requirements=job_requirements,
+    )
 
-    except ApplicantNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e.message))
+    # Store analysis in Odoo (if supported)
+    await asyncio.to_thread(service.update_applicant_analysis, applicant_id, analysis)
+
+    return analysis
 
 
 @router.post("/jobs/{job_id}/rank", response_model=RankingResult)
-async def rank_candidates(job_id: int):
+async def rank_candidates(
+    job_id: int = Path(..., ge=1),
+    service: RecruitmentService = Depends(get_recruitment_service),
+    gemini: GeminiClient = Depends(get_gemini_client),
+):
     """Rank all applicants for a job position using AI."""
-    service = get_recruitment_service()
-    gemini = get_gemini_client()
 
     if not gemini.is_available():
         raise HTTPException(
@@ -219,25 +239,19 @@ async def rank_candidates(job_id: int):
             detail="AI service is not available",
         )
 
-    try:
-        result = await service.rank_candidates_for_job(job_id)
-        return result
-    except JobNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e.message))
+    result = await service.rank_candidates_for_job(job_id)
+    return result
 
 
 @router.put("/applicants/{applicant_id}/stage")
 async def update_applicant_stage(
-    applicant_id: int,
-    stage_id: int = Query(..., description="New stage ID"),
+    applicant_id: int = Path(..., ge=1),
+    stage_id: int = Query(..., ge=1, description="New stage ID"),
+    service: RecruitmentService = Depends(get_recruitment_service),
 ):
     """Update applicant's recruitment stage."""
-    service = get_recruitment_service()
-    try:
-        result = service.update_applicant_stage(applicant_id, stage_id)
-        return {"success": True, "message": "Stage updated successfully"}
-    except ApplicantNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e.message))
+    result = await asyncio.to_thread(service.update_applicant_stage, applicant_id, stage_id)
+    return {"success": True, "message": "Stage updated successfully"}
 
 
 @router.get("/interviews", response_model=List[Interview])
@@ -245,48 +259,50 @@ async def list_interviews(
     applicant_id: Optional[int] = Query(None),
     from_date: Optional[str] = Query(None, description="Filter from date (YYYY-MM-DD)"),
     to_date: Optional[str] = Query(None, description="Filter to date (YYYY-MM-DD)"),
+    service: RecruitmentService = Depends(get_recruitment_service),
 ):
     """List scheduled interviews."""
-    service = get_recruitment_service()
-    try:
-        interviews = service.get_interviews(
-            applicant_id=applicant_id,
-            from_date=from_date,
-            to_date=to_date,
-        )
-        return interviews
-    except OdooModuleNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e.message),
-        )
+    interviews = await asyncio.to_thread(
+        service.get_interviews,
+        applicant_id=applicant_id,
+        from_date=from_date,
+        to_date=to_date,
+    )
+    return Response(
+        content=_INTERVIEW_LIST.dump_json(
+            _INTERVIEW_LIST.validate_python(interviews), exclude_none=True
+        ),
+        media_type="application/json",
+    )
 
 
 @router.post("/interviews/schedule", response_model=Interview)
-async def schedule_interview(request: ScheduleInterviewRequest):
+async def schedule_interview(
+    request: ScheduleInterviewRequest,
+    service: RecruitmentService = Depends(get_recruitment_service),
+):
     """Schedule a new interview."""
-    service = get_recruitment_service()
-    try:
-        interview = service.schedule_interview(
-            applicant_id=request.applicant_id,
-            start_datetime=request.start_datetime,
-            duration_minutes=request.duration_minutes,
-            interviewer_ids=request.interviewer_ids,
-            location=request.location,
-            notes=request.notes,
-            send_notifications=request.send_notifications,
-        )
-        return interview
-    except ApplicantNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e.message))
+    interview = await asyncio.to_thread(
+        service.schedule_interview,
+        applicant_id=request.applicant_id,
+        start_datetime=request.start_datetime,
+        duration_minutes=request.duration_minutes,
+        interviewer_ids=request.interviewer_ids,
+        location=request.location,
+        notes=request.notes,
+        send_notifications=request.send_notifications,
+    )
+    return interview
 
 
 @router.delete("/interviews/{interview_id}")
-async def cancel_interview(interview_id: int):
+async def cancel_interview(
+    interview_id: int = Path(..., ge=1),
+    service: RecruitmentService = Depends(get_recruitment_service),
+):
     """Cancel an interview."""
-    service = get_recruitment_service()
     try:
-        service.cancel_interview(interview_id)
+        await asyncio.to_thread(service.cancel_interview, interview_id)
         return {"success": True, "message": "Interview cancelled"}
     except Exception as e:
         raise HTTPException(
@@ -1,11 +1,13 @@
 """HR Reports API Endpoints."""
 
+import asyncio
 import logging
 from datetime import date
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, Response, status
 from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
 from app.models.report import (
     DepartmentReport,
@@ -16,21 +18,52 @@ from app.models.report import (
     ReportMetadata,
     TurnoverReport,
 )
-from app.services.odoo.employee_service import get_employee_service
-from app.services.ai.gemini_client import get_gemini_client
+from app.services.odoo.attendance_service import get_attendance_service
+from app.services.odoo.employee_service import EmployeeService, get_employee_service
+from app.services.ai.gemini_client import GeminiClient, get_gemini_client
+from app.services.cache import cached
+from app.services.document.report_exporter import iter_chunks
+from app.api.routing import ExcludeNoneRoute
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(route_class=ExcludeNoneRoute)
+
+# Shape of the IDs generate_custom_report assigns (first 8 hex digits of a UUID4)
+REPORT_ID_PATTERN = r"^[0-9a-f]{8}$"
+
+# Compiled once; list endpoints serialise straight to JSON bytes with these
+_REPORT_LIST = TypeAdapter(List[ReportMetadata])
+
+
+def _export_etag(report_id: str, extension: str) -> str:
+    """
+    Get the ETag of a report export.
+
+    Stored reports never change after generation, so the report ID and
+    format identify the export's content.
+    """
+    return f'"{report_id}.{extension}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the client already holds this export (If-None-Match)."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in (
+        tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+    )
 
 
 @router.get("/headcount", response_model=HeadcountReport)
+@cached("report_headcount", ttl=300)
 async def get_headcount_report(
     as_of_date: Optional[date] = Query(None, description="Report date (default: today)"),
+    service: EmployeeService = Depends(get_employee_service),
 ):
     """Get headcount report."""
-    service = get_employee_service()
     try:
-        report = service.get_headcount_report(as_of_date=as_of_date)
+        report = await asyncio.to_thread(service.get_headcount_report, as_of_date=as_of_date)
         return report
     except Exception as e:
         logger.error(f"Failed to generate headcount report: {e}")
@@ -41,13 +74,14 @@ async def get_headcount_report(
 
 
 @router.get("/headcount/by-department")
+@cached("report_headcount_by_department", ttl=300)
 async def get_headcount_by_department(
     as_of_date: Optional[date] = Query(None, description="Report date (default: today)"),
+    service: EmployeeService = Depends(get_employee_service),
 ):
     """Get headcount breakdown by department."""
-    service = get_employee_service()
     try:
-        data = service.get_headcount_by_department(as_of_date=as_of_date)
+        data = await asyncio.to_thread(service.get_headcount_by_department, as_of_date=as_of_date)
         return {
             "date": as_of_date or date.today(),
             "departments": data,
@@ -61,14 +95,16 @@ async def get_headcount_by_department(
 
 
 @router.get("/turnover", response_model=TurnoverReport)
+@cached("report_turnover", ttl=900)
 async def get_turnover_report(
     period_start: Optional[date] = Query(None, description="Period start date"),
     period_end: Optional[date] = Query(None, description="Period end date"),
+    service: EmployeeService = Depends(get_employee_service),
 ):
     """Get turnover analytics report."""
-    service = get_employee_service()
     try:
-        report = service.get_turnover_report(
+        report = await asyncio.to_thread(
+            service.get_turnover_report,
             period_start=period_start,
             period_end=period_end,
         )
@@ -82,13 +118,14 @@ async def get_turnover_report(
 
 
 @router.get("/turnover/trends")
+@cached("report_turnover_trends", ttl=3600)
 async def get_turnover_trends(
     months: int = Query(12, ge=1, le=36, description="Number of months to analyze"),
+    service: EmployeeService = Depends(get_employee_service),
 ):
     """Get turnover trends over time."""
-    service = get_employee_service()
     try:
-        trends = service.get_turnover_trends(months=months)
+        trends = await asyncio.to_thread(service.get_turnover_trends, months=months)
         return {
             "months_analyzed": months,
             "trends": trends,
@@ -102,11 +139,14 @@ async def get_turnover_trends(
 
 
 @router.get("/department/{department_id}", response_model=DepartmentReport)
-async def get_department_report(department_id: int):
+@cached("report_department", ttl=300)
+async def get_department_report(
+    department_id: int = Path(..., ge=1),
+    service: EmployeeService = Depends(get_employee_service),
+):
     """Get detailed metrics for a specific department."""
-    service = get_employee_service()
     try:
-        report = service.get_department_report(department_id)
+        report = await asyncio.to_thread(service.get_department_report, department_id)
         if not report:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -129,10 +169,10 @@ async def generate_insights(
     include_turnover: bool = Query(True, description="Include turnover metrics"),
     include_attendance: bool = Query(False, description="Include attendance metrics"),
     period_months: int = Query(3, ge=1, le=12, description="Analysis period in months"),
+    service: EmployeeService = Depends(get_employee_service),
+    gemini: GeminiClient = Depends(get_gemini_client),
 ):
     """Generate AI-powered HR insights."""
-    service = get_employee_service()
-    gemini = get_gemini_client()
 
     if not gemini.is_available():
         raise HTTPException(
@@ -141,19 +181,20 @@ async def generate_insights(
         )
 
     try:
-        # Gather metrics
-        metrics = {}
+        # Gather metrics; the reports are independent, so query them concurrently
+        tasks = {}
 
         if include_headcount:
-            metrics["headcount"] = service.get_headcount_report()
+            tasks["headcount"] = asyncio.to_thread(service.get_headcount_report)
 
         if include_turnover:
-            metrics["turnover"] = service.get_turnover_report()
+            tasks["turnover"] = asyncio.to_thread(service.get_turnover_report)
 
         if include_attendance:
-            from app.services.odoo.attendance_service import get_attendance_service
             attendance_service = get_attendance_service()
-            metrics["attendance"] = attendance_service.get_summary()
+            tasks["attendance"] = asyncio.to_thread(attendance_service.get_summary)
+
+        metrics = dict(zip(tasks, await asyncio.gather(*tasks.values())))
 
         # Generate AI insights
         insights = await gemini.generate_hr_insights(metrics)
@@ -169,11 +210,14 @@ async def generate_insights(
 
 
 @router.post("/generate", response_model=ReportMetadata)
-async def generate_report(request: GenerateReportRequest):
+async def generate_report(
+    request: GenerateReportRequest,
+    service: EmployeeService = Depends(get_employee_service),
+):
     """Generate a custom report."""
-    service = get_employee_service()
     try:
-        metadata = service.generate_custom_report(
+        metadata = await asyncio.to_thread(
+            service.generate_custom_report,
             report_type=request.report_type,
             date_from=request.date_from,
             date_to=request.date_to,
@@ -188,10 +232,33 @@ async def generate_report(request: GenerateReportRequest):
         )
 
 
+# Registered before /{report_id} so "list" is not captured as a report ID
+@router.get("/list", response_model=List[ReportMetadata])
+async def list_reports(
+    report_type: Optional[str] = Query(None, description="Filter by report type"),
+    limit: int = Query(20, ge=1, le=100, description="Max reports to return"),
+    service: EmployeeService = Depends(get_employee_service),
+):
+    """List previously generated reports."""
+    try:
+        reports = service.list_reports(report_type=report_type, limit=limit)
+        return Response(
+            content=_REPORT_LIST.dump_json(
+                _REPORT_LIST.validate_python(reports), exclude_none=True
+            ),
+            media_type="application/json",
+        )
+    except Exception as e:
+        logger.error(f"Failed to list reports: {e}")
+        return []
+
+
 @router.get("/{report_id}")
-async def get_report(report_id: str):
+async def get_report(
+    report_id: str = Path(..., pattern=REPORT_ID_PATTERN),
+    service: EmployeeService = Depends(get_employee_service),
+):
     """Get a previously generated report."""
-    service = get_employee_service()
     try:
         report = service.get_report_by_id(report_id)
         if not report:
@@ -205,11 +272,18 @@ async def get_report(report_id: str):
 
 
 @router.get("/{report_id}/export/pdf")
-async def export_report_pdf(report_id: str):
+async def export_report_pdf(
+    request: Request,
+    report_id: str = Path(..., pattern=REPORT_ID_PATTERN),
+    service: EmployeeService = Depends(get_employee_service),
+):
     """Export report as PDF."""
-    service = get_employee_service()
+    etag = _export_etag(report_id, "pdf")
+    if _etag_matches(request, etag) and service.get_report_by_id(report_id):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
     try:
-        pdf_content = service.export_report_to_pdf(report_id)
+        pdf_content = await asyncio.to_thread(service.export_report_to_pdf, report_id)
         if not pdf_content:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -217,10 +291,11 @@ async def export_report_pdf(report_id: str):
             )
 
         return StreamingResponse(
-            iter([pdf_content]),
+            iter_chunks(pdf_content),
             media_type="application/pdf",
             headers={
-                "Content-Disposition": f"attachment; filename=hr_report_{report_id}.pdf"
+                "Content-Disposition": f"attachment; filename=hr_report_{report_id}.pdf",
+                "ETag": etag,
             },
         )
     except HTTPException:
@@ -234,11 +309,18 @@ async def export_report_pdf(report_id: str):
 
 
 @router.get("/{report_id}/export/excel")
-async def export_report_excel(report_id: str):
+async def export_report_excel(
+    request: Request,
+    report_id: str = Path(..., pattern=REPORT_ID_PATTERN),
+    service: EmployeeService = Depends(get_employee_service),
+):
     """Export report as Excel."""
-    service = get_employee_service()
+    etag = _export_etag(report_id, "xlsx")
+    if _etag_matches(request, etag) and service.get_report_by_id(report_id):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
     try:
-        excel_content = service.export_report_to_excel(report_id)
+        excel_content = await asyncio.to_thread(service.export_report_to_excel, report_id)
         if not excel_content:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -246,10 +328,11 @@ async def export_report_excel(report_id: str):
             )
 
         return StreamingResponse(
-            iter([excel_content]),
+            iter_chunks(excel_content),
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={
-                "Content-Disposition": f"attachment; filename=hr_report_{report_id}.xlsx"
+                "Content-Disposition": f"attachment; filename=hr_report_{report_id}.xlsx",
+                "ETag": etag,
             },
         )
     except HTTPException:
@@ -260,18 +343,3 @@ async def export_report_excel(report_id: str):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to export: {str(e)}",
         )
-
-
-@router.get("/list", response_model=List[ReportMetadata])
-async def list_reports(
-    report_type: Optional[str] = Query(None, description="Filter by report type"),
-    limit: int = Query(20, ge=1, le=100, description="Max reports to return"),
-):
-    """List previously generated reports."""
-    service = get_employee_service()
-    try:
-        reports = service.list_reports(report_type=report_type, limit=limit)
-        return reports
-    except Exception as e:
-        logger.error(f"Failed to list reports: {e}")
-        return []
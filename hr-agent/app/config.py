@@ -1,7 +1,7 @@
 """Application Configuration."""
 
-from functools import lru_cache
-from typing import List
+from functools import cached_property, lru_cache
+from typing import List, Tuple
 
 from pydantic_settings import BaseSettings
 
@@ -32,6 +32,12 @@ class Settings(BaseSettings):
     # Gemini AI
     GEMINI_API_KEY: str = ""
     GEMINI_MODEL: str = "gemini-2.0-flash"
+    # Requests per minute admitted to Gemini-backed endpoints
+    GEMINI_RATE_LIMIT_PER_MINUTE: int = 15
+    # Gemini calls one request may have in flight at once (candidate ranking fan-out)
+    GEMINI_MAX_CONCURRENCY: int = 4
+    # Seconds an identical Gemini completion is served from Redis
+    LLM_CACHE_TTL: int = 7 * 24 * 3600
 
     # Email
     SMTP_HOST: str = "smtp.gmail.com"
@@ -61,6 +67,7 @@ class Settings(BaseSettings):
     APPRAISAL_REMINDER_HOUR: int = 9
     INTERVIEW_REMINDER_HOURS: int = 4
     ATTENDANCE_CHECK_HOUR: int = 19
+    CV_SCREENING_HOUR: int = 2
     WEEKLY_REPORT_DAY: str = "monday"
     WEEKLY_REPORT_HOUR: int = 7
 
@@ -75,27 +82,27 @@ class Settings(BaseSettings):
     APPRAISAL_REMINDER_DAYS: str = "7,3,1"
     INTERVIEW_REMINDER_HOURS_BEFORE: str = "48,24"
 
-    @property
-    def hr_manager_email_list(self) -> List[str]:
-        """Parse comma-separated HR manager emails to list."""
+    @cached_property
+    def hr_manager_email_list(self) -> Tuple[str, ...]:
+        """Parse comma-separated HR manager emails, once per settings instance."""
         if not self.HR_MANAGER_EMAILS:
-            return []
-        return [email.strip() for email in self.HR_MANAGER_EMAILS.split(",") if email.strip()]
-
-    @property
-    def allowed_cv_extension_list(self) -> List[str]:
-        """Parse comma-separated CV extensions to list."""
-        return [ext.strip().lower() for ext in self.ALLOWED_CV_EXTENSIONS.split(",")]
-
-    @property
-    def appraisal_reminder_day_list(self) -> List[int]:
-        """Parse comma-separated reminder days to list of integers."""
-        return [int(d.strip()) for d in self.APPRAISAL_REMINDER_DAYS.split(",")]
-
-    @property
-    def interview_reminder_hour_list(self) -> List[int]:
-        """Parse comma-separated interview reminder hours to list of integers."""
-        return [int(h.strip()) for h in self.INTERVIEW_REMINDER_HOURS_BEFORE.split(",")]
+            return ()
+        return tuple(email.strip() for email in self.HR_MANAGER_EMAILS.split(",") if email.strip())
+
+    @cached_property
+    def allowed_cv_extension_list(self) -> Tuple[str, ...]:
+        """Parse comma-separated CV extensions, once per settings instance."""
+        return tuple(ext.strip().lower() for ext in self.ALLOWED_CV_EXTENSIONS.split(","))
+
+    @cached_property
+    def appraisal_reminder_day_list(self) -> Tuple[int, ...]:
+        """Parse comma-separated reminder days to integers, once per settings instance."""
+        return tuple(int(d.strip()) for d in self.APPRAISAL_REMINDER_DAYS.split(","))
+
+    @cached_property
+    def interview_reminder_hour_list(self) -> Tuple[int, ...]:
+        """Parse comma-separated interview reminder hours to integers, once."""
+        return tuple(int(h.strip()) for h in self.INTERVIEW_REMINDER_HOURS_BEFORE.split(","))
 
     class Config:
         env_file = ".env"
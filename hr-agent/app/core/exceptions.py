@@ -1,12 +1,15 @@
 """Custom exceptions for HR Agent."""
 
+from typing import Optional
+
 
 class HRAgentException(Exception):
     """Base exception for HR Agent."""
 
-    def __init__(self, message: str, details: dict = None):
+    def __init__(self, message: str, details: Optional[dict] = None):
         self.message = message
-        self.details = details or {}
+        # Left as None when not given; most raises pass only a message
+        self.details = details
         super().__init__(self.message)
 
 
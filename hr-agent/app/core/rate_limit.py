@@ -0,0 +1,61 @@
+"""Token bucket rate limiting for quota-bound endpoints."""
+
+import math
+import time
+
+from fastapi import HTTPException, status
+
+from app.config import settings
+
+
+class TokenBucket:
+    """
+    In-process token bucket.
+
+    Holds up to `capacity` tokens and refills at `rate` tokens per second;
+    each admitted call takes one token.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+
+    def try_acquire(self) -> float:
+        """
+        Take a token if one is available.
+
+        Returns:
+            0 if admitted, otherwise seconds until a token is available
+        """
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+
+_gemini_bucket = TokenBucket(
+    rate=settings.GEMINI_RATE_LIMIT_PER_MINUTE / 60,
+    capacity=settings.GEMINI_RATE_LIMIT_PER_MINUTE,
+)
+
+
+async def limit_gemini() -> None:
+    """
+    Dependency admitting calls to Gemini-backed endpoints within the quota.
+
+    Raises:
+        HTTPException: 429 with Retry-After when the bucket is empty
+    """
+    wait = _gemini_bucket.try_acquire()
+    if wait:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="AI request rate limit exceeded, please retry later",
+            headers={"Retry-After": str(math.ceil(wait))},
+        )
@@ -1,31 +1,57 @@
 """FastAPI Application Entry Point."""
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.openapi.utils import get_openapi
 
 from app.config import settings
 from app.api.router import api_router
+from app.api.errors import register_error_handlers
 from app.api.middleware.auth import APIKeyMiddleware
+from app.api.middleware.client_host import ClientHostMiddleware
 from app.api.middleware.logging import LoggingMiddleware
-from app.services.odoo.client import get_odoo_client
+from app.services.document.cv_parser import shutdown_parse_pool
+from app.services.odoo.client import ODOO_POOL_SIZE, get_odoo_client
 
 # Configure logging
 logging.basicConfig(
     level=getattr(logging, settings.LOG_LEVEL.upper()),
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
+# The format uses neither field, so skip collecting them for every record
+logging.logThreads = False
+logging.logProcesses = False
 logger = logging.getLogger(__name__)
 
+# Smallest response body, in bytes, that GZipMiddleware compresses
+GZIP_MIN_SIZE = 1024
+# zlib level for responses; JSON gains little past 5 for much more CPU
+GZIP_COMPRESS_LEVEL = 5
+
+# HTTP methods the API serves, advertised to CORS preflights
+CORS_ALLOWED_METHODS = ["GET", "POST", "PUT", "PATCH", "DELETE"]
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifecycle management."""
     logger.info("Starting HR Agent...")
 
+    # Worker threads for the blocking Odoo calls made via asyncio.to_thread,
+    # one per pooled Odoo connection
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=ODOO_POOL_SIZE, thread_name_prefix="odoo")
+    )
+
     # Initialize Odoo connection
     try:
         odoo = get_odoo_client()
@@ -37,20 +63,28 @@ async def lifespan(app: FastAPI):
         modules = odoo.get_available_modules_status()
         for module, available in modules.items():
             status = "available" if available else "NOT available"
-            logger.info(f"  - {module}: {status}")
+            logger.info("  - %s: %s", module, status)
+
+    except Exception as e:
+        logger.warning("Odoo connection failed: %s. API calls will retry on demand.", e)
 
+    # Build and serialise the OpenAPI schema now rather than on the first
+    # docs request; this also generates every response model's JSON schema
+    try:
+        openapi_bytes()
+        logger.info("OpenAPI schema pre-warmed")
     except Exception as e:
-        logger.warning(f"Odoo connection failed: {e}. API calls will retry on demand.")
+        logger.warning("OpenAPI schema warm-up failed: %s", e)
 
     # Initialize scheduler
     try:
-        from app.scheduler.scheduler import get_scheduler
-        scheduler = get_scheduler()
+        from app.scheduler.scheduler import create_scheduler
+        scheduler = create_scheduler()
         scheduler.start()
         app.state.scheduler = scheduler
         logger.info("Scheduler started with jobs registered")
     except Exception as e:
-        logger.warning(f"Scheduler failed to start: {e}. Scheduled jobs will be unavailable.")
+        logger.warning("Scheduler failed to start: %s. Scheduled jobs will be unavailable.", e)
 
     logger.info("HR Agent started successfully")
 
@@ -63,6 +97,9 @@ async def lifespan(app: FastAPI):
     if hasattr(app.state, "scheduler"):
         app.state.scheduler.shutdown()
 
+    get_odoo_client().close()
+    shutdown_parse_pool()
+
     logger.info("HR Agent stopped")
 
 
@@ -91,20 +128,32 @@ app = FastAPI(
     """,
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_tags=[{"name": "HR Agent API"}],
     swagger_ui_parameters={"persistAuthorization": True},
 )
 
-# Add middleware (order matters - last added runs first)
+# Map domain exceptions (missing Odoo modules, unknown records) to HTTP errors
+register_error_handlers(app)
+
+# Add middleware (order matters - last added runs first). Auth wraps logging
+# so rejected keys skip the logging work, and CORS is outermost so preflights
+# and disallowed origins are answered before anything else runs.
 app.add_middleware(LoggingMiddleware)
 app.add_middleware(APIKeyMiddleware)
+# Resolve the client address once for the logging middleware
+app.add_middleware(ClientHostMiddleware)
+# Compress JSON bodies for clients that accept gzip; small bodies aren't worth it
+app.add_middleware(
+    GZipMiddleware, minimum_size=GZIP_MIN_SIZE, compresslevel=GZIP_COMPRESS_LEVEL
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=CORS_ALLOWED_METHODS,
     allow_headers=["*"],
 )
 
@@ -112,10 +161,9 @@ app.add_middleware(
 app.include_router(api_router, prefix="/api/v1")
 
 
-# Custom OpenAPI schema with API key authentication
+# Custom OpenAPI schema with API key authentication, built once per process
+@lru_cache(maxsize=1)
 def custom_openapi():
-    if app.openapi_schema:
-        return app.openapi_schema
     openapi_schema = get_openapi(
         title=app.title,
         version=app.version,
@@ -140,16 +188,39 @@ def custom_openapi():
 app.openapi = custom_openapi
 
 
+@lru_cache(maxsize=1)
+def openapi_bytes() -> bytes:
+    """Get the OpenAPI schema serialised once, for serving as-is."""
+    return orjson.dumps(custom_openapi())
+
+
+# Serve the schema from the pre-serialised bytes instead of FastAPI's
+# default route, which re-encodes the whole dict on every docs load
+app.router.routes = [
+    route for route in app.router.routes if getattr(route, "path", None) != app.openapi_url
+]
+
+
+@app.get(app.openapi_url, include_in_schema=False)
+async def openapi_json() -> Response:
+    """OpenAPI schema."""
+    return Response(content=openapi_bytes(), media_type="application/json")
+
+
+# Static root payload, serialised once at import
+ROOT_INFO = orjson.dumps({
+    "name": "HR Agent",
+    "version": "1.0.0",
+    "description": "AI-powered HR automation system",
+    "docs": "/docs",
+    "health": "/api/v1/health",
+})
+
+
 @app.get("/")
-async def root():
+async def root() -> Response:
     """Root endpoint with API information."""
-    return {
-        "name": "HR Agent",
-        "version": "1.0.0",
-        "description": "AI-powered HR automation system",
-        "docs": "/docs",
-        "health": "/api/v1/health",
-    }
+    return Response(content=ROOT_INFO, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -160,4 +231,6 @@ if __name__ == "__main__":
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.DEBUG,
+        loop="uvloop",
+        http="httptools",
     )
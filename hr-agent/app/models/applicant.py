@@ -3,12 +3,16 @@
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
+
+from app.models.common import RESPONSE_MODEL_CONFIG
 
 
 class JobPosition(BaseModel):
     """Job position model."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     id: int
     name: str
     department_id: Optional[int] = None
@@ -19,18 +23,12 @@ class JobPosition(BaseModel):
     no_of_hired_employee: int = 0
     state: str = "open"
 
-    @field_validator("description", "requirements", mode="before")
-    @classmethod
-    def convert_false_to_none(cls, v):
-        """Odoo returns False for empty text fields instead of None."""
-        if v is False:
-            return None
-        return v
-
 
 class Applicant(BaseModel):
     """Job applicant model."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     id: int
     name: str
     email: Optional[str] = None
@@ -67,6 +65,8 @@ class CVUploadRequest(BaseModel):
 class CVAnalysisResult(BaseModel):
     """CV analysis result from AI."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     overall_score: int = Field(..., ge=0, le=100)
     skill_match: Dict[str, List[str]]
     experience_analysis: Dict[str, Any]
@@ -81,6 +81,8 @@ class CVAnalysisResult(BaseModel):
 class CandidateRanking(BaseModel):
     """Candidate ranking result."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     rank: int
     applicant_id: int
     name: str
@@ -93,6 +95,8 @@ class CandidateRanking(BaseModel):
 class RankingResult(BaseModel):
     """Full ranking result for a job."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     job_id: int
     job_name: str
     rankings: List[CandidateRanking]
@@ -103,6 +107,8 @@ class RankingResult(BaseModel):
 class Interview(BaseModel):
     """Interview model."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     id: int
     applicant_id: int
     applicant_name: str
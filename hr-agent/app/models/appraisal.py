@@ -3,12 +3,19 @@
 from datetime import date, datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+from app.models.common import RESPONSE_MODEL_CONFIG
+
+# Largest explicit appraisal_ids list accepted by /reminders/send
+MAX_REMINDER_BATCH = 500
 
 
 class AppraisalCycle(BaseModel):
     """Appraisal cycle model."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     id: int
     name: str
     date_start: date
@@ -22,6 +29,8 @@ class AppraisalCycle(BaseModel):
 class Appraisal(BaseModel):
     """Individual appraisal model."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     id: int
     employee_id: int
     employee_name: str
@@ -35,17 +44,11 @@ class Appraisal(BaseModel):
     create_date: Optional[datetime] = None
 
 
-class AppraisalDetail(Appraisal):
-    """Detailed appraisal with goals and notes."""
-
-    goals: List["AppraisalGoal"] = []
-    notes: List["AppraisalNote"] = []
-    ai_summary: Optional[Dict[str, Any]] = None
-
-
 class AppraisalGoal(BaseModel):
     """Appraisal goal model."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     id: int
     name: str
     description: Optional[str] = None
@@ -58,6 +61,8 @@ class AppraisalGoal(BaseModel):
 class AppraisalNote(BaseModel):
     """Appraisal feedback note."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     id: int
     note: str
     author_id: int
@@ -65,9 +70,19 @@ class AppraisalNote(BaseModel):
     date: datetime
 
 
+class AppraisalDetail(Appraisal):
+    """Detailed appraisal with goals and notes."""
+
+    goals: List[AppraisalGoal] = []
+    notes: List[AppraisalNote] = []
+    ai_summary: Optional[Dict[str, Any]] = None
+
+
 class AppraisalSummary(BaseModel):
     """AI-generated appraisal summary."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     executive_summary: str
     key_strengths: List[str]
     areas_for_improvement: List[str]
@@ -92,6 +107,8 @@ class AppraisalFilter(BaseModel):
 class ReminderStatus(BaseModel):
     """Status of reminder job."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     last_run: Optional[datetime] = None
     reminders_sent: int = 0
     next_run: Optional[datetime] = None
@@ -102,12 +119,19 @@ class SendRemindersRequest(BaseModel):
     """Request to manually send reminders."""
 
     appraisal_ids: Optional[List[int]] = Field(
-        None, description="Specific appraisal IDs to remind, or None for all pending"
+        None,
+        max_length=MAX_REMINDER_BATCH,
+        description="Specific appraisal IDs to remind, or None for all pending",
     )
     days_until_deadline: int = Field(
         default=7, ge=1, description="Send reminders for appraisals due within this many days"
     )
 
+    @field_validator("appraisal_ids")
+    @classmethod
+    def dedupe_appraisal_ids(cls, v: Optional[List[int]]) -> Optional[List[int]]:
+        """Drop repeated IDs, keeping first-seen order."""
+        if v is None:
+            return v
+        return list(dict.fromkeys(v))
 
-# Update forward references
-AppraisalDetail.model_rebuild()
@@ -5,10 +5,14 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+from app.models.common import RESPONSE_MODEL_CONFIG
+
 
 class LeaveRequest(BaseModel):
     """Leave request model."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     id: int
     employee_id: int
     employee_name: str
@@ -27,6 +31,8 @@ class LeaveRequest(BaseModel):
 class LeaveBalance(BaseModel):
     """Employee leave balance."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     employee_id: int
     employee_name: str
     leave_type_id: int
@@ -39,6 +45,8 @@ class LeaveBalance(BaseModel):
 class LeaveBalanceReport(BaseModel):
     """Department leave balance report."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     department_id: int
     department_name: str
     report_date: date
@@ -49,6 +57,8 @@ class LeaveBalanceReport(BaseModel):
 class AttendanceRecord(BaseModel):
     """Attendance record model."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     id: int
     employee_id: int
     employee_name: str
@@ -60,6 +70,8 @@ class AttendanceRecord(BaseModel):
 class AttendanceSummary(BaseModel):
     """Organization-wide attendance summary."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     date: date
     total_employees: int
     present_count: int
@@ -74,6 +86,8 @@ class AttendanceSummary(BaseModel):
 class DepartmentAttendance(BaseModel):
     """Department attendance summary."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     department_id: int
     department_name: str
     date: date
@@ -87,6 +101,8 @@ class DepartmentAttendance(BaseModel):
 class AttendanceAnomaly(BaseModel):
     """Detected attendance anomaly."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     employee_id: int
     employee_name: str
     department_id: Optional[int] = None
@@ -102,6 +118,8 @@ class AttendanceAnomaly(BaseModel):
 class AttendanceAnomalyReport(BaseModel):
     """Full anomaly detection report."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     analysis_date: date
     period_start: date
     period_end: date
@@ -151,6 +169,8 @@ class LeaveFilter(BaseModel):
 class MonthlyAttendanceReport(BaseModel):
     """Monthly attendance report."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     year: int
     month: int
     department_id: Optional[int] = None
@@ -3,7 +3,11 @@
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Config for models built from Odoo data and only serialised afterwards:
+# unknown keys are dropped and instances are immutable once validated
+RESPONSE_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True, validate_assignment=False)
 
 
 class PaginationParams(BaseModel):
@@ -21,16 +25,23 @@ class PaginationParams(BaseModel):
 class PaginatedResponse(BaseModel):
     """Paginated response wrapper."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     items: List[Any]
     total: int
     page: int
     page_size: int
     total_pages: int
+    next_cursor: Optional[str] = Field(
+        default=None, description="Opaque cursor for the next page, when one exists"
+    )
 
 
 class ErrorResponse(BaseModel):
     """Error response model."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     detail: str
     error: str
     details: Optional[Dict[str, Any]] = None
@@ -39,6 +50,8 @@ class ErrorResponse(BaseModel):
 class SuccessResponse(BaseModel):
     """Success response model."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     success: bool = True
     message: str
     data: Optional[Dict[str, Any]] = None
@@ -54,6 +67,8 @@ class DateRange(BaseModel):
 class EmployeeBasic(BaseModel):
     """Basic employee information."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     id: int
     name: str
     email: Optional[str] = None
@@ -65,6 +80,8 @@ class EmployeeBasic(BaseModel):
 class DepartmentBasic(BaseModel):
     """Basic department information."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     id: int
     name: str
     manager_id: Optional[int] = None
@@ -5,10 +5,14 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+from app.models.common import RESPONSE_MODEL_CONFIG
+
 
 class HeadcountReport(BaseModel):
     """Headcount report model."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     report_date: date
     total_employees: int
     active_employees: int
@@ -22,6 +26,8 @@ class HeadcountReport(BaseModel):
 class TurnoverReport(BaseModel):
     """Turnover analytics report."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     period_start: date
     period_end: date
     total_terminations: int
@@ -36,6 +42,8 @@ class TurnoverReport(BaseModel):
 class DepartmentReport(BaseModel):
     """Department metrics report."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     department_id: int
     department_name: str
     report_date: date
@@ -52,6 +60,8 @@ class DepartmentReport(BaseModel):
 class ReportInsights(BaseModel):
     """AI-generated insights for reports."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     executive_summary: str
     key_insights: List[Dict[str, Any]]
     risks: List[Dict[str, Any]]
@@ -84,6 +94,8 @@ class ExportRequest(BaseModel):
 class ReportMetadata(BaseModel):
     """Metadata for a generated report."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     id: str
     report_type: str
     generated_at: datetime
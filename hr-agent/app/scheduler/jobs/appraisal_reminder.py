@@ -1,5 +1,6 @@
 """Appraisal Reminder Job."""
 
+import asyncio
 import logging
 from datetime import date, timedelta
 
@@ -7,30 +8,48 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Service handle, imported and created on the first run rather than per tick
+_service = None
+
+
+def _get_service():
+    """Get the appraisal service, importing it on first use."""
+    global _service
+    if _service is None:
+        from app.services.odoo.appraisal_service import get_appraisal_service
+
+        _service = get_appraisal_service()
+    return _service
+
+
+def _process_day(service, days: int) -> None:
+    """Send reminders for appraisals due within the given number of days."""
+    pending = service.get_pending_appraisals(days_until_deadline=days)
+
+    if pending:
+        logger.info("Found %d appraisals due within %d days", len(pending), days)
+
+        # Send reminders
+        result = service.send_reminders(days_until_deadline=days)
+        logger.info("Sent %d reminders", result.get("count", 0))
+
 
 async def run_appraisal_reminders():
     """Send reminders for pending appraisals."""
     logger.info("Running appraisal reminder job...")
 
     try:
-        from app.services.odoo.appraisal_service import get_appraisal_service
-
-        service = get_appraisal_service()
+        service = _get_service()
 
         # Get reminder days from settings
         reminder_days = settings.appraisal_reminder_day_list
 
-        for days in reminder_days:
-            pending = service.get_pending_appraisals(days_until_deadline=days)
-
-            if pending:
-                logger.info(f"Found {len(pending)} appraisals due within {days} days")
-
-                # Send reminders
-                result = service.send_reminders(days_until_deadline=days)
-                logger.info(f"Sent {result.get('count', 0)} reminders")
+        # Each reminder day is independent Odoo I/O, so run them concurrently
+        await asyncio.gather(
+            *(asyncio.to_thread(_process_day, service, days) for days in reminder_days)
+        )
 
         logger.info("Appraisal reminder job completed")
 
     except Exception as e:
-        logger.error(f"Appraisal reminder job failed: {e}")
+        logger.error("Appraisal reminder job failed: %s", e)
@@ -7,17 +7,29 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Service handles, imported and created on the first run rather than per tick
+_attendance_service = None
+_gemini = None
+
+
+def _get_services():
+    """Get the attendance service and Gemini client, importing them on first use."""
+    global _attendance_service, _gemini
+    if _attendance_service is None:
+        from app.services.odoo.attendance_service import get_attendance_service
+        from app.services.ai.gemini_client import get_gemini_client
+
+        _attendance_service = get_attendance_service()
+        _gemini = get_gemini_client()
+    return _attendance_service, _gemini
+
 
 async def run_attendance_check():
     """Check for attendance anomalies."""
     logger.info("Running attendance anomaly check...")
 
     try:
-        from app.services.odoo.attendance_service import get_attendance_service
-        from app.services.ai.gemini_client import get_gemini_client
-
-        attendance_service = get_attendance_service()
-        gemini = get_gemini_client()
+        attendance_service, gemini = _get_services()
 
         # Get attendance data for the past 7 days
         attendance_data = attendance_service.get_attendance_for_analysis(days=7)
@@ -36,16 +48,17 @@ async def run_attendance_check():
         high_severity = [a for a in anomalies if a.get("severity") == "high"]
 
         logger.info(
-            f"Anomaly check completed: {len(anomalies)} anomalies found, "
-            f"{len(high_severity)} high severity"
+            "Anomaly check completed: %d anomalies found, %d high severity",
+            len(anomalies),
+            len(high_severity),
         )
 
         # Send notifications for high severity anomalies
         if high_severity:
-            logger.warning(f"High severity anomalies detected: {len(high_severity)}")
+            logger.warning("High severity anomalies detected: %d", len(high_severity))
             # Would send notifications here
 
         logger.info("Attendance anomaly check completed")
 
     except Exception as e:
-        logger.error(f"Attendance anomaly check failed: {e}")
+        logger.error("Attendance anomaly check failed: %s", e)
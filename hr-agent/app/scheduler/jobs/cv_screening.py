@@ -0,0 +1,86 @@
+"""Nightly CV Screening Job."""
+
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Service handles, imported and created on the first run rather than per tick
+_recruitment_service = None
+_gemini = None
+
+
+def _get_services():
+    """Get the recruitment service and Gemini client, importing them on first use."""
+    global _recruitment_service, _gemini
+    if _recruitment_service is None:
+        from app.services.odoo.recruitment_service import get_recruitment_service
+        from app.services.ai.gemini_client import get_gemini_client
+
+        _recruitment_service = get_recruitment_service()
+        _gemini = get_gemini_client()
+    return _recruitment_service, _gemini
+
+
+async def _screen_job(service, gemini, job_id: int, applicants: List[Dict[str, Any]]) -> int:
+    """Analyze one job's applicants as a single batch job; returns how many were stored."""
+    job = await asyncio.to_thread(service.get_job_by_id, job_id)
+    if not job:
+        logger.warning("Skipping CV screening for missing job %d", job_id)
+        return 0
+    job_requirements = f"{job.get('description', '')}\n\nRequirements:\n{job.get('requirements', '')}"
+
+    analyses = await gemini.analyze_cvs_bulk(
+        [applicant["cv_text"] for applicant in applicants], job_requirements
+    )
+
+    stored = 0
+    for applicant, analysis in zip(applicants, analyses):
+        if analysis is None:
+            logger.warning("No CV analysis returned for applicant %d", applicant["id"])
+            continue
+        await asyncio.to_thread(service.update_applicant_analysis, applicant["id"], analysis)
+        stored += 1
+    return stored
+
+
+async def run_cv_screening():
+    """Analyze newly received CVs with the Gemini Batch API."""
+    logger.info("Running CV screening job...")
+
+    try:
+        service, gemini = _get_services()
+        if not gemini.is_available():
+            logger.info("AI service not available, skipping CV screening")
+            return
+
+        applicants = await asyncio.to_thread(service.get_unanalyzed_applicants)
+        if not applicants:
+            logger.info("No new CVs to screen")
+            return
+
+        by_job: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        for applicant in applicants:
+            by_job[applicant["job_id"]].append(applicant)
+
+        # One batch job per position; they are queued and polled concurrently
+        results = await asyncio.gather(
+            *(_screen_job(service, gemini, job_id, group) for job_id, group in by_job.items()),
+            return_exceptions=True,
+        )
+
+        stored = 0
+        for job_id, result in zip(by_job, results):
+            if isinstance(result, Exception):
+                logger.error("CV screening failed for job %d: %s", job_id, result)
+            else:
+                stored += result
+
+        logger.info(
+            "CV screening completed: %d of %d applicants analyzed", stored, len(applicants)
+        )
+
+    except Exception as e:
+        logger.error("CV screening job failed: %s", e)
@@ -1,5 +1,6 @@
 """Interview Reminder Job."""
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
 
@@ -7,39 +8,58 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Service handle, imported and created on the first run rather than per tick
+_service = None
 
-async def run_interview_reminders():
-    """Send reminders for upcoming interviews."""
-    logger.info("Running interview reminder job...")
 
-    try:
+def _get_service():
+    """Get the recruitment service, importing it on first use."""
+    global _service
+    if _service is None:
         from app.services.odoo.recruitment_service import get_recruitment_service
 
-        service = get_recruitment_service()
+        _service = get_recruitment_service()
+    return _service
 
-        # Get reminder hours from settings
-        reminder_hours = settings.interview_reminder_hour_list
 
-        for hours in reminder_hours:
-            from_time = datetime.now()
-            to_time = from_time + timedelta(hours=hours)
+def _process_window(service, hours: int) -> None:
+    """Send reminders for interviews starting within the given number of hours."""
+    from_time = datetime.now()
+    to_time = from_time + timedelta(hours=hours)
+
+    interviews = service.get_interviews(
+        from_date=from_time.isoformat(),
+        to_date=to_time.isoformat(),
+    )
 
-            interviews = service.get_interviews(
-                from_date=from_time.isoformat(),
-                to_date=to_time.isoformat(),
+    if interviews:
+        logger.info("Found %d interviews in next %d hours", len(interviews), hours)
+
+        # Send reminders (placeholder - would integrate with notification service)
+        for interview in interviews:
+            logger.info(
+                "Reminder: Interview for %s at %s",
+                interview.get("applicant_name"),
+                interview.get("start_datetime"),
             )
 
-            if interviews:
-                logger.info(f"Found {len(interviews)} interviews in next {hours} hours")
 
-                # Send reminders (placeholder - would integrate with notification service)
-                for interview in interviews:
-                    logger.info(
-                        f"Reminder: Interview for {interview.get('applicant_name')} "
-                        f"at {interview.get('start_datetime')}"
-                    )
+async def run_interview_reminders():
+    """Send reminders for upcoming interviews."""
+    logger.info("Running interview reminder job...")
+
+    try:
+        service = _get_service()
+
+        # Get reminder hours from settings
+        reminder_hours = settings.interview_reminder_hour_list
+
+        # Each reminder window is independent Odoo I/O, so run them concurrently
+        await asyncio.gather(
+            *(asyncio.to_thread(_process_window, service, hours) for hours in reminder_hours)
+        )
 
         logger.info("Interview reminder job completed")
 
     except Exception as e:
-        logger.error(f"Interview reminder job failed: {e}")
+        logger.error("Interview reminder job failed: %s", e)
@@ -7,17 +7,30 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Service handles, imported and created on the first run rather than per tick
+_employee_service = None
+_gemini = None
+
+
+def _get_services():
+    """Get the employee service and Gemini client, importing them on first use."""
+    global _employee_service, _gemini
+    if _employee_service is None:
+        from app.services.odoo.employee_service import get_employee_service
+        from app.services.ai.gemini_client import get_gemini_client
+
+        _employee_service = get_employee_service()
+        _gemini = get_gemini_client()
+    return _employee_service, _gemini
+
 
 async def run_weekly_report():
     """Generate and send weekly HR report."""
     logger.info("Running weekly HR report generation...")
 
     try:
-        from app.services.odoo.employee_service import get_employee_service
-        from app.services.ai.gemini_client import get_gemini_client
-
-        employee_service = get_employee_service()
-        gemini = get_gemini_client()
+        employee_service, gemini = _get_services()
+        ai_available = gemini.is_available()
 
         # Generate reports
         headcount = employee_service.get_headcount_report()
@@ -32,29 +45,29 @@ async def run_weekly_report():
         }
 
         # Generate AI insights if available
-        if gemini.is_available():
+        if ai_available:
             try:
                 insights = await gemini.generate_hr_insights(summary)
                 summary["ai_insights"] = insights
                 logger.info("AI insights generated successfully")
             except Exception as e:
-                logger.warning(f"Failed to generate AI insights: {e}")
+                logger.warning("Failed to generate AI insights: %s", e)
 
         # Store report
         report = employee_service.generate_custom_report(
             report_type="headcount",
-            include_ai_insights=gemini.is_available(),
+            include_ai_insights=ai_available,
         )
 
-        logger.info(f"Weekly report generated: {report.get('id')}")
+        logger.info("Weekly report generated: %s", report.get("id"))
 
         # Send to HR managers
         hr_emails = settings.hr_manager_email_list
         if hr_emails:
-            logger.info(f"Would send report to: {', '.join(hr_emails)}")
+            logger.info("Would send report to: %s", ", ".join(hr_emails))
             # Would integrate with notification service here
 
         logger.info("Weekly HR report job completed")
 
     except Exception as e:
-        logger.error(f"Weekly HR report job failed: {e}")
+        logger.error("Weekly HR report job failed: %s", e)
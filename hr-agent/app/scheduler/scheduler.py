@@ -1,28 +1,59 @@
 """APScheduler Configuration for HR Agent."""
 
 import logging
-from typing import Optional
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
 from app.config import settings
+from app.scheduler.jobs.appraisal_reminder import run_appraisal_reminders
+from app.scheduler.jobs.attendance_anomaly import run_attendance_check
+from app.scheduler.jobs.cv_screening import run_cv_screening
+from app.scheduler.jobs.interview_reminder import run_interview_reminders
+from app.scheduler.jobs.report_scheduler import run_weekly_report
 
 logger = logging.getLogger(__name__)
 
-_scheduler: Optional[AsyncIOScheduler] = None
-
-
-def get_scheduler() -> AsyncIOScheduler:
-    """Get or create the scheduler instance."""
-    global _scheduler
-
-    if _scheduler is None:
-        _scheduler = AsyncIOScheduler(timezone=settings.SCHEDULER_TIMEZONE)
-        _register_jobs(_scheduler)
-
-    return _scheduler
+# CronTrigger day_of_week names; WEEKLY_REPORT_DAY is matched on its first three letters
+WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+_WEEKLY_REPORT_DAY = settings.WEEKLY_REPORT_DAY[:3].lower()
+if _WEEKLY_REPORT_DAY not in WEEKDAYS:
+    _WEEKLY_REPORT_DAY = "mon"
+
+# Triggers built once from settings. Trigger instances keep their own timezone,
+# so it is passed explicitly rather than inherited from the scheduler.
+APPRAISAL_REMINDER_TRIGGER = CronTrigger(
+    hour=settings.APPRAISAL_REMINDER_HOUR, minute=0, timezone=settings.SCHEDULER_TIMEZONE
+)
+INTERVIEW_REMINDER_TRIGGER = IntervalTrigger(
+    hours=settings.INTERVIEW_REMINDER_HOURS, timezone=settings.SCHEDULER_TIMEZONE
+)
+ATTENDANCE_CHECK_TRIGGER = CronTrigger(
+    hour=settings.ATTENDANCE_CHECK_HOUR, minute=0, timezone=settings.SCHEDULER_TIMEZONE
+)
+CV_SCREENING_TRIGGER = CronTrigger(
+    hour=settings.CV_SCREENING_HOUR, minute=0, timezone=settings.SCHEDULER_TIMEZONE
+)
+WEEKLY_REPORT_TRIGGER = CronTrigger(
+    day_of_week=_WEEKLY_REPORT_DAY,
+    hour=settings.WEEKLY_REPORT_HOUR,
+    minute=0,
+    timezone=settings.SCHEDULER_TIMEZONE,
+)
+
+
+def create_scheduler() -> AsyncIOScheduler:
+    """
+    Create the scheduler with all jobs registered.
+
+    Called once from the application lifespan, which keeps the instance on
+    app.state; there is no module-level singleton to race on.
+    """
+    scheduler = AsyncIOScheduler(timezone=settings.SCHEDULER_TIMEZONE)
+    _register_jobs(scheduler)
+    return scheduler
 
 
 def _register_jobs(scheduler: AsyncIOScheduler) -> None:
@@ -30,51 +61,56 @@ def _register_jobs(scheduler: AsyncIOScheduler) -> None:
 
     # Appraisal Reminders - Daily at configured hour
     scheduler.add_job(
-        "app.scheduler.jobs.appraisal_reminder:run_appraisal_reminders",
-        CronTrigger(hour=settings.APPRAISAL_REMINDER_HOUR, minute=0),
+        run_appraisal_reminders,
+        APPRAISAL_REMINDER_TRIGGER,
         id="appraisal_reminders",
         name="Send appraisal reminders",
         replace_existing=True,
     )
-    logger.info(f"Registered: appraisal_reminders (daily at {settings.APPRAISAL_REMINDER_HOUR}:00)")
+    logger.info("Registered: appraisal_reminders (daily at %s:00)", settings.APPRAISAL_REMINDER_HOUR)
 
     # Interview Reminders - Every N hours
     scheduler.add_job(
-        "app.scheduler.jobs.interview_reminder:run_interview_reminders",
-        IntervalTrigger(hours=settings.INTERVIEW_REMINDER_HOURS),
+        run_interview_reminders,
+        INTERVIEW_REMINDER_TRIGGER,
         id="interview_reminders",
         name="Send interview reminders",
         replace_existing=True,
     )
-    logger.info(f"Registered: interview_reminders (every {settings.INTERVIEW_REMINDER_HOURS} hours)")
+    logger.info(
+        "Registered: interview_reminders (every %s hours)", settings.INTERVIEW_REMINDER_HOURS
+    )
 
     # Attendance Anomaly Detection - Daily at configured hour
     scheduler.add_job(
-        "app.scheduler.jobs.attendance_anomaly:run_attendance_check",
-        CronTrigger(hour=settings.ATTENDANCE_CHECK_HOUR, minute=0),
+        run_attendance_check,
+        ATTENDANCE_CHECK_TRIGGER,
         id="attendance_anomaly",
         name="Check attendance anomalies",
         replace_existing=True,
     )
-    logger.info(f"Registered: attendance_anomaly (daily at {settings.ATTENDANCE_CHECK_HOUR}:00)")
+    logger.info("Registered: attendance_anomaly (daily at %s:00)", settings.ATTENDANCE_CHECK_HOUR)
 
-    # Weekly HR Report - Configured day and hour
-    day_mapping = {
-        "monday": "mon",
-        "tuesday": "tue",
-        "wednesday": "wed",
-        "thursday": "thu",
-        "friday": "fri",
-        "saturday": "sat",
-        "sunday": "sun",
-    }
-    day = day_mapping.get(settings.WEEKLY_REPORT_DAY.lower(), "mon")
+    # CV Screening - Nightly Gemini batch job over unanalyzed applicants
+    scheduler.add_job(
+        run_cv_screening,
+        CV_SCREENING_TRIGGER,
+        id="cv_screening",
+        name="Screen new CVs",
+        replace_existing=True,
+    )
+    logger.info("Registered: cv_screening (daily at %s:00)", settings.CV_SCREENING_HOUR)
 
+    # Weekly HR Report - Configured day and hour
     scheduler.add_job(
-        "app.scheduler.jobs.report_scheduler:run_weekly_report",
-        CronTrigger(day_of_week=day, hour=settings.WEEKLY_REPORT_HOUR, minute=0),
+        run_weekly_report,
+        WEEKLY_REPORT_TRIGGER,
         id="weekly_hr_report",
         name="Generate weekly HR report",
         replace_existing=True,
     )
-    logger.info(f"Registered: weekly_hr_report ({settings.WEEKLY_REPORT_DAY} at {settings.WEEKLY_REPORT_HOUR}:00)")
+    logger.info(
+        "Registered: weekly_hr_report (%s at %s:00)",
+        settings.WEEKLY_REPORT_DAY,
+        settings.WEEKLY_REPORT_HOUR,
+    )
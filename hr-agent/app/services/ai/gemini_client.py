@@ -1,16 +1,75 @@
 """Google Gemini API Client."""
 
+import asyncio
 import json
 import logging
-from typing import Any, Dict, Optional
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
+import orjson
 from google import genai
 
 from app.config import settings
 from app.core.exceptions import AIServiceError
+from app.services.ai import llm_cache
+from app.services.ai.prompts import (
+    APPRAISAL_SUMMARY_PROMPT,
+    APPRAISAL_SUMMARY_SYSTEM,
+    ATTENDANCE_ANOMALY_PROMPT,
+    ATTENDANCE_ANOMALY_SYSTEM,
+    CANDIDATE_RANKING_PROMPT,
+    CANDIDATE_RANKING_SYSTEM,
+    CV_ANALYSIS_PROMPT,
+    CV_ANALYSIS_SYSTEM,
+    HR_INSIGHTS_PROMPT,
+    HR_INSIGHTS_SYSTEM,
+)
 
 logger = logging.getLogger(__name__)
 
+# Candidates scored per Gemini call when ranking; chunks are ranked concurrently
+RANKING_CHUNK_SIZE = 5
+
+# Batch job polling: first delay, backoff cap (seconds) and terminal states
+BATCH_POLL_INITIAL = 5.0
+BATCH_POLL_MAX = 60.0
+BATCH_DONE_STATES = frozenset({
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+})
+
+# Markdown code fence wrapped around a whole response, e.g. ```json ... ```
+_FENCE_RE = re.compile(r"\A```[a-zA-Z]*\s*|\s*```\Z")
+
+# Appended to the system instruction of every structured-output call
+_JSON_INSTRUCTION_SUFFIX = (
+    "\n\nIMPORTANT: Respond ONLY with valid JSON. "
+    "Do not include any markdown formatting, code blocks, or explanatory text. "
+    "Your entire response must be parseable as JSON."
+)
+
+
+def _parse_json_response(response: str) -> Dict[str, Any]:
+    """
+    Parse a model response as JSON, tolerating markdown code fences.
+
+    Raises:
+        AIServiceError: If the response is not valid JSON
+    """
+    try:
+        return orjson.loads(_FENCE_RE.sub("", response.strip()))
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    except json.JSONDecodeError as e:
+        logger.error(f"Failed to parse AI response as JSON: {response[:500]}")
+        raise AIServiceError(
+            "AI response was not valid JSON",
+            details={"error": str(e), "response_preview": response[:200]},
+        )
+
 
 class GeminiClient:
     """Wrapper for Google Gemini API."""
@@ -34,6 +93,8 @@ class GeminiClient:
             self.client = genai.Client(api_key=settings.GEMINI_API_KEY)
 
         self.model = settings.GEMINI_MODEL
+        # Bounds concurrent chunk calls made by rank_candidates
+        self._sem = asyncio.Semaphore(settings.GEMINI_MAX_CONCURRENCY)
         self._initialized = True
 
     def is_available(self) -> bool:
@@ -46,15 +107,21 @@ class GeminiClient:
         temperature: float = 0.7,
         max_tokens: int = 2048,
         system_instruction: Optional[str] = None,
+        use_cache: bool = False,
     ) -> str:
         """
         Generate text completion.
 
+        With use_cache, identical requests are answered from the completion
+        cache for LLM_CACHE_TTL seconds without calling the API. It is off
+        by default because sampled outputs are meant to vary between calls.
+
         Args:
             prompt: The prompt to send to the model
             temperature: Sampling temperature (0-1)
             max_tokens: Maximum tokens in response
             system_instruction: Optional system instruction
+            use_cache: Reuse a cached completion for an identical request
 
         Returns:
             Generated text response
@@ -67,6 +134,15 @@ class GeminiClient:
                 "Gemini client not initialized. Check GEMINI_API_KEY configuration."
             )
 
+        cache_key = None
+        if use_cache:
+            cache_key = llm_cache.make_key(
+                self.model, prompt, system_instruction, temperature, max_tokens
+            )
+            cached_text = await llm_cache.get(cache_key)
+            if cached_text is not None:
+                return cached_text
+
         try:
             config = {
                 "temperature": temperature,
@@ -75,13 +151,14 @@ class GeminiClient:
             if system_instruction:
                 config["system_instruction"] = system_instruction
 
-            response = self.client.models.generate_content(
+            # Native async call, so the event loop keeps serving other
+            # requests during the API round trip
+            response = await self.client.aio.models.generate_content(
                 model=self.model,
                 contents=prompt,
                 config=config,
             )
-
-            return response.text
+            text = response.text
 
         except Exception as e:
             logger.error(f"Gemini API error: {e}")
@@ -90,11 +167,16 @@ class GeminiClient:
                 details={"error": str(e)},
             )
 
+        if cache_key is not None and text is not None:
+            await llm_cache.set(cache_key, text, ttl=settings.LLM_CACHE_TTL)
+        return text
+
     async def analyze_json(
         self,
         prompt: str,
         data: Dict[str, Any],
         system_instruction: str,
+        use_cache: bool = False,
     ) -> Dict[str, Any]:
         """
         Generate structured JSON response.
@@ -103,6 +185,7 @@ class GeminiClient:
             prompt: Analysis prompt
             data: Data to analyze
             system_instruction: System context/instructions
+            use_cache: Reuse a cached completion for an identical request
 
         Returns:
             Parsed JSON response
@@ -110,42 +193,118 @@ class GeminiClient:
         Raises:
             AIServiceError: If analysis fails
         """
-        full_prompt = f"{prompt}\n\nData to analyze:\n```json\n{json.dumps(data, indent=2, default=str)}\n```"
-
-        full_instruction = (
-            f"{system_instruction}\n\n"
-            "IMPORTANT: Respond ONLY with valid JSON. "
-            "Do not include any markdown formatting, code blocks, or explanatory text. "
-            "Your entire response must be parseable as JSON."
-        )
+        data_blob = orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        full_prompt = f"{prompt}\n\nData to analyze:\n```json\n{data_blob}\n```"
 
         response = await self.generate(
             prompt=full_prompt,
-            system_instruction=full_instruction,
+            system_instruction=system_instruction + _JSON_INSTRUCTION_SUFFIX,
             temperature=0.3,  # Lower temperature for structured output
+            use_cache=use_cache,
         )
 
-        # Clean response and parse JSON
+        return _parse_json_response(response)
+
+    async def submit_batch(
+        self,
+        prompts: List[str],
+        system_instruction: Optional[str] = None,
+        temperature: float = 0.3,
+        max_tokens: int = 2048,
+    ) -> List[Optional[str]]:
+        """
+        Generate completions for many prompts as one Gemini Batch API job.
+
+        Batch jobs are billed at a discount but run asynchronously and may
+        take hours, so this is for scheduled sweeps, not request handlers.
+
+        Args:
+            prompts: Prompts to complete
+            system_instruction: Optional system instruction shared by all prompts
+            temperature: Sampling temperature (0-1)
+            max_tokens: Maximum tokens per response
+
+        Returns:
+            Response texts in prompt order; None where an individual request failed
+
+        Raises:
+            AIServiceError: If the job cannot be run or does not succeed
+        """
+        if not self.client:
+            raise AIServiceError(
+                "Gemini client not initialized. Check GEMINI_API_KEY configuration."
+            )
+        if not prompts:
+            return []
+
+        config = {
+            "temperature": temperature,
+            "max_output_tokens": max_tokens,
+        }
+        if system_instruction:
+            config["system_instruction"] = system_instruction
+        requests = [
+            {"contents": [{"role": "user", "parts": [{"text": prompt}]}], "config": config}
+            for prompt in prompts
+        ]
+
         try:
-            # Remove potential markdown formatting
-            cleaned = response.strip()
-            if cleaned.startswith("```"):
-                # Remove code block markers
-                lines = cleaned.split("\n")
-                cleaned = "\n".join(
-                    line for line in lines
-                    if not line.strip().startswith("```")
-                )
-
-            return json.loads(cleaned)
-
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse AI response as JSON: {response[:500]}")
+            job = await self.client.aio.batches.create(model=self.model, src=requests)
+            delay = BATCH_POLL_INITIAL
+            while job.state.name not in BATCH_DONE_STATES:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, BATCH_POLL_MAX)
+                job = await self.client.aio.batches.get(name=job.name)
+        except Exception as e:
+            logger.error(f"Gemini batch error: {e}")
+            raise AIServiceError(
+                "Failed to run AI batch job",
+                details={"error": str(e)},
+            )
+
+        if job.state.name != "JOB_STATE_SUCCEEDED":
             raise AIServiceError(
-                "AI response was not valid JSON",
-                details={"error": str(e), "response_preview": response[:200]},
+                "AI batch job did not succeed",
+                details={"job": job.name, "state": job.state.name},
             )
 
+        return [
+            item.response.text if item.response is not None else None
+            for item in job.dest.inlined_responses
+        ]
+
+    async def analyze_cvs_bulk(
+        self,
+        cv_texts: List[str],
+        job_requirements: str,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Analyze many CVs against one job's requirements in a single batch job.
+
+        Args:
+            cv_texts: Extracted text of each CV
+            job_requirements: Job description and requirements
+
+        Returns:
+            Analysis results in CV order; None where a CV could not be analyzed
+        """
+        prompts = [
+            CV_ANALYSIS_PROMPT.format(job_requirements=job_requirements, cv_content=cv_text)
+            for cv_text in cv_texts
+        ]
+        responses = await self.submit_batch(
+            prompts,
+            system_instruction=CV_ANALYSIS_SYSTEM + _JSON_INSTRUCTION_SUFFIX,
+        )
+
+        results: List[Optional[Dict[str, Any]]] = []
+        for response in responses:
+            try:
+                results.append(_parse_json_response(response) if response else None)
+            except AIServiceError:
+                results.append(None)
+        return results
+
     async def analyze_cv(
         self,
         cv_text: str,
@@ -161,8 +320,6 @@ class GeminiClient:
         Returns:
             Analysis results including score and recommendations
         """
-        from app.services.ai.prompts import CV_ANALYSIS_PROMPT, CV_ANALYSIS_SYSTEM
-
         prompt = CV_ANALYSIS_PROMPT.format(
             job_requirements=job_requirements,
             cv_content=cv_text,
@@ -172,6 +329,9 @@ class GeminiClient:
             prompt=prompt,
             data={},
             system_instruction=CV_ANALYSIS_SYSTEM,
+            # Only an identical CV and job reuse an earlier analysis; a
+            # similarity match could hand one applicant's analysis to another
+            use_cache=True,
         )
 
     async def summarize_appraisal(
@@ -189,8 +349,6 @@ class GeminiClient:
         Returns:
             Summary with key insights
         """
-        from app.services.ai.prompts import APPRAISAL_SUMMARY_PROMPT, APPRAISAL_SUMMARY_SYSTEM
-
         prompt = APPRAISAL_SUMMARY_PROMPT.format(
             feedback_notes=feedback_notes,
             goals=goals,
@@ -215,8 +373,6 @@ class GeminiClient:
         Returns:
             AI-generated insights
         """
-        from app.services.ai.prompts import HR_INSIGHTS_PROMPT, HR_INSIGHTS_SYSTEM
-
         return await self.analyze_json(
             prompt=HR_INSIGHTS_PROMPT,
             data=metrics,
@@ -236,8 +392,6 @@ class GeminiClient:
         Returns:
             Detected anomalies with recommendations
         """
-        from app.services.ai.prompts import ATTENDANCE_ANOMALY_PROMPT, ATTENDANCE_ANOMALY_SYSTEM
-
         return await self.analyze_json(
             prompt=ATTENDANCE_ANOMALY_PROMPT,
             data=attendance_data,
@@ -252,6 +406,11 @@ class GeminiClient:
         """
         Rank multiple candidates for a job position.
 
+        Candidates are scored in chunks of RANKING_CHUNK_SIZE, with up to
+        GEMINI_MAX_CONCURRENCY chunk calls in flight, and the chunk
+        rankings are merged by score. Chunks that fail are left out; if
+        every chunk fails the first error is raised.
+
         Args:
             job_description: Job title and requirements
             candidates_data: List of candidate info with CV text
@@ -259,8 +418,47 @@ class GeminiClient:
         Returns:
             Rankings with scores and rationale
         """
-        from app.services.ai.prompts import CANDIDATE_RANKING_PROMPT, CANDIDATE_RANKING_SYSTEM
-
+        chunks = [
+            candidates_data[i:i + RANKING_CHUNK_SIZE]
+            for i in range(0, len(candidates_data), RANKING_CHUNK_SIZE)
+        ]
+        if len(chunks) <= 1:
+            return await self._rank_chunk(job_description, candidates_data)
+
+        results = await asyncio.gather(
+            *(self._rank_chunk(job_description, chunk) for chunk in chunks),
+            return_exceptions=True,
+        )
+        ranked = [r for r in results if not isinstance(r, BaseException)]
+        if not ranked:
+            raise results[0]
+        for error in (r for r in results if isinstance(r, BaseException)):
+            logger.warning(f"Candidate ranking chunk failed: {error}")
+
+        rankings = sorted(
+            (entry for result in ranked for entry in result.get("rankings", [])),
+            key=lambda entry: entry.get("overall_score") or 0,
+            reverse=True,
+        )
+        for position, entry in enumerate(rankings, 1):
+            entry["rank"] = position
+
+        # The top pick's rationale comes from the chunk it was ranked in
+        top_pick_rationale = ""
+        if rankings:
+            top_pick_rationale = next(
+                r.get("top_pick_rationale", "") for r in ranked if rankings[0] in r.get("rankings", [])
+            )
+        return {
+            "rankings": rankings,
+            "comparison_notes": " ".join(
+                r.get("comparison_notes", "") for r in ranked if r.get("comparison_notes")
+            ),
+            "top_pick_rationale": top_pick_rationale,
+        }
+
+    async def _rank_chunk(self, job_description: str, candidates: list) -> Dict[str, Any]:
+        """Rank one chunk of candidates in a single Gemini call."""
         # Format candidates data
         formatted_candidates = "\n\n".join([
             f"--- Candidate {i+1} ---\n"
@@ -268,7 +466,7 @@ class GeminiClient:
             f"Name: {c.get('name')}\n"
             f"Email: {c.get('email')}\n"
             f"CV/Notes:\n{c.get('cv_text', 'No CV text available')}"
-            for i, c in enumerate(candidates_data)
+            for i, c in enumerate(candidates)
         ])
 
         prompt = CANDIDATE_RANKING_PROMPT.format(
@@ -276,11 +474,12 @@ class GeminiClient:
             candidates_data=formatted_candidates,
         )
 
-        return await self.analyze_json(
-            prompt=prompt,
-            data={},
-            system_instruction=CANDIDATE_RANKING_SYSTEM,
-        )
+        async with self._sem:
+            return await self.analyze_json(
+                prompt=prompt,
+                data={},
+                system_instruction=CANDIDATE_RANKING_SYSTEM,
+            )
 
     async def health_check(self) -> Dict[str, Any]:
         """Check Gemini API connectivity."""
@@ -311,12 +510,7 @@ class GeminiClient:
             }
 
 
-_gemini_client: Optional[GeminiClient] = None
-
-
+@lru_cache(maxsize=1)
 def get_gemini_client() -> GeminiClient:
     """Get the singleton Gemini client instance."""
-    global _gemini_client
-    if _gemini_client is None:
-        _gemini_client = GeminiClient()
-    return _gemini_client
+    return GeminiClient()
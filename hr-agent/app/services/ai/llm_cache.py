@@ -0,0 +1,49 @@
+"""Exact-match cache for Gemini completions."""
+
+import hashlib
+import unicodedata
+from typing import Optional
+
+import orjson
+
+from app.services.cache import cache_get, cache_set
+from app.services.cache import make_key as cache_key
+
+# Namespace of completion entries in the shared Redis cache
+LLM_CACHE_PREFIX = "llm_completion"
+
+
+def make_key(
+    model: str,
+    prompt: str,
+    system_instruction: Optional[str],
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    """
+    Build the cache key for a completion from every parameter that affects it.
+
+    The prompt is NFC-normalised and stripped so that equivalent texts
+    share an entry; the parameters are hashed so keys stay short.
+    """
+    payload = orjson.dumps(
+        {
+            "model": model.lower(),
+            "prompt": unicodedata.normalize("NFC", prompt).strip(),
+            "system_instruction": system_instruction,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        },
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return cache_key(LLM_CACHE_PREFIX, digest=hashlib.sha256(payload).hexdigest())
+
+
+async def get(key: str) -> Optional[str]:
+    """Get a cached completion, or None on a miss or when Redis is unavailable."""
+    return await cache_get(key)
+
+
+async def set(key: str, text: str, ttl: int) -> None:
+    """Store a completion with an expiry in seconds."""
+    await cache_set(key, text, ttl)
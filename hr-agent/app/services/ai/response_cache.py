@@ -0,0 +1,80 @@
+"""In-process response cache for Gemini calls."""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Default entry lifetime (seconds) and capacity per cache
+RESPONSE_CACHE_TTL = 24 * 3600
+RESPONSE_CACHE_MAXSIZE = 512
+
+
+class ResponseCache:
+    """
+    In-process cache of AI responses keyed by the SHA-256 of the prompt text.
+
+    Only identical texts are matched. Inputs such as appraisal feedback or
+    attendance records differ only in names and figures, so a similarity
+    match would return an answer about someone else.
+    """
+
+    def __init__(
+        self,
+        ttl: float = RESPONSE_CACHE_TTL,
+        maxsize: int = RESPONSE_CACHE_MAXSIZE,
+    ):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # text hash -> (value, monotonic expiry)
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+
+    async def get_or_compute(
+        self,
+        text: str,
+        compute: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Return the cached response for text, computing it on a miss.
+
+        Args:
+            text: Normalised prompt content that determines the response
+            compute: Coroutine factory producing the response on a miss
+        """
+        key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        now = time.monotonic()
+        self._evict_expired(now)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry[0]
+
+        value = await compute()
+        self._entries[key] = (value, now + self.ttl)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    def _evict_expired(self, now: float) -> None:
+        expired = [key for key, (_, expires_at) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+
+
+_caches: Dict[str, ResponseCache] = {}
+
+
+def get_response_cache(name: str) -> ResponseCache:
+    """Get the named process-wide response cache, creating it on first use."""
+    cache = _caches.get(name)
+    if cache is None:
+        cache = _caches[name] = ResponseCache()
+    return cache
@@ -0,0 +1,11 @@
+"""Cache services package."""
+
+from .redis_cache import cached, cache_get, cache_set, invalidate, make_key
+
+__all__ = [
+    "cached",
+    "cache_get",
+    "cache_set",
+    "invalidate",
+    "make_key",
+]
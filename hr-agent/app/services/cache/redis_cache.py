@@ -0,0 +1,128 @@
+"""Redis-backed response cache for slow-changing Odoo aggregates."""
+
+import functools
+import logging
+import time
+from datetime import date
+from typing import Any, Awaitable, Callable, Optional
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Seconds to skip Redis after a connection failure, so an unavailable
+# cache doesn't add a connect timeout to every request
+REDIS_RETRY_AFTER = 30.0
+REDIS_SOCKET_TIMEOUT = 0.5
+
+KEY_PREFIX = "hr-agent:cache:"
+
+# Parameter types that identify a cached result; anything else (injected
+# services and clients) is left out of the key
+KEY_PARAM_TYPES = (str, int, float, bool, date, type(None))
+
+_redis = None
+_disabled_until = 0.0
+
+
+def _get_redis():
+    """Get the shared async Redis client, or None while Redis is unavailable."""
+    global _redis
+    if time.monotonic() < _disabled_until:
+        return None
+    if _redis is None:
+        try:
+            import redis.asyncio as redis_asyncio
+        except ImportError:
+            return None
+        _redis = redis_asyncio.from_url(
+            settings.REDIS_URL,
+            socket_timeout=REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+        )
+    return _redis
+
+
+def _mark_unavailable(error: Exception) -> None:
+    """Back off from Redis for a while after a failure."""
+    global _disabled_until
+    _disabled_until = time.monotonic() + REDIS_RETRY_AFTER
+    logger.warning(f"Redis cache unavailable, bypassing for {REDIS_RETRY_AFTER:.0f}s: {error}")
+
+
+def make_key(prefix: str, **params: Any) -> str:
+    """Build a cache key from a prefix and the full set of query parameters."""
+    parts = ":".join(f"{name}={params[name]}" for name in sorted(params))
+    return f"{KEY_PREFIX}{prefix}:{parts}"
+
+
+async def cache_get(key: str) -> Optional[Any]:
+    """Get a cached JSON value, or None on a miss or when Redis is unavailable."""
+    client = _get_redis()
+    if client is None:
+        return None
+    try:
+        raw = await client.get(key)
+    except Exception as e:
+        _mark_unavailable(e)
+        return None
+    return orjson.loads(raw) if raw is not None else None
+
+
+async def cache_set(key: str, value: Any, ttl: int) -> None:
+    """Store a JSON-serialisable value with an expiry in seconds."""
+    client = _get_redis()
+    if client is None:
+        return
+    try:
+        await client.set(key, orjson.dumps(jsonable_encoder(value)), ex=ttl)
+    except Exception as e:
+        _mark_unavailable(e)
+
+
+async def invalidate(prefix: str) -> None:
+    """Delete every cached entry stored under a prefix."""
+    client = _get_redis()
+    if client is None:
+        return
+    try:
+        keys = [key async for key in client.scan_iter(match=f"{KEY_PREFIX}{prefix}:*")]
+        if keys:
+            await client.delete(*keys)
+    except Exception as e:
+        _mark_unavailable(e)
+
+
+def cached(prefix: str, ttl: int) -> Callable:
+    """
+    Cache an endpoint's JSON result in Redis, keyed by its parameters.
+
+    Only plain query/path values form the key, so endpoints that also take
+    Depends-injected services are keyed the same in every worker. Exceptions
+    are never cached. When Redis is down the endpoint runs uncached.
+
+    Args:
+        prefix: Key namespace, also used by invalidate()
+        ttl: Entry lifetime in seconds
+    """
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(func)
+        async def wrapper(**kwargs: Any) -> Any:
+            key = make_key(
+                prefix,
+                **{name: v for name, v in kwargs.items() if isinstance(v, KEY_PARAM_TYPES)},
+            )
+            hit = await cache_get(key)
+            if hit is not None:
+                return hit
+            result = await func(**kwargs)
+            await cache_set(key, result, ttl)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -1,23 +1,74 @@
 """CV/Document Parser - Extract text from PDF and DOCX files."""
 
+import asyncio
 import io
 import logging
-from typing import Optional
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Optional, Union
 
 logger = logging.getLogger(__name__)
 
+# File types parse_cv_bytes can extract text from
+SUPPORTED_CV_TYPES = frozenset({"pdf", "docx"})
 
-async def parse_cv_file(content: bytes, file_type: str) -> str:
+# Worker processes for PDF/DOCX text extraction, which is CPU-bound pure Python
+CV_PARSE_WORKERS = os.cpu_count() or 1
+
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Get the shared CV parsing process pool, starting it on first use."""
+    global _parse_pool
+    if _parse_pool is None:
+        # Started after the Odoo and to_thread worker threads exist; forking a
+        # threaded process can deadlock the child on inherited locks
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=CV_PARSE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _parse_pool
+
+
+def shutdown_parse_pool() -> None:
+    """Stop the CV parsing worker processes, if they were started."""
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+        _parse_pool = None
+
+
+def _as_stream(content: Union[bytes, BinaryIO]) -> BinaryIO:
+    """Wrap raw bytes in a stream; pass file objects through unchanged."""
+    if isinstance(content, (bytes, bytearray)):
+        return io.BytesIO(content)
+    return content
+
+
+async def parse_cv_file(content: Union[bytes, BinaryIO], file_type: str) -> str:
     """
     Parse CV file and extract text content.
 
+    Extraction runs in a worker process so it neither blocks the event loop
+    nor holds the GIL; file objects are read into bytes to cross over.
+
     Args:
-        content: File content as bytes
+        content: File content as bytes or a readable binary file object
         file_type: File extension (pdf or docx)
 
     Returns:
         Extracted text content
     """
+    if not isinstance(content, (bytes, bytearray)):
+        content = await asyncio.to_thread(content.read)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_parse_pool(), parse_cv_bytes, content, file_type)
+
+
+def parse_cv_bytes(content: Union[bytes, BinaryIO], file_type: str) -> str:
+    """Extract CV text synchronously; the entry point run in the parse pool."""
     if file_type.lower() == "pdf":
         return extract_text_from_pdf(content)
     elif file_type.lower() == "docx":
@@ -26,13 +77,12 @@ async def parse_cv_file(content: bytes, file_type: str) -> str:
         raise ValueError(f"Unsupported file type: {file_type}")
 
 
-def extract_text_from_pdf(content: bytes) -> str:
+def extract_text_from_pdf(content: Union[bytes, BinaryIO]) -> str:
     """Extract text from PDF file."""
     try:
         from PyPDF2 import PdfReader
 
-        pdf_file = io.BytesIO(content)
-        reader = PdfReader(pdf_file)
+        reader = PdfReader(_as_stream(content))
 
         text_parts = []
         for page in reader.pages:
@@ -51,13 +101,12 @@ def extract_text_from_pdf(content: bytes) -> str:
         raise
 
 
-def extract_text_from_docx(content: bytes) -> str:
+def extract_text_from_docx(content: Union[bytes, BinaryIO]) -> str:
     """Extract text from DOCX file."""
     try:
         from docx import Document
 
-        docx_file = io.BytesIO(content)
-        doc = Document(docx_file)
+        doc = Document(_as_stream(content))
 
         text_parts = []
         for paragraph in doc.paragraphs:
@@ -1,14 +1,32 @@
 """Report Exporter - Generate PDF and Excel reports."""
 
-import io
 import logging
+import tempfile
 from datetime import date
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Dict, Iterator, Optional
 
 logger = logging.getLogger(__name__)
 
+# Exports larger than this are spooled to disk instead of held in memory
+EXPORT_SPOOL_SIZE = 1024 * 1024
 
-def generate_pdf_report(report_data: Dict[str, Any]) -> bytes:
+# Bytes sent per chunk when streaming an export to the client
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+def _spooled_file() -> BinaryIO:
+    """Get a temporary file that stays in memory until it outgrows EXPORT_SPOOL_SIZE."""
+    return tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_SIZE)
+
+
+def iter_chunks(file: BinaryIO, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield a file's content in chunks, closing it once exhausted."""
+    with file:
+        while chunk := file.read(chunk_size):
+            yield chunk
+
+
+def generate_pdf_report(report_data: Dict[str, Any]) -> BinaryIO:
     """
     Generate PDF report from report data.
 
@@ -16,8 +34,9 @@ def generate_pdf_report(report_data: Dict[str, Any]) -> bytes:
         report_data: Report data dictionary
 
     Returns:
-        PDF content as bytes
+        PDF content as a file object positioned at the start
     """
+    buffer = _spooled_file()
     try:
         from reportlab.lib.pagesizes import letter, A4
         from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -25,7 +44,6 @@ def generate_pdf_report(report_data: Dict[str, Any]) -> bytes:
         from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
         from reportlab.lib import colors
 
-        buffer = io.BytesIO()
         doc = SimpleDocTemplate(buffer, pagesize=A4)
         styles = getSampleStyleSheet()
         story = []
@@ -107,18 +125,21 @@ def generate_pdf_report(report_data: Dict[str, Any]) -> bytes:
             story.append(Paragraph(str(data), styles["Normal"]))
 
         doc.build(story)
-        return buffer.getvalue()
 
     except ImportError:
         logger.error("reportlab not installed. Cannot generate PDF reports.")
         # Return a simple text-based PDF alternative
-        return b"%PDF-1.4 (Report generation requires reportlab library)"
+        buffer.write(b"%PDF-1.4 (Report generation requires reportlab library)")
     except Exception as e:
+        buffer.close()
         logger.error(f"Failed to generate PDF: {e}")
         raise
 
+    buffer.seek(0)
+    return buffer
 
-def generate_excel_report(report_data: Dict[str, Any]) -> bytes:
+
+def generate_excel_report(report_data: Dict[str, Any]) -> BinaryIO:
     """
     Generate Excel report from report data.
 
@@ -126,8 +147,9 @@ def generate_excel_report(report_data: Dict[str, Any]) -> bytes:
         report_data: Report data dictionary
 
     Returns:
-        Excel content as bytes
+        Excel content as a file object positioned at the start
     """
+    buffer = _spooled_file()
     try:
         from openpyxl import Workbook
         from openpyxl.styles import Font, Alignment, PatternFill
@@ -198,13 +220,15 @@ def generate_excel_report(report_data: Dict[str, Any]) -> bytes:
         ws.column_dimensions["C"].width = 25
         ws.column_dimensions["D"].width = 20
 
-        buffer = io.BytesIO()
         wb.save(buffer)
-        return buffer.getvalue()
 
     except ImportError:
         logger.error("openpyxl not installed. Cannot generate Excel reports.")
-        return b"Excel generation requires openpyxl library"
+        buffer.write(b"Excel generation requires openpyxl library")
     except Exception as e:
+        buffer.close()
         logger.error(f"Failed to generate Excel: {e}")
         raise
+
+    buffer.seek(0)
+    return buffer
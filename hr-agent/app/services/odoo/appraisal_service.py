@@ -1,8 +1,11 @@
 """Appraisal Service - Odoo Integration for Performance Appraisals."""
 
+import base64
 import logging
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import orjson
 
 from app.config import settings
 from app.core.constants import (
@@ -12,9 +15,43 @@ from app.core.constants import (
 )
 from app.core.exceptions import AppraisalNotFoundError, OdooModuleNotFoundError
 from app.services.odoo.client import get_odoo_client
+from app.services.odoo.filter_compiler import build_domain
 
 logger = logging.getLogger(__name__)
 
+# Appraisal IDs looked up per Odoo call when sending reminders
+REMINDER_CHUNK_SIZE = 50
+
+# Appraisal fields read for the full detail view
+APPRAISAL_DETAIL_FIELDS = (
+    "id", "employee_id", "manager_id", "department_id",
+    "date_close", "state", "create_date", "note",
+)
+
+# Goal fields read alongside an appraisal's detail view
+APPRAISAL_GOAL_FIELDS = [
+    "id", "name", "description", "deadline", "progression", "employee_id",
+]
+
+
+def encode_cursor(create_date: str, record_id: int) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor."""
+    return base64.urlsafe_b64encode(orjson.dumps([create_date, record_id])).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        create_date, record_id = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return str(create_date), int(record_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
 
 class AppraisalService:
     """Service for appraisal operations via Odoo."""
@@ -75,22 +112,38 @@ class AppraisalService:
         filters: Any,
         page: int = 1,
         page_size: int = 20,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Get appraisals with filters."""
+        """
+        Get appraisals with filters, newest first.
+
+        With a cursor the page starts after the row it encodes (keyset
+        pagination) and `page` is ignored; otherwise `page` selects an offset.
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
         self._ensure_appraisal_module()
 
-        domain = []
-        if filters.employee_id:
-            domain.append(("employee_id", "=", filters.employee_id))
-        if filters.manager_id:
-            domain.append(("manager_id", "=", filters.manager_id))
-        if filters.department_id:
-            domain.append(("department_id", "=", filters.department_id))
-        if filters.state:
-            domain.append(("state", "=", filters.state))
+        domain = build_domain(
+            employee_id=filters.employee_id,
+            manager_id=filters.manager_id,
+            department_id=filters.department_id,
+            state=filters.state,
+        )
 
         total = self.client.search_count(ODOO_MODEL_APPRAISAL, domain)
 
+        offset = (page - 1) * page_size
+        if cursor:
+            last_date, last_id = decode_cursor(cursor)
+            domain += [
+                "|",
+                ("create_date", "<", last_date),
+                "&", ("create_date", "=", last_date), ("id", "<", last_id),
+            ]
+            offset = 0
+
         appraisals = self.client.search_read(
             ODOO_MODEL_APPRAISAL,
             domain,
@@ -99,8 +152,8 @@ class AppraisalService:
                 "date_close", "state", "create_date"
             ],
             limit=page_size,
-            offset=(page - 1) * page_size,
-            order="create_date desc",
+            offset=offset,
+            order="create_date desc, id desc",
         )
 
         items = [
@@ -125,6 +178,11 @@ class AppraisalService:
             "page": page,
             "page_size": page_size,
             "total_pages": (total + page_size - 1) // page_size,
+            "next_cursor": (
+                encode_cursor(appraisals[-1]["create_date"], appraisals[-1]["id"])
+                if len(appraisals) == page_size
+                else None
+            ),
         }
 
     def get_pending_appraisals(
@@ -173,17 +231,27 @@ class AppraisalService:
             for app in appraisals
         ]
 
-    def get_appraisal_by_id(self, appraisal_id: int) -> Optional[Dict[str, Any]]:
-        """Get detailed appraisal with goals and notes."""
+    def get_appraisal_by_id(
+        self,
+        appraisal_id: int,
+        fields: Optional[Sequence[str]] = None,
+        include_goals: bool = True,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get detailed appraisal with goals and notes.
+
+        Args:
+            appraisal_id: Appraisal ID
+            fields: Appraisal fields to read (defaults to the full detail set);
+                keys built from fields not read come back empty
+            include_goals: Whether to fetch the employee's goals
+        """
         self._ensure_appraisal_module()
 
         appraisals = self.client.search_read(
             ODOO_MODEL_APPRAISAL,
             [("id", "=", appraisal_id)],
-            fields=[
-                "id", "employee_id", "manager_id", "department_id",
-                "date_close", "state", "create_date", "note"
-            ],
+            fields=list(fields or APPRAISAL_DETAIL_FIELDS),
         )
 
         if not appraisals:
@@ -191,13 +259,19 @@ class AppraisalService:
 
         app = appraisals[0]
 
-        # Get goals if model exists
+        # Get goals if model exists. Notes are the appraisal's own note field,
+        # so a detail view costs at most this one extra read; the goal lookup
+        # needs the employee from the appraisal and cannot run alongside it.
         goals = []
-        if self.client.is_model_available(ODOO_MODEL_APPRAISAL_GOAL):
+        if (
+            include_goals
+            and app.get("employee_id")
+            and self.client.is_model_available(ODOO_MODEL_APPRAISAL_GOAL)
+        ):
             goal_records = self.client.search_read(
                 ODOO_MODEL_APPRAISAL_GOAL,
-                [("employee_id", "=", app["employee_id"][0] if app.get("employee_id") else 0)],
-                fields=["id", "name", "description", "deadline", "progression", "employee_id"],
+                [("employee_id", "=", app["employee_id"][0])],
+                fields=APPRAISAL_GOAL_FIELDS,
             )
             goals = [
                 {
@@ -300,21 +374,29 @@ Rating Suggestion: {summary.get('overall_rating_suggestion', 'N/A')}
         """Send reminders for pending appraisals."""
         self._ensure_appraisal_module()
 
-        # Get pending appraisals
+        # Get pending appraisals, in bounded chunks for explicit ID lists
         if appraisal_ids:
-            domain = [("id", "in", appraisal_ids), ("state", "in", ["new", "pending"])]
+            domains = [
+                [
+                    ("id", "in", appraisal_ids[i:i + REMINDER_CHUNK_SIZE]),
+                    ("state", "in", ["new", "pending"]),
+                ]
+                for i in range(0, len(appraisal_ids), REMINDER_CHUNK_SIZE)
+            ]
         else:
             deadline = date.today() + timedelta(days=days_until_deadline)
-            domain = [
+            domains = [[
                 ("state", "in", ["new", "pending"]),
                 ("date_close", "<=", deadline.isoformat()),
-            ]
-
-        appraisals = self.client.search_read(
-            ODOO_MODEL_APPRAISAL,
-            domain,
-            fields=["id", "employee_id", "manager_id", "date_close"],
-        )
+            ]]
+
+        appraisals = []
+        for domain in domains:
+            appraisals.extend(self.client.search_read(
+                ODOO_MODEL_APPRAISAL,
+                domain,
+                fields=["id", "employee_id", "manager_id", "date_close"],
+            ))
 
         # Send reminders (placeholder - would integrate with notification service)
         reminder_count = len(appraisals)
@@ -2,7 +2,7 @@
 
 import logging
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from app.config import settings
 from app.core.constants import (
@@ -15,6 +15,7 @@ from app.core.constants import (
 )
 from app.core.exceptions import LeaveRequestNotFoundError, OdooModuleNotFoundError
 from app.services.odoo.client import get_odoo_client
+from app.services.odoo.filter_compiler import build_domain
 
 logger = logging.getLogger(__name__)
 
@@ -53,9 +54,8 @@ class AttendanceService:
         """Get pending leave requests."""
         self._ensure_leave_module()
 
-        domain = [("state", "=", "confirm")]  # Awaiting approval
-        if department_id:
-            domain.append(("department_id", "=", department_id))
+        # Awaiting approval
+        domain = build_domain(state="confirm", department_id=department_id)
 
         leaves = self.client.search_read(
             ODOO_MODEL_LEAVE,
@@ -567,6 +567,19 @@ class AttendanceService:
         date_to: Optional[date] = None,
     ) -> List[Dict[str, Any]]:
         """Get department-wise attendance report."""
+        return list(self.iter_department_report(date_from, date_to))
+
+    def iter_department_report(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily compute department attendance summaries one department at a time.
+
+        Module checks and the department lookup run before this returns, so
+        errors surface before any summary is consumed.
+        """
         self._ensure_attendance_module()
 
         departments = self.client.search_read(
@@ -575,13 +588,10 @@ class AttendanceService:
             fields=["id", "name"],
         )
 
-        result = []
-        for dept in departments:
-            summary = self.get_department_attendance(dept["id"], date_from)
-            if summary:
-                result.append(summary)
-
-        return result
+        summaries = (
+            self.get_department_attendance(dept["id"], date_from) for dept in departments
+        )
+        return (summary for summary in summaries if summary)
 
 
 _service: Optional[AttendanceService] = None
@@ -1,18 +1,31 @@
-"""Odoo XML-RPC Client Wrapper for Odoo 17+."""
+"""Odoo JSON-RPC Client Wrapper for Odoo 17+."""
 
+import itertools
 import logging
-import xmlrpc.client
 from typing import Any, Dict, List, Optional, Set
 
+import httpx
+import orjson
+
 from app.config import settings
 from app.core.exceptions import OdooAuthenticationError, OdooConnectionError, OdooModuleNotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Seconds before an Odoo RPC is abandoned
+ODOO_TIMEOUT = 30.0
+
+# Connection pool shared by every service. Handlers call Odoo from worker
+# threads, so allow roughly one connection per thread and keep idle sockets
+# long enough to span gaps between requests (httpx defaults to 5s).
+ODOO_POOL_SIZE = 40
+ODOO_POOL_KEEPALIVE = 20
+ODOO_KEEPALIVE_EXPIRY = 120.0
+
 
 class OdooClient:
     """
-    Singleton Odoo XML-RPC client for connecting to Odoo 17+.
+    Singleton Odoo JSON-RPC client for connecting to Odoo 17+.
     Handles authentication and provides execute_kw wrapper.
     Includes module availability checking for graceful degradation.
     """
@@ -34,8 +47,17 @@ class OdooClient:
         self.username = settings.ODOO_USER
         self.password = settings.ODOO_PASSWORD
         self._uid: Optional[int] = None
-        self._common: Optional[xmlrpc.client.ServerProxy] = None
-        self._models: Optional[xmlrpc.client.ServerProxy] = None
+        self._http = httpx.Client(
+            base_url=self.url,
+            headers={"Content-Type": "application/json"},
+            timeout=ODOO_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=ODOO_POOL_SIZE,
+                max_keepalive_connections=ODOO_POOL_KEEPALIVE,
+                keepalive_expiry=ODOO_KEEPALIVE_EXPIRY,
+            ),
+        )
+        self._rpc_ids = itertools.count(1)
         self._available_models: Set[str] = set()
         self._initialized = True
 
@@ -51,13 +73,8 @@ class OdooClient:
             OdooAuthenticationError: If authentication fails
         """
         try:
-            self._common = xmlrpc.client.ServerProxy(
-                f"{self.url}/xmlrpc/2/common",
-                allow_none=True,
-            )
-
             # Test connection by getting version
-            version = self._common.version()
+            version = self._call("common", "version")
             logger.info(f"Connected to Odoo {version.get('server_version', 'unknown')}")
 
         except Exception as e:
@@ -68,7 +85,9 @@ class OdooClient:
             )
 
         try:
-            self._uid = self._common.authenticate(
+            self._uid = self._call(
+                "common",
+                "authenticate",
                 self.db,
                 self.username,
                 self.password,
@@ -81,11 +100,6 @@ class OdooClient:
                     details={"db": self.db, "user": self.username},
                 )
 
-            self._models = xmlrpc.client.ServerProxy(
-                f"{self.url}/xmlrpc/2/object",
-                allow_none=True,
-            )
-
             logger.info(f"Authenticated as user {self.username} (uid: {self._uid})")
 
             # Check available modules
@@ -102,6 +116,32 @@ class OdooClient:
                 details={"error": str(e)},
             )
 
+    def _call(self, service: str, method: str, *args: Any) -> Any:
+        """
+        POST a JSON-RPC call to Odoo's /jsonrpc endpoint.
+
+        Raises:
+            RuntimeError: If Odoo returns an error payload
+        """
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "call",
+            "params": {"service": service, "method": method, "args": args},
+            "id": next(self._rpc_ids),
+        }
+        response = self._http.post("/jsonrpc", content=orjson.dumps(payload))
+        response.raise_for_status()
+        reply = orjson.loads(response.content)
+        error = reply.get("error")
+        if error:
+            data = error.get("data") or {}
+            raise RuntimeError(data.get("message") or error.get("message") or "Odoo RPC error")
+        return reply.get("result")
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._http.close()
+
     def _check_available_modules(self) -> None:
         """Check which HR modules are available in Odoo."""
         models_to_check = [
@@ -119,15 +159,23 @@ class OdooClient:
             "calendar.event",
         ]
 
+        # One lookup for every model rather than a round trip per model
+        try:
+            installed = self.execute_kw(
+                "ir.model",
+                "search_read",
+                [[("model", "in", models_to_check)]],
+                {"fields": ["model"]},
+            )
+        except Exception as e:
+            logger.warning(f"Could not check available Odoo models: {e}")
+            installed = []
+
+        self._available_models.update(record["model"] for record in installed)
         for model in models_to_check:
-            try:
-                # Try to get model info
-                self.execute_kw("ir.model", "search", [[("model", "=", model)]], {"limit": 1})
-                result = self.execute_kw("ir.model", "search_count", [[("model", "=", model)]])
-                if result > 0:
-                    self._available_models.add(model)
-                    logger.debug(f"Model {model} is available")
-            except Exception:
+            if model in self._available_models:
+                logger.debug(f"Model {model} is available")
+            else:
                 logger.debug(f"Model {model} is not available")
 
         logger.info(f"Available Odoo models: {self._available_models}")
@@ -153,7 +201,7 @@ class OdooClient:
 
     def ensure_connected(self) -> None:
         """Ensure client is connected, reconnect if necessary."""
-        if not self._uid or not self._models:
+        if not self._uid:
             self.connect()
 
     def execute_kw(
@@ -164,7 +212,7 @@ class OdooClient:
         kwargs: Optional[Dict[str, Any]] = None,
     ) -> Any:
         """
-        Execute Odoo model method via XML-RPC.
+        Execute Odoo model method via JSON-RPC.
 
         Args:
             model: Odoo model name (e.g., 'hr.employee')
@@ -181,7 +229,9 @@ class OdooClient:
         self.ensure_connected()
 
         try:
-            return self._models.execute_kw(
+            return self._call(
+                "object",
+                "execute_kw",
                 self.db,
                 self._uid,
                 self.password,
@@ -295,6 +345,29 @@ class OdooClient:
         """
         return self.execute_kw(model, "search_count", [domain])
 
+    def read_group(
+        self,
+        model: str,
+        domain: List,
+        fields: List[str],
+        groupby: List[str],
+    ) -> List[Dict]:
+        """
+        Aggregate records server-side, one row per group.
+
+        Args:
+            model: Odoo model name
+            domain: Search domain
+            fields: Aggregates to compute (e.g. ["worked_hours:sum"])
+            groupby: Fields to group by
+
+        Returns:
+            List of group dictionaries, each with a "<groupby>_count" entry
+        """
+        return self.execute_kw(
+            model, "read_group", [domain], {"fields": fields, "groupby": groupby}
+        )
+
     def create(self, model: str, values: Dict) -> int:
         """
         Create a new record.
@@ -344,7 +417,7 @@ class OdooClient:
         """
         try:
             self.ensure_connected()
-            version = self._common.version()
+            version = self._call("common", "version")
             return {
                 "connected": True,
                 "server_version": version.get("server_version"),
@@ -3,7 +3,8 @@
 import logging
 import uuid
 from datetime import date, timedelta
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, BinaryIO, Dict, List, Optional
 
 from app.config import settings
 from app.core.constants import (
@@ -36,22 +37,20 @@ class EmployeeService:
         # By department
         by_department = self.get_headcount_by_department(as_of_date)
 
-        # By job title
-        employees = self.client.search_read(
+        # By job title, counted by Odoo rather than by reading every employee
+        job_groups = self.client.read_group(
             ODOO_MODEL_EMPLOYEE,
-            [("active", "=", True)],
+            [("active", "=", True), ("job_id", "!=", False)],
             fields=["job_id"],
+            groupby=["job_id"],
+        )
+        by_job = sorted(
+            (
+                {"job_title": group["job_id"][1], "count": group["job_id_count"]}
+                for group in job_groups
+            ),
+            key=lambda x: -x["count"],
         )
-        job_counts = {}
-        for emp in employees:
-            if emp.get("job_id"):
-                job_name = emp["job_id"][1]
-                job_counts[job_name] = job_counts.get(job_name, 0) + 1
-
-        by_job = [
-            {"job_title": job, "count": count}
-            for job, count in sorted(job_counts.items(), key=lambda x: -x[1])
-        ]
 
         # New hires this month
         month_start = report_date.replace(day=1)
@@ -80,18 +79,24 @@ class EmployeeService:
             fields=["id", "name", "manager_id"],
         )
 
-        result = []
-        for dept in departments:
-            count = self.client.search_count(
-                ODOO_MODEL_EMPLOYEE,
-                [("department_id", "=", dept["id"]), ("active", "=", True)],
-            )
-            result.append({
+        # One grouped count for all departments instead of a count per department
+        groups = self.client.read_group(
+            ODOO_MODEL_EMPLOYEE,
+            [("active", "=", True), ("department_id", "!=", False)],
+            fields=["department_id"],
+            groupby=["department_id"],
+        )
+        counts = {group["department_id"][0]: group["department_id_count"] for group in groups}
+
+        result = [
+            {
                 "department_id": dept["id"],
                 "department_name": dept["name"],
                 "manager_name": dept["manager_id"][1] if dept.get("manager_id") else None,
-                "employee_count": count,
-            })
+                "employee_count": counts.get(dept["id"], 0),
+            }
+            for dept in departments
+        ]
 
         return sorted(result, key=lambda x: -x["employee_count"])
 
@@ -240,7 +245,7 @@ class EmployeeService:
             for r in reports[:limit]
         ]
 
-    def export_report_to_pdf(self, report_id: str) -> Optional[bytes]:
+    def export_report_to_pdf(self, report_id: str) -> Optional[BinaryIO]:
         """Export report to PDF."""
         report = self._reports.get(report_id)
         if not report:
@@ -250,7 +255,7 @@ class EmployeeService:
         from app.services.document.report_exporter import generate_pdf_report
         return generate_pdf_report(report)
 
-    def export_report_to_excel(self, report_id: str) -> Optional[bytes]:
+    def export_report_to_excel(self, report_id: str) -> Optional[BinaryIO]:
         """Export report to Excel."""
         report = self._reports.get(report_id)
         if not report:
@@ -261,12 +266,7 @@ class EmployeeService:
         return generate_excel_report(report)
 
 
-_service: Optional[EmployeeService] = None
-
-
+@lru_cache(maxsize=1)
 def get_employee_service() -> EmployeeService:
     """Get the singleton employee service."""
-    global _service
-    if _service is None:
-        _service = EmployeeService()
-    return _service
+    return EmployeeService()
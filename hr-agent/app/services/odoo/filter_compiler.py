@@ -0,0 +1,28 @@
+"""Translate request filters into Odoo search domains."""
+
+from functools import lru_cache
+from typing import Any, FrozenSet, List, Tuple
+
+FilterKey = FrozenSet[Tuple[str, Any]]
+Domain = Tuple[Tuple[str, str, Any], ...]
+
+
+def filter_key(**values: Any) -> FilterKey:
+    """
+    Build the hashable canonical form of an equality filter.
+
+    Empty values (None, 0, "") are dropped, so requests that differ only in
+    omitted filters share a key.
+    """
+    return frozenset((field, value) for field, value in values.items() if value)
+
+
+@lru_cache(maxsize=512)
+def compile_filter(key: FilterKey) -> Domain:
+    """Compile a filter key into an equality domain, fields in sorted order."""
+    return tuple((field, "=", value) for field, value in sorted(key))
+
+
+def build_domain(**values: Any) -> List[Tuple[str, str, Any]]:
+    """Get a fresh, extendable domain list for an equality filter."""
+    return list(compile_filter(filter_key(**values)))
@@ -1,9 +1,12 @@
 """Recruitment Service - Odoo Integration for HR Recruitment."""
 
+import asyncio
 import base64
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
 
 from app.config import settings
 from app.core.constants import (
@@ -16,15 +19,52 @@ from app.core.constants import (
 )
 from app.core.exceptions import ApplicantNotFoundError, JobNotFoundError, OdooModuleNotFoundError
 from app.services.odoo.client import get_odoo_client
+from app.services.odoo.filter_compiler import build_domain
 
 logger = logging.getLogger(__name__)
 
+# Most recent applicants considered when ranking a job's candidates
+RANKING_CANDIDATE_LIMIT = 100
+
+# Applicants screened per nightly CV screening run, and how far back it looks
+CV_SCREENING_LIMIT = 200
+CV_SCREENING_LOOKBACK_DAYS = 7
+
+# Opening line of the analysis written by update_applicant_analysis
+AI_ANALYSIS_MARKER = "AI Analysis Score:"
+
+# Seconds an applicant total is reused across pages of the same listing
+APPLICANT_COUNT_TTL = 30.0
+APPLICANT_COUNT_CACHE_SIZE = 256
+
+
+def _text(value: Any) -> Optional[str]:
+    """Map Odoo's False for an empty text field to None."""
+    return None if value is False else value
+
+
+def _format_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert an hr.job record into the JobPosition shape."""
+    return {
+        "id": job["id"],
+        "name": job["name"],
+        "department_id": job["department_id"][0] if job.get("department_id") else None,
+        "department_name": job["department_id"][1] if job.get("department_id") else None,
+        "description": _text(job.get("description")),
+        "requirements": _text(job.get("requirements")),
+        "no_of_recruitment": job.get("no_of_recruitment", 0),
+        "no_of_hired_employee": job.get("no_of_hired_employee", 0),
+        "state": "open" if job.get("active", True) else "closed",
+    }
+
 
 class RecruitmentService:
     """Service for recruitment operations via Odoo."""
 
     def __init__(self):
         self.client = get_odoo_client()
+        # Applicant counts by search domain: domain -> (expires_at, total)
+        self._applicant_counts: Dict[Tuple[Any, ...], Tuple[float, int]] = {}
 
     def _ensure_recruitment_module(self):
         """Ensure recruitment module is available."""
@@ -59,20 +99,7 @@ class RecruitmentService:
             ],
         )
 
-        return [
-            {
-                "id": job["id"],
-                "name": job["name"],
-                "department_id": job["department_id"][0] if job.get("department_id") else None,
-                "department_name": job["department_id"][1] if job.get("department_id") else None,
-                "description": job.get("description"),
-                "requirements": job.get("requirements"),
-                "no_of_recruitment": job.get("no_of_recruitment", 0),
-                "no_of_hired_employee": job.get("no_of_hired_employee", 0),
-                "state": "open" if job.get("active", True) else "closed",
-            }
-            for job in jobs
-        ]
+        return [_format_job(job) for job in jobs]
 
     def get_job_by_id(self, job_id: int) -> Optional[Dict[str, Any]]:
         """Get a specific job by ID."""
@@ -91,18 +118,7 @@ class RecruitmentService:
         if not jobs:
             return None
 
-        job = jobs[0]
-        return {
-            "id": job["id"],
-            "name": job["name"],
-            "department_id": job["department_id"][0] if job.get("department_id") else None,
-            "department_name": job["department_id"][1] if job.get("department_id") else None,
-            "description": job.get("description"),
-            "requirements": job.get("requirements"),
-            "no_of_recruitment": job.get("no_of_recruitment", 0),
-            "no_of_hired_employee": job.get("no_of_hired_employee", 0),
-            "state": "open" if job.get("active", True) else "closed",
-        }
+        return _format_job(jobs[0])
 
     def get_applicants(
         self,
@@ -113,17 +129,13 @@ class RecruitmentService:
         """Get applicants with filters and pagination."""
         self._ensure_recruitment_module()
 
-        domain = []
-        if filters.job_id:
-            domain.append(("job_id", "=", filters.job_id))
-        if filters.stage_id:
-            domain.append(("stage_id", "=", filters.stage_id))
+        domain = build_domain(job_id=filters.job_id, stage_id=filters.stage_id)
         if filters.search:
             domain.append("|")
             domain.append(("partner_name", "ilike", filters.search))
             domain.append(("email_from", "ilike", filters.search))
 
-        total = self.client.search_count(ODOO_MODEL_APPLICANT, domain)
+        total = self._count_applicants(domain)
 
         applicants = self.client.search_read(
             ODOO_MODEL_APPLICANT,
@@ -162,6 +174,20 @@ class RecruitmentService:
             "total_pages": (total + page_size - 1) // page_size,
         }
 
+    def _count_applicants(self, domain: List[Any]) -> int:
+        """Count applicants matching a domain, reusing counts for APPLICANT_COUNT_TTL seconds."""
+        key = tuple(domain)
+        now = time.monotonic()
+        hit = self._applicant_counts.get(key)
+        if hit and hit[0] > now:
+            return hit[1]
+
+        total = self.client.search_count(ODOO_MODEL_APPLICANT, domain)
+        if len(self._applicant_counts) >= APPLICANT_COUNT_CACHE_SIZE:
+            self._applicant_counts.clear()
+        self._applicant_counts[key] = (now + APPLICANT_COUNT_TTL, total)
+        return total
+
     def get_applicant_by_id(self, applicant_id: int) -> Optional[Dict[str, Any]]:
         """Get detailed applicant info."""
         self._ensure_recruitment_module()
@@ -239,7 +265,7 @@ class RecruitmentService:
         name: str,
         email: str,
         phone: Optional[str] = None,
-        cv_content: bytes = None,
+        cv_content: Union[bytes, BinaryIO, None] = None,
         cv_filename: str = None,
         cv_text: str = None,
     ) -> Dict[str, Any]:
@@ -259,6 +285,7 @@ class RecruitmentService:
             values["applicant_notes"] = cv_text[:5000]  # Store first 5000 chars in applicant notes
 
         applicant_id = self.client.create(ODOO_MODEL_APPLICANT, values)
+        self._applicant_counts.clear()
 
         # Attach CV if provided
         if cv_content and cv_filename:
@@ -268,7 +295,9 @@ class RecruitmentService:
                     "name": cv_filename,
                     "res_model": ODOO_MODEL_APPLICANT,
                     "res_id": applicant_id,
-                    "datas": base64.b64encode(cv_content).decode("utf-8"),
+                    "datas": base64.b64encode(
+                        cv_content if isinstance(cv_content, bytes) else cv_content.read()
+                    ).decode("utf-8"),
                 },
             )
 
@@ -285,9 +314,12 @@ class RecruitmentService:
         if count == 0:
             raise ApplicantNotFoundError(f"Applicant {applicant_id} not found")
 
-        return self.client.write(
+        result = self.client.write(
             ODOO_MODEL_APPLICANT, [applicant_id], {"stage_id": stage_id}
         )
+        # The applicant moves between stage_id-filtered listings
+        self._applicant_counts.clear()
+        return result
 
     def update_applicant_analysis(
         self, applicant_id: int, analysis: Dict[str, Any]
@@ -297,7 +329,7 @@ class RecruitmentService:
 
         # Store as applicant_notes field (Odoo 18)
         summary = f"""
-AI Analysis Score: {analysis.get('overall_score', 'N/A')}/100
+{AI_ANALYSIS_MARKER} {analysis.get('overall_score', 'N/A')}/100
 Recommendation: {analysis.get('hiring_recommendation', 'N/A')}
 
 Strengths: {', '.join(analysis.get('strengths', []))}
@@ -311,24 +343,62 @@ Summary: {analysis.get('summary', '')}
             {"applicant_notes": summary},
         )
 
+    def get_unanalyzed_applicants(self) -> List[Dict[str, Any]]:
+        """Get recent applicants whose CV text has not been AI-analyzed yet."""
+        self._ensure_recruitment_module()
+
+        since = datetime.now() - timedelta(days=CV_SCREENING_LOOKBACK_DAYS)
+        applicants = self.client.search_read(
+            ODOO_MODEL_APPLICANT,
+            [
+                ("job_id", "!=", False),
+                ("applicant_notes", "!=", False),
+                ("applicant_notes", "not ilike", AI_ANALYSIS_MARKER),
+                ("create_date", ">=", since.strftime("%Y-%m-%d %H:%M:%S")),
+            ],
+            fields=["id", "job_id", "applicant_notes"],
+            limit=CV_SCREENING_LIMIT,
+            order="create_date desc",
+        )
+        return [
+            {
+                "id": app["id"],
+                "job_id": app["job_id"][0],
+                "cv_text": app["applicant_notes"],
+            }
+            for app in applicants
+        ]
+
+    def _get_ranking_candidates(self, job_id: int) -> List[Dict[str, Any]]:
+        """Get the newest applicants for a job with just the fields ranking uses."""
+        applicants = self.client.search_read(
+            ODOO_MODEL_APPLICANT,
+            [("job_id", "=", job_id)],
+            fields=["id", "partner_name", "email_from", "applicant_notes"],
+            limit=RANKING_CANDIDATE_LIMIT,
+            order="create_date desc",
+        )
+        return [
+            {
+                "id": app["id"],
+                "name": app.get("partner_name", "Unknown"),
+                "email": app.get("email_from"),
+                "cv_text": app.get("applicant_notes") or "No CV/notes available",
+            }
+            for app in applicants
+        ]
+
     async def rank_candidates_for_job(self, job_id: int) -> Dict[str, Any]:
         """Rank all candidates for a job using AI."""
         self._ensure_recruitment_module()
 
-        job = self.get_job_by_id(job_id)
+        job = await asyncio.to_thread(self.get_job_by_id, job_id)
         if not job:
             raise JobNotFoundError(f"Job {job_id} not found")
 
-        # Get all applicants for this job
-        from app.models.applicant import ApplicantFilter
-        result = self.get_applicants(
-            ApplicantFilter(job_id=job_id),
-            page=1,
-            page_size=100,
-        )
-
-        applicants = result.get("items", [])
-        if not applicants:
+        # Get all applicants for this job, CV text included, in one read
+        candidates_data = await asyncio.to_thread(self._get_ranking_candidates, job_id)
+        if not candidates_data:
             return {
                 "job_id": job_id,
                 "job_name": job["name"],
@@ -337,18 +407,6 @@ Summary: {analysis.get('summary', '')}
                 "top_pick_rationale": "",
             }
 
-        # Get detailed info for each applicant (including CV text)
-        candidates_data = []
-        for app in applicants:
-            detail = self.get_applicant_by_id(app["id"])
-            if detail:
-                candidates_data.append({
-                    "id": detail["id"],
-                    "name": detail["name"],
-                    "email": detail.get("email"),
-                    "cv_text": detail.get("cv_text") or detail.get("applicant_notes") or "No CV/notes available",
-                })
-
         # Build job description string
         job_description = f"""
 Position: {job['name']}
@@ -493,12 +551,7 @@ Description: {job.get('description', 'Not specified')}
         return self.client.unlink(ODOO_MODEL_CALENDAR_EVENT, [interview_id])
 
 
-_service: Optional[RecruitmentService] = None
-
-
+@lru_cache(maxsize=1)
 def get_recruitment_service() -> RecruitmentService:
     """Get the singleton recruitment service."""
-    global _service
-    if _service is None:
-        _service = RecruitmentService()
-    return _service
+    return RecruitmentService()